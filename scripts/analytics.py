@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Anomaly Detection & Forecasting
+Builds daily and monthly series per region/segment from the dated domains and
+runs rolling z-score, EWMA and seasonal forecasts over all series at once
+"""
+
+import math
+import os
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from cli import analytics_parser
+from datasets import DATASET_FILES, get_base_path
+from schemas import SCHEMAS
+from writers import iter_file_chunks, output_path
+
+# =============================================================================
+# SERIES DEFINITIONS
+# =============================================================================
+# Each series aggregates 'value' per day and month for every combination of
+# 'by'. Sums treat a day without rows as 0; means leave it missing.
+SERIES = {
+    'sales': [
+        {'name': 'revenue', 'value': 'revenue', 'agg': 'sum', 'by': ['region', 'customer_segment']},
+    ],
+    'finance': [
+        {'name': 'actual_amount', 'value': 'actual_amount', 'agg': 'sum', 'by': ['region', 'cost_center']},
+        {'name': 'forecast_amount', 'value': 'forecast_amount', 'agg': 'sum', 'by': ['region', 'cost_center']},
+    ],
+    'healthcare': [
+        {'name': 'wait_time_minutes', 'value': 'wait_time_minutes', 'agg': 'mean', 'by': ['region', 'department']},
+    ],
+    'supply_chain': [
+        {'name': 'demand_forecast', 'value': 'demand_forecast', 'agg': 'sum', 'by': ['region', 'product']},
+    ],
+}
+
+# window: points in the rolling z-score baseline; alpha: EWMA smoothing;
+# season/cycles: forecast = average of the last `cycles` seasons of `season` points;
+# min_observed: non-zero, non-missing baseline points needed before a point is flagged,
+# so sparse groups (mostly empty days) do not flag every day that has a row
+FREQUENCIES = {
+    'daily': {'period': 'D', 'window': 28, 'alpha': 0.1, 'season': 7, 'cycles': 4, 'horizon': 28,
+              'min_observed': 14},
+    'monthly': {'period': 'M', 'window': 6, 'alpha': 0.3, 'season': 12, 'cycles': 2, 'horizon': 6,
+                'min_observed': 3},
+}
+
+Z_THRESHOLD = 3.0
+
+# =============================================================================
+# SERIES CONSTRUCTION
+# =============================================================================
+def series_columns(key):
+    """Source columns a domain's series need, so only those are read"""
+    needed = {'date'}
+    for series in SERIES[key]:
+        needed.update(series['by'])
+        needed.add(series['value'])
+    return [c for c in SCHEMAS[key] if c in needed]
+
+def build_series(key, chunks):
+    """
+    Stream chunks once into wide series frames
+
+    Returns {(series name, frequency): DataFrame} indexed by period with
+    one column per group (a MultiIndex over the series' 'by' columns).
+    """
+    partials = {series['name']: [] for series in SERIES[key]}
+    for df in chunks:
+        day = df['date'].dt.normalize().rename('date')
+        for series in SERIES[key]:
+            grouped = df.groupby([day] + [df[c] for c in series['by']], observed=True, sort=False)
+            partials[series['name']].append(grouped[series['value']].agg(['sum', 'count']))
+
+    wide = {}
+    for series in SERIES[key]:
+        daily = pd.concat(partials[series['name']])
+        daily = daily.groupby(level=list(range(daily.index.nlevels)), observed=True).sum()
+        for frequency, settings in FREQUENCIES.items():
+            totals = daily
+            if settings['period'] != 'D':
+                periods = daily.index.get_level_values('date').to_period(settings['period']).to_timestamp()
+                totals = daily.groupby([periods] + series['by'], observed=True).sum()
+            values = totals['sum'] if series['agg'] == 'sum' else totals['sum'] / totals['count']
+            frame = values.unstack(series['by'])
+            full_range = pd.date_range(frame.index.min(), frame.index.max(),
+                                       freq='D' if settings['period'] == 'D' else 'MS')
+            frame = frame.reindex(full_range)
+            if series['agg'] == 'sum':
+                frame = frame.fillna(0)
+            wide[(series['name'], frequency)] = frame
+    return wide
+
+# =============================================================================
+# BATCHED DETECTION AND FORECASTING
+# =============================================================================
+# Every function takes a (time, series) float array and works on all series
+# together; missing points are NaN and are skipped.
+def rolling_zscore(values, window, min_periods=None):
+    """Mean of the previous `window` points and each point's z-score against them"""
+    min_periods = min_periods or max(3, window // 2)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        # Centering keeps the running sums of squares well conditioned
+        center = np.nan_to_num(np.nanmean(values, axis=0))
+        x = values - center
+        valid = ~np.isnan(x)
+        filled = np.where(valid, x, 0.0)
+        zeros = np.zeros((1, x.shape[1]))
+        sums = np.concatenate([zeros, np.cumsum(filled, axis=0)])
+        squares = np.concatenate([zeros, np.cumsum(filled ** 2, axis=0)])
+        counts = np.concatenate([zeros, np.cumsum(valid, axis=0)])
+
+        end = np.arange(len(x))
+        start = np.maximum(end - window, 0)
+        n = counts[end] - counts[start]
+        mean = (sums[end] - sums[start]) / n
+        var = (squares[end] - squares[start] - n * mean ** 2) / (n - 1)
+        std = np.sqrt(np.maximum(var, 0))
+        z = np.where((n >= min_periods) & (std > 0), (x - mean) / std, np.nan)
+    return mean + center, z
+
+def baseline_counts(mask, window):
+    """How many of the previous `window` points are True in a (time, series) mask"""
+    counts = np.concatenate([np.zeros((1, mask.shape[1]), dtype=np.int64), np.cumsum(mask, axis=0)])
+    end = np.arange(len(mask))
+    return counts[end] - counts[np.maximum(end - window, 0)]
+
+def t_tail(t, df):
+    """
+    Two-sided tail P(|T| > |t|) of Student's t with integer df, elementwise
+
+    Uses the finite series for integer df (Abramowitz & Stegun 26.7.3-4),
+    so no SciPy is needed; NaN t gives NaN.
+    """
+    t, df = np.broadcast_arrays(np.abs(np.asarray(t, dtype=np.float64)), np.asarray(df, dtype=np.int64))
+    theta = np.arctan(t / np.sqrt(df))
+    cos2 = np.cos(theta) ** 2
+    odd = df % 2 == 1
+    # 1 + 1/2 cos^2 + 1*3/(2*4) cos^4 ... (even df) or 1 + 2/3 cos^2 + 2*4/(3*5) cos^4 ... (odd df),
+    # with (df - 2) // 2 terms after the first
+    last = (df - 2) // 2
+    term = np.ones_like(t)
+    series = np.where(last >= 0, 1.0, 0.0)
+    for j in range(1, int(last.max(initial=0)) + 1):
+        term = term * np.where(odd, 2 * j / (2 * j + 1), (2 * j - 1) / (2 * j)) * cos2
+        series += np.where(j <= last, term, 0.0)
+    inside = np.where(odd, 2 / np.pi * (theta + np.sin(theta) * np.sqrt(cos2) * series), np.sin(theta) * series)
+    return 1 - inside
+
+def ewma_zscore(values, alpha, warmup=None):
+    """EWMA level after each point and each point's z-score against the EW level/variance before it"""
+    # The EW variance starts at 0; after 4 / alpha points it is within ~2% of its steady state
+    warmup = warmup or int(round(4 / alpha))
+    n_series = values.shape[1]
+    mean = np.full(n_series, np.nan)
+    var = np.zeros(n_series)
+    seen = np.zeros(n_series, dtype=np.int64)
+    level = np.empty_like(values)
+    z = np.full_like(values, np.nan)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for t, x in enumerate(values):
+            std = np.sqrt(var)
+            z[t] = np.where((seen >= warmup) & (std > 0), (x - mean) / std, np.nan)
+            present = ~np.isnan(x)
+            delta = np.where(np.isnan(mean), 0.0, x - mean)
+            mean = np.where(present, np.where(np.isnan(mean), x, mean + alpha * delta), mean)
+            var = np.where(present, (1 - alpha) * (var + alpha * delta ** 2), var)
+            seen += present
+            level[t] = mean
+    return level, z
+
+def seasonal_forecast(values, season, cycles, horizon):
+    """Next `horizon` points: the average of the last `cycles` seasons at the same phase"""
+    cycles = max(1, min(cycles, len(values) // season))
+    recent = values[len(values) - season * cycles:]
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        profile = np.nanmean(recent.reshape(cycles, season, values.shape[1]), axis=0)
+    return profile[np.arange(horizon) % season]
+
+def analyze(frame, settings, threshold=Z_THRESHOLD):
+    """Run detection and forecasting on one wide frame, returning a long frame for Tableau"""
+    values = frame.to_numpy(dtype=np.float64)
+    rolling_mean, rolling_z = rolling_zscore(values, settings['window'])
+    ewma, ewma_z = ewma_zscore(values, settings['alpha'])
+    forecast = seasonal_forecast(values, settings['season'], settings['cycles'], settings['horizon'])
+    window, alpha = settings['window'], settings['alpha']
+    supported = baseline_counts(np.nan_to_num(values) != 0, window) >= settings['min_observed']
+    # Flag points as rare as |z| > threshold is for Gaussian noise. A new point against n
+    # baseline points is t-distributed with n - 1 df after scaling by sqrt(1 + 1/n); the EW
+    # variance underestimates the one-step error variance by (1 - alpha) and has about
+    # (2 - alpha) / alpha effective df.
+    tail = math.erfc(threshold / math.sqrt(2))
+    n = baseline_counts(~np.isnan(values), window)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rolling_tail = t_tail(rolling_z / np.sqrt(1 + 1 / n), n - 1)
+        ewma_tail = t_tail(ewma_z * np.sqrt(1 - alpha), round((2 - alpha) / alpha))
+    flagged = supported & ((rolling_tail < tail) | (ewma_tail < tail))
+    offset = pd.DateOffset(days=1) if settings['period'] == 'D' else pd.DateOffset(months=1)
+    future = pd.date_range(frame.index[-1] + offset, periods=settings['horizon'],
+                           freq='D' if settings['period'] == 'D' else 'MS')
+
+    n_history, n_series = values.shape
+    groups = frame.columns.to_frame(index=False)
+    blank = np.full((settings['horizon'], n_series), np.nan)
+    columns = {
+        'value': np.vstack([values, blank]),
+        'rolling_mean': np.vstack([rolling_mean, blank]),
+        'rolling_zscore': np.vstack([rolling_z, blank]),
+        'ewma': np.vstack([ewma, blank]),
+        'ewma_zscore': np.vstack([ewma_z, blank]),
+        'forecast': np.vstack([np.full_like(values, np.nan), forecast]),
+    }
+    flagged = np.vstack([flagged, np.zeros((settings['horizon'], n_series), dtype=bool)]).ravel()
+    periods = frame.index.append(future)
+    long = pd.DataFrame({'date': np.repeat(periods, n_series)})
+    for column in groups.columns:
+        long[column] = np.tile(groups[column].to_numpy(), len(periods))
+    for column, array in columns.items():
+        long[column] = array.ravel()
+    long['is_anomaly'] = flagged.astype(int)
+    long['is_forecast'] = np.repeat(np.arange(len(periods)) >= n_history, n_series).astype(int)
+    long = long.loc[long['value'].notna() | long['forecast'].notna()]
+    return long.round({column: 4 for column in columns})
+
+# =============================================================================
+# OUTPUT
+# =============================================================================
+def analytics_dir(full_path):
+    """Analytics outputs live in an analytics/ folder next to the raw dataset"""
+    return os.path.join(os.path.dirname(full_path), 'analytics')
+
+def write_analytics(key, full_path, input_format='csv', chunk_size=1_000_000, threshold=Z_THRESHOLD):
+    """Stream one domain's dataset once and write every series/frequency as CSV"""
+    source = output_path(full_path, input_format)
+    chunks = iter_file_chunks(source, SCHEMAS[key], chunk_size, columns=series_columns(key))
+    wide = build_series(key, chunks)
+
+    out_dir = analytics_dir(full_path)
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    for (name, frequency), frame in wide.items():
+        result = analyze(frame, FREQUENCIES[frequency], threshold)
+        path = os.path.join(out_dir, f'{name}_{frequency}.csv')
+        result.to_csv(path, index=False)
+        written.append((path, frame.shape[1], int(result['is_anomaly'].sum())))
+    return written
+
+# =============================================================================
+# MAIN EXECUTION
+# =============================================================================
+def main(argv=None):
+    parser = analytics_parser()
+    args = parser.parse_args(argv)
+    without_series = [key for key in args.domains or [] if key not in SERIES]
+    if without_series:
+        parser.error(f"no series defined for {', '.join(without_series)} (see SERIES)")
+
+    base_path = get_base_path()
+
+    print("=" * 60)
+    print("Enterprise Intelligence Platform - Analytics")
+    print("=" * 60)
+
+    for key, name, filepath in DATASET_FILES:
+        if key not in SERIES or (args.domains and key not in args.domains):
+            continue
+        print(f"\n{name}:")
+        full_path = os.path.join(base_path, filepath)
+        for path, n_series, n_anomalies in write_analytics(key, full_path, args.input_format,
+                                                           args.chunk_size, args.threshold):
+            print(f"  Saved: {os.path.relpath(path, base_path)} ({n_series} series, {n_anomalies} anomalies)")
+
+    print("\n" + "=" * 60)
+    print("Analytics complete!")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
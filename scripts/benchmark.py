@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Generation Benchmark
+Measures how every generator scales: wall time, rows/sec, peak RSS and time
+per phase (column sampling, derived columns, serialization)
+"""
+
+from datetime import datetime
+import cProfile
+import io
+import json
+import os
+import platform
+import pstats
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from cli import bench_parser
+import generate_data
+from generate_data import DATASETS, DEFAULT_CHUNK_SIZE, SEED, chunk_bounds, generate_chunk
+from schemas import SCHEMAS
+from writers import open_writer, output_path
+
+PHASES = ('sampling', 'derived', 'serialization')
+
+# =============================================================================
+# PHASE TIMING
+# =============================================================================
+class PhaseTimer:
+    """
+    Accumulates seconds per phase across chunks
+
+    Installed as generate_data.PHASE_HOOK: the 'sampled' mark splits one
+    generator call into sampling (before) and derived columns (after).
+    """
+
+    def __init__(self, trace_memory=False):
+        self.seconds = dict.fromkeys(PHASES, 0.0)
+        self.traced_peak = dict.fromkeys(PHASES, 0)
+        self.trace_memory = trace_memory
+        self._start = None
+
+    def _begin(self):
+        self._start = time.perf_counter()
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+
+    def _end(self, phase):
+        self.seconds[phase] += time.perf_counter() - self._start
+        if self.trace_memory:
+            self.traced_peak[phase] = max(self.traced_peak[phase], tracemalloc.get_traced_memory()[1])
+        self._begin()
+
+    def generate(self, key, start_id, rows, seed):
+        """Run one generator call, splitting its time at the 'sampled' mark"""
+        generate_data.PHASE_HOOK = lambda name: self._end('sampling')
+        try:
+            self._begin()
+            df = generate_chunk(key, start_id, rows, seed)
+            self._end('derived')
+        finally:
+            generate_data.PHASE_HOOK = None
+        return df
+
+    def write(self, writer, df):
+        self._begin()
+        writer.write(df)
+        self._end('serialization')
+
+# =============================================================================
+# SINGLE RUN (executed in its own process)
+# =============================================================================
+def run_single(key, n_records, fmt='csv', chunk_size=DEFAULT_CHUNK_SIZE, seed=SEED,
+               profile_dir=None, trace_memory=False):
+    """Generate and serialize one domain at one size, returning a result dict"""
+    if trace_memory:
+        tracemalloc.start()
+    profiler = cProfile.Profile() if profile_dir else None
+    timer = PhaseTimer(trace_memory)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = output_path(os.path.join(tmp_dir, key), fmt)
+        start = time.perf_counter()
+        if profiler:
+            profiler.enable()
+        with open_writer(fmt, path, SCHEMAS[key]) as writer:
+            for start_id, rows in chunk_bounds(n_records, chunk_size):
+                timer.write(writer, timer.generate(key, start_id, rows, seed))
+        if profiler:
+            profiler.disable()
+        wall = time.perf_counter() - start
+        size_bytes = os.path.getsize(path)
+
+    result = {
+        'domain': key,
+        'rows': n_records,
+        'format': fmt,
+        'chunk_size': chunk_size,
+        'wall_seconds': round(wall, 4),
+        'rows_per_second': round(n_records / wall) if wall else None,
+        # ru_maxrss is KB on Linux, bytes on macOS
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+                             / (2 ** 20 if sys.platform == 'darwin' else 2 ** 10), 1),
+        'phase_seconds': {phase: round(s, 4) for phase, s in timer.seconds.items()},
+        'output_mb': round(size_bytes / 1e6, 2),
+    }
+    if trace_memory:
+        result['traced_peak_mb'] = {phase: round(b / 1e6, 1) for phase, b in timer.traced_peak.items()}
+        tracemalloc.stop()
+    if profiler:
+        os.makedirs(profile_dir, exist_ok=True)
+        prof_path = os.path.join(profile_dir, f'{key}_{n_records}.prof')
+        profiler.dump_stats(prof_path)
+        result['profile'] = prof_path
+        result['hot_spots'] = hot_spots(profiler)
+    return result
+
+def hot_spots(profiler, limit=10):
+    """Top functions by cumulative time, as 'file:line(function)' -> seconds"""
+    stats = pstats.Stats(profiler, stream=io.StringIO()).sort_stats('cumulative')
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+    return {f'{os.path.basename(f)}:{line}({func})': round(cumulative, 4)
+            for (f, line, func), (_, _, _, cumulative, _) in rows[:limit]}
+
+def run_isolated(key, n_records, args):
+    """Run one benchmark in a fresh interpreter so peak RSS belongs to that run alone"""
+    command = [sys.executable, os.path.abspath(__file__), '--single', key, str(n_records),
+               '--format', args.format, '--chunk-size', str(args.chunk_size), '--seed', str(args.seed)]
+    if args.profile:
+        command += ['--profile', args.profile]
+    if args.tracemalloc:
+        command.append('--tracemalloc')
+    output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.splitlines()[-1])
+
+# =============================================================================
+# REPORTING
+# =============================================================================
+def environment_info():
+    """Commit and library versions recorded with every result file"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'commit': commit,
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+def print_results(results, baseline=None):
+    """Table of results, with rows/sec change against a baseline run when given"""
+    previous = {(r['domain'], r['rows'], r['format']): r for r in (baseline or {}).get('results', [])}
+    print(f"{'domain':<15}{'rows':>12}{'wall s':>9}{'rows/s':>12}{'RSS MB':>9}"
+          f"{'sample s':>10}{'derive s':>10}{'write s':>10}" + (f"{'vs base':>9}" if baseline else ''))
+    for r in results:
+        phases = r['phase_seconds']
+        line = (f"{r['domain']:<15}{r['rows']:>12,}{r['wall_seconds']:>9.2f}{r['rows_per_second']:>12,}"
+                f"{r['peak_rss_mb']:>9.0f}{phases['sampling']:>10.2f}{phases['derived']:>10.2f}"
+                f"{phases['serialization']:>10.2f}")
+        base = previous.get((r['domain'], r['rows'], r['format']))
+        if base and base.get('rows_per_second'):
+            line += f"{(r['rows_per_second'] / base['rows_per_second'] - 1) * 100:>+8.1f}%"
+        print(line)
+        for location, seconds in r.get('hot_spots', {}).items():
+            print(f"{'':<15}{seconds:>9.2f}s  {location}")
+
+# =============================================================================
+# MAIN EXECUTION
+# =============================================================================
+def main(argv=None):
+    parser = bench_parser()
+    args = parser.parse_args(argv)
+
+    if args.single:
+        key, n_records = args.single[0], int(args.single[1])
+        print(json.dumps(run_single(key, n_records, args.format, args.chunk_size, args.seed,
+                                    args.profile, args.tracemalloc)))
+        return
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    print("=" * 60)
+    print("Enterprise Intelligence Platform - Generation Benchmark")
+    print("=" * 60)
+
+    results = []
+    for key, name, *_ in DATASETS:
+        if args.domains and key not in args.domains:
+            continue
+        for n_records in args.sizes:
+            print(f"  {name}: {n_records:,} rows...", flush=True)
+            results.append(run_isolated(key, n_records, args))
+
+    print()
+    print_results(results, baseline)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'environment': environment_info(), 'results': results}, f, indent=2)
+        print(f"\nSaved: {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Output Format Benchmark
+Compares write time, file size and read-back time of CSV, Parquet and Feather,
+and the time to merge a worker's part file as generate_data.py --workers does
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from generate_data import DATASETS, GENERATORS, SEED, chunk_rng
+from schemas import SCHEMAS
+from writers import open_writer, output_path
+
+# (label, format, writer options)
+VARIANTS = [
+    ('csv', 'csv', {}),
+    ('parquet-snappy', 'parquet', {'compression': 'snappy'}),
+    ('parquet-zstd', 'parquet', {'compression': 'zstd'}),
+    ('feather-lz4', 'feather', {'compression': 'lz4'}),
+    ('feather-zstd', 'feather', {'compression': 'zstd'}),
+]
+
+READERS = {
+    'csv': pd.read_csv,
+    'parquet': pd.read_parquet,
+    'feather': pd.read_feather,
+}
+
+def benchmark_domain(key, n_records, tmp_dir, seed=SEED):
+    """Write one generated domain in every variant, returning a list of result dicts"""
+    df = GENERATORS[key](n_records, rng=chunk_rng(seed, key, 1))
+
+    results = []
+    for label, fmt, options in VARIANTS:
+        path = output_path(os.path.join(tmp_dir, f'{key}_{label}'), fmt)
+
+        start = time.perf_counter()
+        with open_writer(fmt, path, SCHEMAS[key], **options) as writer:
+            writer.write(df)
+        write_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        READERS[fmt](path)
+        read_seconds = time.perf_counter() - start
+
+        # --workers appends every part in the parent process, so this cost is serial
+        merged_path = output_path(os.path.join(tmp_dir, f'{key}_{label}_merged'), fmt)
+        start = time.perf_counter()
+        with open_writer(fmt, merged_path, SCHEMAS[key], **options) as writer:
+            writer.append_part(path)
+        merge_seconds = time.perf_counter() - start
+        os.remove(merged_path)
+
+        results.append({
+            'domain': key,
+            'variant': label,
+            'rows': n_records,
+            'write_seconds': round(write_seconds, 4),
+            'read_seconds': round(read_seconds, 4),
+            'merge_seconds': round(merge_seconds, 4),
+            'size_bytes': os.path.getsize(path),
+        })
+        os.remove(path)
+    return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark CSV vs Parquet vs Feather output')
+    parser.add_argument('--records', type=int, default=200_000, help='Rows per domain (default: 200,000)')
+    parser.add_argument('--domains', nargs='+', choices=[key for key, *_ in DATASETS],
+                        help='Domains to benchmark (default: all)')
+    parser.add_argument('--json', help='Also write results to this JSON file')
+    args = parser.parse_args(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for key, *_ in DATASETS:
+            if args.domains and key not in args.domains:
+                continue
+            results.extend(benchmark_domain(key, args.records, tmp_dir))
+
+    print(f"{'domain':<15}{'variant':<16}{'write s':>9}{'read s':>9}{'merge s':>9}{'size MB':>10}")
+    for r in results:
+        print(f"{r['domain']:<15}{r['variant']:<16}{r['write_seconds']:>9.3f}{r['read_seconds']:>9.3f}"
+              f"{r['merge_seconds']:>9.3f}{r['size_bytes'] / 1e6:>10.2f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nSaved: {args.json}")
+
+if __name__ == "__main__":
+    main()
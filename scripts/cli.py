@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Command-Line Arguments
+Argument parsers of every pipeline command, kept free of pandas/numpy so
+--help and argument errors never wait for them; each script's main() and
+eip.py build their parser from here
+"""
+
+import argparse
+
+from datasets import DEFAULT_CHUNK_SIZE, DOMAINS, REPORT_FILE, SEED
+from manifest import parse_date
+
+FORMATS = ['csv', 'parquet', 'feather']
+
+def generate_parser():
+    parser = argparse.ArgumentParser(description='Generate synthetic datasets for all dashboard domains')
+    parser.add_argument('--seed', type=int, default=SEED, help=f'Random seed (default: {SEED})')
+    parser.add_argument('--domains', nargs='+', choices=DOMAINS, help='Domains to generate (default: all)')
+    parser.add_argument('--records', type=int, help="Rows per domain (default: each generator's default)")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Rows generated and written per chunk (default: {DEFAULT_CHUNK_SIZE:,})')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Worker processes; chunks of all domains run concurrently (default: 1)')
+    parser.add_argument('--formats', nargs='+', choices=FORMATS, default=['csv'],
+                        help='Output formats written side by side (default: csv)')
+    parser.add_argument('--compression', help='Parquet/Feather codec (default: zstd for parquet, lz4 for feather)')
+    parser.add_argument('--row-group-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Parquet rows per row group (default: {DEFAULT_CHUNK_SIZE:,})')
+    parser.add_argument('--compact', action='store_true',
+                        help='Generate categoricals as int codes and downcast numerics to cut memory per chunk')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Append new rows after the last date/ID of each existing CSV instead of regenerating')
+    parser.add_argument('--start-date', type=parse_date,
+                        help='First date to generate, YYYY-MM-DD (incremental default: day after the last covered date)')
+    parser.add_argument('--end-date', type=parse_date,
+                        help='Last date to generate, YYYY-MM-DD (incremental default: same as --start-date)')
+    parser.add_argument('--rollups', action='store_true',
+                        help='Build the dashboard rollup tables (see rollups.py) once generation finishes')
+    parser.add_argument('--star-schema', action='store_true',
+                        help='Write shared dimension tables to data/dimensions/ and <domain>_fact files that '
+                             'reference them by integer keys, instead of the wide datasets')
+    parser.add_argument('--scenario',
+                        help='Scenario file (JSON, or YAML with PyYAML) scaling volumes and replacing column '
+                             'distributions; see scripts/scenario.example.json')
+    return parser
+
+def validate_parser():
+    parser = argparse.ArgumentParser(description='Profile generated datasets and check their invariants')
+    parser.add_argument('--domains', nargs='+', choices=DOMAINS, help='Domains to validate (default: all)')
+    parser.add_argument('--format', choices=FORMATS, default='csv',
+                        help='Which output file of each domain to read (default: csv)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Rows read per chunk (default: {DEFAULT_CHUNK_SIZE:,})')
+    parser.add_argument('--report', help=f'Where to write the JSON report (default: data/{REPORT_FILE})')
+    parser.add_argument('--strict', action='store_true', help='Treat warnings as failures')
+    return parser
+
+def rollups_parser():
+    parser = argparse.ArgumentParser(description='Build dashboard rollup tables from generated datasets')
+    parser.add_argument('--domains', nargs='+', choices=DOMAINS, help='Domains to roll up (default: all)')
+    parser.add_argument('--input-format', choices=FORMATS, default='csv',
+                        help='Which generated file to read (default: csv)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Rows read per chunk (default: {DEFAULT_CHUNK_SIZE:,})')
+    return parser
+
+def analytics_parser():
+    parser = argparse.ArgumentParser(description='Anomaly detection and seasonal forecasts over generated series')
+    parser.add_argument('--domains', nargs='+', choices=DOMAINS,
+                        help='Domains to analyze (default: all with series in analytics.py)')
+    parser.add_argument('--input-format', choices=FORMATS, default='csv',
+                        help='Which generated file to read (default: csv)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Rows read per chunk (default: {DEFAULT_CHUNK_SIZE:,})')
+    parser.add_argument('--threshold', type=float, default=3.0,
+                        help='Absolute z-score that flags an anomaly (default: 3.0)')
+    return parser
+
+def score_parser():
+    parser = argparse.ArgumentParser(description='Score transactions for fraud risk')
+    parser.add_argument('--input', default='-', help="CSV file to score, or '-' for stdin (default)")
+    parser.add_argument('--output', default='-', help="Where to write scored CSV (default: stdout)")
+    parser.add_argument('--config', help='JSON file overriding weights/thresholds (see DEFAULT_CONFIG)')
+    parser.add_argument('--batch-size', type=int, default=50_000, help='Rows per micro-batch (default: 50,000)')
+    parser.add_argument('--follow', action='store_true', help='Keep tailing --input for new rows')
+    parser.add_argument('--velocity', action='store_true',
+                        help='Recompute velocity_24h/time_since_last_txn_minutes per customer from --time-column')
+    parser.add_argument('--time-column', default='timestamp', help='Event time column for --velocity')
+    parser.add_argument('--bench', nargs='+', type=lambda s: int(float(s)), metavar='ROWS',
+                        help='Measure scoring throughput at these sizes instead of scoring input')
+    parser.add_argument('--json', help='With --bench, also write results to this JSON file')
+    return parser
+
+def refresh_parser():
+    parser = argparse.ArgumentParser(description='Publish/refresh changed datasets as Tableau data sources')
+    parser.add_argument('--server', required=True, help='Tableau Server URL')
+    parser.add_argument('--token-name', required=True, help='Personal Access Token name')
+    parser.add_argument('--token-value', required=True, help='Personal Access Token value')
+    parser.add_argument('--site', default='', help='Site ID (default: empty for default site)')
+    parser.add_argument('--project', default='Enterprise Intelligence', help='Target project name')
+    parser.add_argument('--domains', nargs='+', choices=DOMAINS, help='Domains to sync (default: all)')
+    parser.add_argument('--action', choices=['publish', 'refresh'], default='publish',
+                        help='publish: upload changed files; refresh: run extract refreshes on '
+                             'existing data sources of the same name (default: publish)')
+    parser.add_argument('--refresh-workbooks', nargs='+', default=[],
+                        help='Workbooks whose extracts are refreshed when any dataset changed')
+    parser.add_argument('--force', action='store_true', help='Sync every dataset, changed or not')
+    parser.add_argument('--dry-run', action='store_true', help='Only report which datasets changed')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent uploads / job polls (default: 4)')
+    parser.add_argument('--retries', type=int, default=3, help='Retries on transient errors (default: 3)')
+    parser.add_argument('--backoff', type=float, default=1.0, help='Initial retry delay in seconds')
+    parser.add_argument('--poll-interval', type=float, default=5.0, help='Seconds between job polls (default: 5)')
+    parser.add_argument('--upload-chunk-mb', type=int, default=None,
+                        help='Chunk size for uploads over 64MB (default: TSC default of 50)')
+    parser.add_argument('--require-valid', metavar='REPORT',
+                        help='Skip (and fail on) datasets this validate_data.py report does not pass')
+    return parser
+
+def bench_parser():
+    parser = argparse.ArgumentParser(description='Benchmark data generation across sizes')
+    parser.add_argument('--sizes', nargs='+', type=lambda s: int(float(s)), default=[10_000, 100_000, 1_000_000],
+                        help='Row counts to run, e.g. 1e4 1e5 1e6 1e7 1e8 (default: 1e4 1e5 1e6)')
+    parser.add_argument('--domains', nargs='+', choices=DOMAINS, help='Domains to benchmark (default: all)')
+    parser.add_argument('--format', choices=FORMATS, default='csv', help='Serialization format timed (default: csv)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Rows per chunk, as in generate_data.py (default: {DEFAULT_CHUNK_SIZE:,})')
+    parser.add_argument('--seed', type=int, default=SEED, help=f'Random seed (default: {SEED})')
+    parser.add_argument('--json', help='Write results and environment info to this JSON file')
+    parser.add_argument('--compare', help='Earlier --json output to compare rows/sec against')
+    parser.add_argument('--profile', metavar='DIR', help='cProfile each run; .prof files go to DIR')
+    parser.add_argument('--tracemalloc', action='store_true',
+                        help='Record peak traced Python allocations per phase (slow)')
+    parser.add_argument('--single', nargs=2, metavar=('DOMAIN', 'ROWS'), help=argparse.SUPPRESS)
+    return parser
+
+# eip.py command -> parser; publish_to_tableau.py has no heavy imports and keeps its own
+PARSERS = {
+    'generate': generate_parser,
+    'validate': validate_parser,
+    'rollups': rollups_parser,
+    'analytics': analytics_parser,
+    'score': score_parser,
+    'refresh': refresh_parser,
+    'bench': bench_parser,
+}
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Dataset Registry
+Domains, their data files and run defaults, importable without pandas/numpy
+so every command can parse its arguments before loading them
+"""
+
+import json
+import os
+
+# Default seed for reproducibility
+SEED = 42
+
+# Rows generated, written and read per chunk
+DEFAULT_CHUNK_SIZE = 1_000_000
+
+# Validation report written by validate_data.py, inside the data folder
+REPORT_FILE = 'validation_report.json'
+
+# (key, display name, output path relative to data/)
+DATASET_FILES = [
+    ('sales', 'Sales', 'sales/sales_data.csv'),
+    ('hr', 'HR', 'hr/hr_data.csv'),
+    ('finance', 'Finance', 'finance/finance_data.csv'),
+    ('healthcare', 'Operations', 'healthcare/operations_data.csv'),
+    ('supply_chain', 'Supply Chain', 'supply_chain/supply_chain_data.csv'),
+    ('fraud', 'Fraud', 'fraud/fraud_data.csv'),
+    ('public_impact', 'Public Impact', 'public_impact/public_impact_data.csv'),
+]
+
+DOMAINS = [key for key, _, _ in DATASET_FILES]
+
+def get_base_path():
+    """Get the base path for data files"""
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(script_dir, '..', 'data')
+
+def write_json_atomic(path, data, sort_keys=False):
+    """Write data as indented JSON via a temporary file, so readers never see it half-written"""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=sort_keys)
+        f.write('\n')
+    os.replace(tmp_path, path)
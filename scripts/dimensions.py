@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Shared Dimensions
+Star-schema mode: dimension tables generated once, and fact tables that
+reference them by compact integer surrogate keys
+"""
+
+import os
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from schemas import (
+    COUNTRIES, CUSTOMER_SEGMENTS, DEPARTMENTS, OPERATIONS_DEPARTMENTS, QUARTERS, REGIONS,
+    SALES_PRODUCTS, SCHEMAS, SUPPLIERS, SUPPLY_PRODUCTS,
+)
+from writers import open_writer, output_path
+
+DIMENSIONS_DIR = 'dimensions'
+
+# Sales draws CUST-0001..1000 and fraud CUST-0001..2000; both share one customer dimension
+CUSTOMER_COUNT = 2000
+
+# =============================================================================
+# DIMENSION MEMBERS
+# =============================================================================
+# Surrogate keys are 1-based positions in these lists, so they never depend
+# on which facts were generated. Facts without a country use the region-only
+# geography members that follow the (region, country) pairs.
+GEOGRAPHIES = ([(region, country) for region in REGIONS for country in COUNTRIES] +
+               [(region, None) for region in REGIONS])
+DEPARTMENT_MEMBERS = [(d, 'Corporate') for d in DEPARTMENTS] + [(d, 'Operations') for d in OPERATIONS_DEPARTMENTS]
+PRODUCT_MEMBERS = [(p, 'Sales') for p in SALES_PRODUCTS] + [(p, 'Supply Chain') for p in SUPPLY_PRODUCTS]
+
+DIMENSION_SCHEMAS = {
+    'date': {
+        'date_key': 'int32', 'date': 'date', 'year': 'int16', 'quarter': ('category', QUARTERS),
+        'month': 'int8', 'month_name': 'string', 'day_of_week': 'string', 'is_weekend': 'int8',
+    },
+    'geography': {'geography_key': 'int8', 'region': ('category', REGIONS), 'country': 'string'},
+    'customer': {
+        'customer_key': 'int16', 'customer_id': 'string', 'home_region': ('category', REGIONS),
+        'home_country': ('category', COUNTRIES), 'primary_segment': ('category', CUSTOMER_SEGMENTS),
+    },
+    'department': {'department_key': 'int8', 'department': 'string', 'department_group': 'string'},
+    'product': {'product_key': 'int8', 'product': 'string', 'product_line': 'string'},
+    'supplier': {'supplier_key': 'int8', 'supplier': 'string'},
+}
+
+# Per fact: (key column, dimension, source columns it replaces)
+FACT_KEYS = {
+    'sales': [('date_key', 'date', ['date']), ('geography_key', 'geography', ['region', 'country']),
+              ('customer_key', 'customer', ['customer_id']), ('product_key', 'product', ['product'])],
+    'hr': [('department_key', 'department', ['department']), ('geography_key', 'geography', ['region']),
+           ('hire_date_key', 'date', ['hire_date'])],
+    'finance': [('date_key', 'date', ['date']), ('geography_key', 'geography', ['region']),
+                ('department_key', 'department', ['department'])],
+    'healthcare': [('date_key', 'date', ['date']), ('geography_key', 'geography', ['region']),
+                   ('department_key', 'department', ['department'])],
+    'supply_chain': [('date_key', 'date', ['date']), ('geography_key', 'geography', ['region']),
+                     ('product_key', 'product', ['product']), ('supplier_key', 'supplier', ['supplier'])],
+    'fraud': [('date_key', 'date', ['date']), ('geography_key', 'geography', ['region', 'country']),
+              ('customer_key', 'customer', ['customer_id'])],
+    'public_impact': [('date_key', 'date', ['date']), ('geography_key', 'geography', ['region', 'country'])],
+}
+
+# =============================================================================
+# DIMENSION TABLES
+# =============================================================================
+def date_dimension(start, end):
+    """One row per calendar day from start to end, keyed YYYYMMDD"""
+    dates = pd.date_range(start, end, freq='D')
+    return pd.DataFrame({
+        'date_key': (dates.year * 10000 + dates.month * 100 + dates.day).astype('int32'),
+        'date': dates,
+        'year': dates.year.astype('int16'),
+        'quarter': np.array(QUARTERS)[(dates.month - 1) // 3],
+        'month': dates.month.astype('int8'),
+        'month_name': dates.strftime('%B'),
+        'day_of_week': dates.strftime('%A'),
+        'is_weekend': (dates.dayofweek >= 5).astype('int8'),
+    })
+
+def customer_dimension(seed):
+    """Every customer ID the generators can draw, with stable home location and segment"""
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(zlib.crc32(b'customer'),)))
+    keys = np.arange(1, CUSTOMER_COUNT + 1)
+    return pd.DataFrame({
+        'customer_key': keys.astype('int16'),
+        'customer_id': [f'CUST-{k:04d}' for k in keys],
+        'home_region': rng.choice(REGIONS, CUSTOMER_COUNT),
+        'home_country': rng.choice(COUNTRIES, CUSTOMER_COUNT),
+        'primary_segment': rng.choice(CUSTOMER_SEGMENTS, CUSTOMER_COUNT, p=[0.15, 0.35, 0.25, 0.2, 0.05]),
+    })
+
+def build_dimensions(date_range, seed):
+    """All dimension tables as {name: DataFrame}"""
+    def keyed(name, rows, columns):
+        frame = pd.DataFrame(rows, columns=columns)
+        frame.insert(0, f'{name}_key', np.arange(1, len(frame) + 1))
+        return frame
+
+    return {
+        'date': date_dimension(*date_range),
+        'geography': keyed('geography', GEOGRAPHIES, ['region', 'country']),
+        'customer': customer_dimension(seed),
+        'department': keyed('department', DEPARTMENT_MEMBERS, ['department', 'department_group']),
+        'product': keyed('product', PRODUCT_MEMBERS, ['product', 'product_line']),
+        'supplier': keyed('supplier', [(s,) for s in SUPPLIERS], ['supplier']),
+    }
+
+def dimension_path(base_path, name):
+    """data/dimensions/dim_<name>.csv (other formats swap the extension)"""
+    return os.path.join(base_path, DIMENSIONS_DIR, f'dim_{name}.csv')
+
+def write_dimensions(base_path, outputs, date_range, seed):
+    """Write every dimension table in each (format, options) output; returns [(path, rows)]"""
+    os.makedirs(os.path.join(base_path, DIMENSIONS_DIR), exist_ok=True)
+    written = []
+    for name, frame in build_dimensions(date_range, seed).items():
+        for fmt, options in outputs:
+            path = output_path(dimension_path(base_path, name), fmt)
+            with open_writer(fmt, path, DIMENSION_SCHEMAS[name], **options) as writer:
+                writer.write(frame)
+            written.append((path, len(frame)))
+    return written
+
+# =============================================================================
+# FACT TABLES
+# =============================================================================
+def _positions(values, members):
+    """1-based position of every value in members"""
+    return pd.Categorical(values, categories=members).codes.astype(np.int64) + 1
+
+def surrogate_keys(dimension, columns):
+    """Vectorized surrogate keys for the source columns of one fact chunk"""
+    if dimension == 'date':
+        dates = columns[0].dt
+        return dates.year * 10000 + dates.month * 100 + dates.day
+    if dimension == 'customer':
+        return columns[0].str.slice(len('CUST-')).astype(np.int64)
+    if dimension == 'geography':
+        region = _positions(columns[0], REGIONS) - 1
+        if len(columns) == 1:
+            return len(REGIONS) * len(COUNTRIES) + region + 1
+        return region * len(COUNTRIES) + _positions(columns[1], COUNTRIES)
+    members = {'department': DEPARTMENT_MEMBERS, 'product': PRODUCT_MEMBERS}.get(dimension)
+    return _positions(columns[0], [m[0] for m in members] if members else SUPPLIERS)
+
+def to_star(key, df):
+    """Replace a raw chunk's dimension columns with surrogate keys, in place of the first one"""
+    replaced = {}
+    for key_column, dimension, sources in FACT_KEYS[key]:
+        replaced[sources[0]] = (key_column, dimension, sources)
+        replaced.update({source: None for source in sources[1:]})
+
+    columns = {}
+    for column in df.columns:
+        if column not in replaced:
+            columns[column] = df[column]
+        elif replaced[column] is not None:
+            key_column, dimension, sources = replaced[column]
+            columns[key_column] = surrogate_keys(dimension, [df[s] for s in sources])
+    return pd.DataFrame(columns, index=df.index)
+
+def star_schema(key):
+    """Column schema of a domain's fact table"""
+    key_types = {}
+    for key_column, dimension, _ in FACT_KEYS[key]:
+        key_types[key_column] = DIMENSION_SCHEMAS[dimension][f'{dimension}_key']
+    schema = {}
+    for column, column_type in SCHEMAS[key].items():
+        for key_column, _, sources in FACT_KEYS[key]:
+            if column == sources[0]:
+                schema[key_column] = key_types[key_column]
+        if not any(column in sources for _, _, sources in FACT_KEYS[key]):
+            schema[column] = column_type
+    return schema
+
+def fact_path(full_path):
+    """sales/sales_data.csv -> sales/sales_fact.csv"""
+    folder, filename = os.path.split(full_path)
+    return os.path.join(folder, filename.replace('_data.', '_fact.'))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Command Line
+Single entry point for every pipeline step; each subcommand's module (and
+pandas/numpy/tableauserverclient with it) is only imported once it is chosen
+"""
+
+import argparse
+import importlib
+import os
+import subprocess
+import sys
+import time
+
+# subcommand -> (module in scripts/, summary)
+COMMANDS = {
+    'generate': ('generate_data', 'Generate the synthetic datasets'),
+    'validate': ('validate_data', 'Profile datasets and check invariants'),
+    'rollups': ('rollups', 'Build dashboard rollup tables'),
+    'analytics': ('analytics', 'Anomaly detection and seasonal forecasts'),
+    'score': ('fraud_scoring', 'Score transactions for fraud risk'),
+    'publish': ('publish_to_tableau', 'Publish workbooks/data sources to Tableau'),
+    'refresh': ('sync_datasources', 'Publish/refresh changed datasets as data sources'),
+    'bench': ('benchmark', 'Benchmark data generation'),
+}
+
+# =============================================================================
+# STARTUP BUDGET
+# =============================================================================
+# Invocations that must stay fast (cron and orchestrators call them constantly)
+# and must not import any heavy module.
+STARTUP_BUDGET_SECONDS = 0.3
+FAST_INVOCATIONS = [[], ['--help'], ['publish']] + [[command, '--help'] for command in COMMANDS]
+HEAVY_MODULES = ('pandas', 'numpy', 'pyarrow', 'tableauserverclient', 'requests')
+
+def _imported_modules(importtime_log):
+    """Top-level package names from python -X importtime output"""
+    modules = set()
+    for line in importtime_log.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            name = line.rsplit('|', 1)[1].strip()
+            modules.add(name.split('.')[0])
+    return modules
+
+def check_startup(budget=STARTUP_BUDGET_SECONDS, repeats=5):
+    """Time each fast invocation (best of repeats) and list heavy imports; True if all pass"""
+    script = os.path.abspath(__file__)
+    ok = True
+    print(f"{'invocation':<30}{'best s':>8}  heavy imports")
+    for args in FAST_INVOCATIONS:
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, script] + args, capture_output=True)
+            timings.append(time.perf_counter() - start)
+        log = subprocess.run([sys.executable, '-X', 'importtime', script] + args, capture_output=True, text=True).stderr
+        heavy = sorted(_imported_modules(log) & set(HEAVY_MODULES))
+        passed = min(timings) <= budget and not heavy
+        ok &= passed
+        label = ' '.join(['eip.py'] + args)
+        print(f"{label:<30}{min(timings):>8.3f}  {', '.join(heavy) or '-'}{'' if passed else '  FAIL'}")
+    print(f"\nBudget: {budget:.2f}s per invocation, no heavy imports -> {'OK' if ok else 'FAILED'}")
+    return ok
+
+# =============================================================================
+# MAIN EXECUTION
+# =============================================================================
+def main(argv=None):
+    commands = '\n'.join(f'  {name:<12}{summary}' for name, (_, summary) in COMMANDS.items())
+    parser = argparse.ArgumentParser(
+        prog='eip.py',
+        description='Enterprise Intelligence Platform pipeline',
+        epilog=f'commands:\n{commands}\n\nRun "eip.py <command> --help" for the options of a command.',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('command', nargs='?', choices=list(COMMANDS), metavar='command',
+                        help='Pipeline step to run (see below)')
+    parser.add_argument('args', nargs=argparse.REMAINDER, help='Arguments passed on to the command')
+    parser.add_argument('--check-startup', action='store_true',
+                        help=f'Verify fast paths stay under {STARTUP_BUDGET_SECONDS}s without heavy imports')
+    args = parser.parse_args(argv)
+
+    if args.check_startup:
+        sys.exit(0 if check_startup() else 1)
+    if args.command is None:
+        parser.print_help()
+        return
+
+    module_name, _ = COMMANDS[args.command]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    # argparse in the command names itself after argv[0]
+    sys.argv[0] = f'eip.py {args.command}'
+    # --help and bad arguments exit here, before the command's module loads pandas
+    import cli
+    if args.command in cli.PARSERS:
+        cli.PARSERS[args.command]().parse_args(args.args)
+    importlib.import_module(module_name).main(args.args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Fraud Scoring
+Configurable, vectorized fraud risk scorer for generated data, files and
+streaming micro-batches, with rolling per-customer velocity features
+"""
+
+import io
+import json
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from cli import score_parser
+
+# =============================================================================
+# SCORING CONFIGURATION
+# =============================================================================
+# fraud_risk_score = round(sum(points) / divisor, 1), clipped to 0..100, where
+# each feature scores value * weight, or value / scale * 100 * weight when a
+# scale normalizes it to 0..100 first. Features are summed in list order.
+DEFAULT_CONFIG = {
+    'features': [
+        # (column, weight, scale)
+        ('ip_risk_score', 0.3, None),
+        ('velocity_24h', 0.2, 50),
+        ('distance_from_home', 0.15, 5000),
+        ('failed_attempts', 0.15, 10),
+        ('is_night', 20, None),
+        ('is_international', 30, None),
+    ],
+    'divisor': 2,
+    'anomaly_threshold': 50,
+    'fraud_threshold': 70,
+}
+
+def load_config(path=None):
+    """Default config, with any keys from a JSON file laid over it"""
+    config = dict(DEFAULT_CONFIG)
+    if path:
+        with open(path) as f:
+            config.update(json.load(f))
+    config['features'] = [tuple(feature) for feature in config['features']]
+    return config
+
+class FraudScorer:
+    """Scores transactions in bulk; every operation is a whole-column numpy expression"""
+
+    def __init__(self, config=None):
+        self.config = load_config() if config is None else config
+        self.features = self.config['features']
+        self.columns = [column for column, _, _ in self.features]
+
+    def score(self, df):
+        """fraud_risk_score for every row of df, as a float64 array"""
+        total = None
+        for column, weight, scale in self.features:
+            values = df[column].to_numpy()
+            points = (values / scale * 100) * weight if scale else values * weight
+            total = points if total is None else total + points
+        return np.round(total / self.config['divisor'], 1).clip(0, 100)
+
+    def apply(self, df):
+        """Add fraud_risk_score, is_fraud and is_anomaly columns to df in place"""
+        scores = self.score(df)
+        df['fraud_risk_score'] = scores
+        df['is_fraud'] = (scores > self.config['fraud_threshold']).astype(int)
+        df['is_anomaly'] = (scores > self.config['anomaly_threshold']).astype(int)
+        return df
+
+# =============================================================================
+# ROLLING VELOCITY
+# =============================================================================
+class VelocityIndex:
+    """
+    Rolling per-customer transaction counts over a trailing time window
+
+    Rows are sorted once by (customer, time) into a single int64 key, so
+    the window start of every row is one vectorized searchsorted. Between
+    micro-batches only the last window of history is kept, plus each
+    customer's latest timestamp so gaps longer than the window do not depend
+    on where batches split.
+    """
+
+    def __init__(self, window=pd.Timedelta(hours=24), customer_column='customer_id', time_column='timestamp'):
+        self.window = int(pd.Timedelta(window).total_seconds())
+        self.customer_column = customer_column
+        self.time_column = time_column
+        self._history = pd.DataFrame({customer_column: pd.Series(dtype=str),
+                                      '_seconds': pd.Series(dtype=np.int64)})
+        self._last_seen = {}
+
+    def _seconds(self, df):
+        times = pd.to_datetime(df[self.time_column])
+        return (times.to_numpy('datetime64[s]').astype(np.int64))
+
+    def update(self, df):
+        """
+        Velocity features for one batch: (velocity_24h, minutes since the
+        customer's previous transaction, NaN for a first transaction)
+        """
+        batch = pd.DataFrame({self.customer_column: df[self.customer_column].astype(str).to_numpy(),
+                              '_seconds': self._seconds(df)})
+        rows = pd.concat([self._history, batch], ignore_index=True)
+        n_history = len(self._history)
+
+        codes, customers = pd.factorize(rows[self.customer_column])
+        seconds = rows['_seconds'].to_numpy()
+        offset = seconds.min()
+        stride = int(seconds.max() - offset) + self.window + 1
+        keys = codes.astype(np.int64) * stride + (seconds - offset)
+
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        # Window (t - window, t], ties at t included
+        left = np.searchsorted(sorted_keys, sorted_keys - self.window, side='right')
+        right = np.searchsorted(sorted_keys, sorted_keys, side='right')
+        counts = np.empty(len(keys), dtype=np.int64)
+        counts[order] = right - left
+
+        sorted_codes, sorted_seconds = codes[order], seconds[order]
+        same_customer = np.r_[False, sorted_codes[1:] == sorted_codes[:-1]]
+        # A customer's first row falls back to the last timestamp seen in earlier batches
+        # (none if that is later than the row, as with out-of-order input)
+        from_batch = order >= n_history
+        first_rows = ~same_customer & from_batch
+        previous = np.full(len(keys), np.nan)
+        previous[first_rows] = [self._last_seen.get(customer, np.nan)
+                                for customer in customers[sorted_codes[first_rows]].tolist()]
+        previous[previous > sorted_seconds] = np.nan
+        gaps = np.where(same_customer, np.diff(sorted_keys, prepend=0) / 60, (sorted_seconds - previous) / 60)
+        minutes = np.empty(len(keys))
+        minutes[order] = gaps
+
+        # Remember each customer's latest timestamp and keep one window of history for the next batch
+        last_rows = np.r_[~same_customer[1:], True] & from_batch
+        self._last_seen.update(zip(customers[sorted_codes[last_rows]].tolist(), sorted_seconds[last_rows].tolist()))
+        latest = seconds.max()
+        self._history = rows.loc[seconds > latest - self.window].reset_index(drop=True)
+        return counts[n_history:], minutes[n_history:]
+
+    def apply(self, df):
+        """Overwrite df's velocity_24h / time_since_last_txn_minutes with rolling values"""
+        velocity, minutes = self.update(df)
+        df['velocity_24h'] = velocity
+        df['time_since_last_txn_minutes'] = np.round(minutes, 1)
+        return df
+
+# =============================================================================
+# STREAMING INPUT
+# =============================================================================
+def iter_line_batches(stream, batch_size, follow=False, poll_seconds=0.5):
+    """
+    Yield lists of complete CSV lines, at most batch_size at a time
+
+    With follow=True the stream is tailed: a partial batch is flushed each
+    time the end is reached, then new lines are awaited.
+    """
+    batch, partial = [], ''
+    while True:
+        line = stream.readline()
+        if line:
+            line, partial = partial + line, ''
+            if line.endswith('\n'):
+                batch.append(line)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+                continue
+            # Unterminated last line: complete it later when following, else take it as is
+            if follow:
+                partial = line
+            else:
+                batch.append(line + '\n')
+        if batch:
+            yield batch
+            batch = []
+        if not follow:
+            return
+        time.sleep(poll_seconds)
+
+def score_stream(stream, out, scorer, batch_size=50_000, follow=False, velocity=None):
+    """Score a CSV stream in micro-batches, writing scored CSV rows to out; returns rows scored"""
+    header = stream.readline()
+    rows = 0
+    for lines in iter_line_batches(stream, batch_size, follow):
+        df = pd.read_csv(io.StringIO(header + ''.join(lines)))
+        if velocity is not None:
+            velocity.apply(df)
+        scorer.apply(df)
+        df.to_csv(out, index=False, header=rows == 0)
+        out.flush()
+        rows += len(df)
+    return rows
+
+# =============================================================================
+# THROUGHPUT BENCHMARK
+# =============================================================================
+def benchmark(sizes, scorer, repeats=3):
+    """Rows/sec of scoring alone and with rolling velocity, on generated fraud data"""
+    from generate_data import generate_fraud_data
+
+    results = []
+    for n_records in sizes:
+        df = generate_fraud_data(n_records)
+        # Spread each day's rows over the day so the 24h window is meaningful
+        seconds = np.random.default_rng(0).integers(0, 86_400, n_records)
+        df['timestamp'] = df['date'] + pd.to_timedelta(seconds, unit='s')
+
+        timings = {}
+        for label, run in [('score', lambda: scorer.apply(df)),
+                           ('velocity+score', lambda: scorer.apply(VelocityIndex().apply(df)))]:
+            best = min(_timed(run) for _ in range(repeats))
+            timings[label] = {'seconds': round(best, 4), 'rows_per_second': round(n_records / best)}
+        results.append({'rows': n_records, **timings})
+    return results
+
+def _timed(run):
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+# =============================================================================
+# MAIN EXECUTION
+# =============================================================================
+def main(argv=None):
+    parser = score_parser()
+    args = parser.parse_args(argv)
+
+    scorer = FraudScorer(load_config(args.config))
+
+    if args.bench:
+        results = benchmark(args.bench, scorer)
+        print(f"{'rows':>12}{'score rows/s':>16}{'velocity+score rows/s':>24}")
+        for r in results:
+            print(f"{r['rows']:>12,}{r['score']['rows_per_second']:>16,}{r['velocity+score']['rows_per_second']:>24,}")
+        if args.json:
+            with open(args.json, 'w') as f:
+                json.dump(results, f, indent=2)
+            print(f"\nSaved: {args.json}")
+        return
+
+    velocity = VelocityIndex(time_column=args.time_column) if args.velocity else None
+    stream = sys.stdin if args.input == '-' else open(args.input)
+    out = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+    try:
+        rows = score_stream(stream, out, scorer, args.batch_size, args.follow, velocity)
+    except KeyboardInterrupt:
+        rows = None
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        if out is not sys.stdout:
+            out.close()
+    if rows is not None:
+        print(f"Scored {rows:,} rows", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -7,323 +7,698 @@ Generates synthetic datasets for all dashboard domains
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-import random
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+import inspect
 import os
-
-# Set seed for reproducibility
-np.random.seed(42)
-random.seed(42)
-
-# Common dimensions
-REGIONS = ['North', 'South', 'East', 'West', 'Central']
-DEPARTMENTS = ['Sales', 'Marketing', 'Engineering', 'HR', 'Finance', 'Operations', 'Customer Support', 'R&D']
-COUNTRIES = ['USA', 'Canada', 'UK', 'Germany', 'France', 'Australia', 'Japan', 'Brazil', 'India', 'Mexico']
+import zlib
+
+from schemas import (
+    REGIONS, DEPARTMENTS, COUNTRIES, QUARTERS, PRIORITY_LEVELS,
+    SALES_PRODUCTS, CUSTOMER_SEGMENTS, SALES_CHANNELS,
+    JOB_TITLES, GENDERS, ETHNICITIES, EDUCATION_LEVELS,
+    FINANCE_CATEGORIES, FINANCE_SUB_CATEGORIES, COST_CENTERS,
+    SERVICE_TYPES, OPERATIONS_DEPARTMENTS,
+    SUPPLY_PRODUCTS, SUPPLIERS, WAREHOUSES, RISK_LEVELS,
+    TRANSACTION_TYPES, MERCHANT_CATEGORIES, DEVICE_TYPES,
+    IMPACT_CATEGORIES, IMPACT_INDICATORS, TREND_DIRECTIONS,
+    SALES_SCHEMA, HR_SCHEMA, FINANCE_SCHEMA, OPERATIONS_SCHEMA, SUPPLY_CHAIN_SCHEMA,
+    FRAUD_SCHEMA, PUBLIC_IMPACT_SCHEMA, SCHEMAS, apply_schema, date_column, id_column,
+)
+from cli import generate_parser
+from datasets import DATASET_FILES, DEFAULT_CHUNK_SIZE, SEED, get_base_path
+from writers import open_writer, output_path
+from dimensions import CUSTOMER_COUNT, fact_path, star_schema, to_star, write_dimensions
+from fraud_scoring import FraudScorer
+from manifest import dataset_state, load_manifest, parse_date, record_dataset, save_manifest
+from scenarios import category_sampler, compile_scenario, load_scenario
 
 # Date range: 3 years of data
 START_DATE = datetime(2022, 1, 1)
 END_DATE = datetime(2024, 12, 31)
+# Hire dates reach further back than transactions
+HR_START_DATE = datetime(2015, 1, 1)
+
+# Fraud scores use the default weights and thresholds of fraud_scoring.py
+FRAUD_SCORER = FraudScorer()
+
+# Set by benchmark.py to a callable that timestamps generator phases; every
+# generator calls mark_phase('sampled') once its raw columns are drawn
+PHASE_HOOK = None
 
-def generate_date_range(start, end, n_records):
-    """Generate random dates within range"""
+def mark_phase(name):
+    """Report a phase boundary to PHASE_HOOK, if one is installed"""
+    if PHASE_HOOK is not None:
+        PHASE_HOOK(name)
+
+def generate_date_range(start, end, n_records, rng):
+    """Generate random dates within range as a datetime64[D] array"""
     delta = end - start
-    return [start + timedelta(days=random.randint(0, delta.days)) for _ in range(n_records)]
+    return np.datetime64(start, 'D') + rng.integers(0, delta.days + 1, n_records)
+
+def format_ids(prefix, numbers, width):
+    """
+    Format integers as zero-padded IDs in bulk, e.g. ('TXN-', [7], 6) -> ['TXN-000007']
+
+    Like f'{n:0{width}d}', each number is padded on its own and only numbers
+    wider than width grow, so an ID's text never depends on its neighbours.
+    """
+    numbers = np.array(numbers, dtype=np.int64)
+    digits = np.searchsorted(10 ** np.arange(1, 19, dtype=np.int64), numbers, side='right') + 1
+    widths = np.maximum(digits, width)
+    if len(numbers) == 0 or widths.min() == widths.max():
+        return _format_fixed(prefix, numbers, int(widths.max(initial=width)))
+    ids = np.empty(len(numbers), dtype=f'U{len(prefix) + widths.max()}')
+    for w in np.unique(widths):
+        rows = widths == w
+        ids[rows] = _format_fixed(prefix, numbers[rows], int(w))
+    return ids
+
+def _format_fixed(prefix, numbers, width):
+    """Format integers that all fit in width digits as prefix + exactly width digits"""
+    head = np.frombuffer(prefix.encode('ascii'), dtype=np.uint8)
+    buf = np.empty((len(numbers), len(head) + width), dtype=np.uint8)
+    buf[:, :len(head)] = head
+    # Fill digits right to left, one column per pass over all rows
+    for pos in range(buf.shape[1] - 1, len(head) - 1, -1):
+        buf[:, pos] = numbers % 10 + ord('0')
+        numbers //= 10
+    return buf.view(f'S{buf.shape[1]}').ravel().astype(str)
+
+def sequential_ids(prefix, n_records, width, start=1):
+    """Generate contiguous IDs prefix-<start> .. prefix-<start + n_records - 1>"""
+    return format_ids(prefix, np.arange(start, start + n_records), width)
+
+def sample_category(rng, values, n_records, p=None, compact=False):
+    """
+    Draw n_records values from a vocabulary
+
+    The sampler (CDF and code lookup) is compiled once per vocabulary and
+    consumes the random stream exactly like rng.choice(values, p=p), so
+    output does not change. compact=True returns a pd.Categorical (int8
+    codes plus a shared dictionary) instead of one string per row.
+    """
+    sampler = category_sampler(tuple(values), None if p is None else tuple(p))
+    return sampler.sample(rng, n_records, compact=compact)
+
+def sampled_frame(data, columns, rng, n_records, window, compact=False):
+    """
+    DataFrame of a generator's raw columns, after scenario samplers replace
+    any columns they cover; marks the end of the sampling phase
+    """
+    for column, sampler in (columns or {}).items():
+        if column not in data:
+            raise ValueError(f"Scenario column '{column}' is derived; redefine it under 'derived' instead")
+        data[column] = sampler.sample(rng, n_records, window, compact)
+    df = pd.DataFrame(data)
+    mark_phase('sampled')
+    return df
 
-def get_base_path():
-    """Get the base path for data files"""
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    return os.path.join(script_dir, '..', 'data')
+def quarter_labels(dates):
+    """Map datetime64 dates to 'Q1'..'Q4' labels"""
+    months = np.asarray(dates, dtype='datetime64[M]').astype(np.int64) % 12
+    return np.array(QUARTERS)[months // 3]
 
 # =============================================================================
 # 1. SALES DATA
 # =============================================================================
-def generate_sales_data(n_records=5000):
+def generate_sales_data(n_records=5000, start_id=1, rng=None, compact=False,
+                        start_date=START_DATE, end_date=END_DATE, columns=None):
     """Generate sales and customer data"""
-    products = ['Product A', 'Product B', 'Product C', 'Product D', 'Product E', 'Enterprise Suite', 'Basic Plan', 'Premium Plan']
-    customer_segments = ['Enterprise', 'SMB', 'Startup', 'Individual', 'Government']
-    sales_channels = ['Direct', 'Partner', 'Online', 'Retail']
-
+    if rng is None:
+        rng = np.random.default_rng(SEED)
     data = {
-        'transaction_id': [f'TXN-{i:06d}' for i in range(1, n_records + 1)],
-        'date': generate_date_range(START_DATE, END_DATE, n_records),
-        'region': np.random.choice(REGIONS, n_records),
-        'country': np.random.choice(COUNTRIES, n_records),
-        'customer_id': [f'CUST-{random.randint(1, 1000):04d}' for _ in range(n_records)],
-        'customer_segment': np.random.choice(customer_segments, n_records, p=[0.15, 0.35, 0.25, 0.2, 0.05]),
-        'product': np.random.choice(products, n_records),
-        'sales_channel': np.random.choice(sales_channels, n_records),
-        'quantity': np.random.randint(1, 50, n_records),
-        'unit_price': np.round(np.random.uniform(50, 5000, n_records), 2),
-        'discount_percent': np.random.choice([0, 5, 10, 15, 20, 25], n_records, p=[0.4, 0.2, 0.15, 0.1, 0.1, 0.05]),
-        'customer_lifetime_value': np.round(np.random.uniform(500, 50000, n_records), 2),
-        'recency_days': np.random.randint(1, 365, n_records),
-        'frequency': np.random.randint(1, 50, n_records),
-        'monetary_value': np.round(np.random.uniform(100, 25000, n_records), 2),
-        'satisfaction_score': np.round(np.random.uniform(1, 5, n_records), 1),
-        'nps_score': np.random.randint(-100, 101, n_records),
+        'transaction_id': sequential_ids('TXN-', n_records, 6, start_id),
+        'date': generate_date_range(start_date, end_date, n_records, rng),
+        'region': sample_category(rng, REGIONS, n_records, compact=compact),
+        'country': sample_category(rng, COUNTRIES, n_records, compact=compact),
+        'customer_id': format_ids('CUST-', rng.integers(1, 1001, n_records), 4),
+        'customer_segment': sample_category(rng, CUSTOMER_SEGMENTS, n_records, p=[0.15, 0.35, 0.25, 0.2, 0.05], compact=compact),
+        'product': sample_category(rng, SALES_PRODUCTS, n_records, compact=compact),
+        'sales_channel': sample_category(rng, SALES_CHANNELS, n_records, compact=compact),
+        'quantity': rng.integers(1, 50, n_records),
+        'unit_price': np.round(rng.uniform(50, 5000, n_records), 2),
+        'discount_percent': rng.choice([0, 5, 10, 15, 20, 25], n_records, p=[0.4, 0.2, 0.15, 0.1, 0.1, 0.05]),
+        'customer_lifetime_value': np.round(rng.uniform(500, 50000, n_records), 2),
+        'recency_days': rng.integers(1, 365, n_records),
+        'frequency': rng.integers(1, 50, n_records),
+        'monetary_value': np.round(rng.uniform(100, 25000, n_records), 2),
+        'satisfaction_score': np.round(rng.uniform(1, 5, n_records), 1),
+        'nps_score': rng.integers(-100, 101, n_records),
     }
 
-    df = pd.DataFrame(data)
+    df = sampled_frame(data, columns, rng, n_records, (start_date, end_date), compact)
     df['revenue'] = np.round(df['quantity'] * df['unit_price'] * (1 - df['discount_percent']/100), 2)
-    df['cost'] = np.round(df['revenue'] * np.random.uniform(0.4, 0.7, n_records), 2)
+    df['cost'] = np.round(df['revenue'] * rng.uniform(0.4, 0.7, n_records), 2)
     df['profit'] = df['revenue'] - df['cost']
     df['profit_margin'] = np.round((df['profit'] / df['revenue']) * 100, 2)
 
+    if compact:
+        df = apply_schema(df, SALES_SCHEMA)
     return df
 
 # =============================================================================
 # 2. HR DATA
 # =============================================================================
-def generate_hr_data(n_records=1500):
+def generate_hr_data(n_records=1500, start_id=1, rng=None, compact=False,
+                     start_date=HR_START_DATE, end_date=END_DATE, columns=None):
     """Generate HR and employee data"""
-    job_titles = ['Analyst', 'Senior Analyst', 'Manager', 'Senior Manager', 'Director', 'VP', 'Engineer', 'Senior Engineer', 'Specialist', 'Coordinator']
-    genders = ['Male', 'Female', 'Non-Binary']
-    ethnicities = ['White', 'Black', 'Hispanic', 'Asian', 'Mixed', 'Other']
-    education_levels = ['High School', 'Associate', 'Bachelor', 'Master', 'PhD']
+    if rng is None:
+        rng = np.random.default_rng(SEED)
+
+    # Repeated entries weight the uniform draw towards 'Active'
     employment_status = ['Active', 'Active', 'Active', 'Active', 'Terminated', 'On Leave']
 
-    hire_dates = generate_date_range(datetime(2015, 1, 1), END_DATE, n_records)
+    hire_dates = generate_date_range(start_date, end_date, n_records, rng)
 
     data = {
-        'employee_id': [f'EMP-{i:05d}' for i in range(1, n_records + 1)],
-        'department': np.random.choice(DEPARTMENTS, n_records),
-        'region': np.random.choice(REGIONS, n_records),
-        'job_title': np.random.choice(job_titles, n_records),
+        'employee_id': sequential_ids('EMP-', n_records, 5, start_id),
+        'department': sample_category(rng, DEPARTMENTS, n_records, compact=compact),
+        'region': sample_category(rng, REGIONS, n_records, compact=compact),
+        'job_title': sample_category(rng, JOB_TITLES, n_records, compact=compact),
         'hire_date': hire_dates,
-        'gender': np.random.choice(genders, n_records, p=[0.48, 0.48, 0.04]),
-        'ethnicity': np.random.choice(ethnicities, n_records, p=[0.45, 0.15, 0.18, 0.12, 0.07, 0.03]),
-        'age': np.random.randint(22, 65, n_records),
-        'education': np.random.choice(education_levels, n_records, p=[0.1, 0.15, 0.45, 0.25, 0.05]),
-        'salary': np.round(np.random.uniform(40000, 200000, n_records), 2),
-        'performance_rating': np.round(np.random.uniform(1, 5, n_records), 1),
-        'satisfaction_score': np.round(np.random.uniform(1, 5, n_records), 1),
-        'engagement_score': np.round(np.random.uniform(1, 100, n_records), 0),
-        'training_hours': np.random.randint(0, 200, n_records),
-        'promotion_last_3_years': np.random.choice([0, 1], n_records, p=[0.75, 0.25]),
-        'employment_status': np.random.choice(employment_status, n_records),
-        'time_to_hire_days': np.random.randint(14, 120, n_records),
-        'turnover_risk': np.round(np.random.uniform(0, 1, n_records), 2),
+        'gender': sample_category(rng, GENDERS, n_records, p=[0.48, 0.48, 0.04], compact=compact),
+        'ethnicity': sample_category(rng, ETHNICITIES, n_records, p=[0.45, 0.15, 0.18, 0.12, 0.07, 0.03], compact=compact),
+        'age': rng.integers(22, 65, n_records),
+        'education': sample_category(rng, EDUCATION_LEVELS, n_records, p=[0.1, 0.15, 0.45, 0.25, 0.05], compact=compact),
+        'salary': np.round(rng.uniform(40000, 200000, n_records), 2),
+        'performance_rating': np.round(rng.uniform(1, 5, n_records), 1),
+        'satisfaction_score': np.round(rng.uniform(1, 5, n_records), 1),
+        'engagement_score': np.round(rng.uniform(1, 100, n_records), 0),
+        'training_hours': rng.integers(0, 200, n_records),
+        'promotion_last_3_years': rng.choice([0, 1], n_records, p=[0.75, 0.25]),
+        'employment_status': sample_category(rng, employment_status, n_records, compact=compact),
+        'time_to_hire_days': rng.integers(14, 120, n_records),
+        'turnover_risk': np.round(rng.uniform(0, 1, n_records), 2),
     }
 
-    df = pd.DataFrame(data)
-    df['tenure_years'] = np.round((END_DATE - pd.to_datetime(df['hire_date'])).dt.days / 365, 1)
+    df = sampled_frame(data, columns, rng, n_records, (start_date, end_date), compact)
+    df['tenure_years'] = np.round((end_date - pd.to_datetime(df['hire_date'])).dt.days / 365, 1)
     df['tenure_years'] = df['tenure_years'].clip(lower=0)
 
+    if compact:
+        df = apply_schema(df, HR_SCHEMA)
     return df
 
 # =============================================================================
 # 3. FINANCE DATA
 # =============================================================================
-def generate_finance_data(n_records=2000):
+def generate_finance_data(n_records=2000, start_id=1, rng=None, compact=False,
+                          start_date=START_DATE, end_date=END_DATE, columns=None):
     """Generate financial data"""
-    categories = ['Revenue', 'COGS', 'Operating Expenses', 'Marketing', 'R&D', 'Administrative', 'Depreciation', 'Interest']
-    sub_categories = ['Salaries', 'Materials', 'Utilities', 'Rent', 'Software', 'Travel', 'Equipment', 'Services', 'Other']
-    cost_centers = ['CC-100', 'CC-200', 'CC-300', 'CC-400', 'CC-500']
+    if rng is None:
+        rng = np.random.default_rng(SEED)
+    dates = generate_date_range(start_date, end_date, n_records, rng)
 
     data = {
-        'transaction_id': [f'FIN-{i:06d}' for i in range(1, n_records + 1)],
-        'date': generate_date_range(START_DATE, END_DATE, n_records),
-        'region': np.random.choice(REGIONS, n_records),
-        'department': np.random.choice(DEPARTMENTS, n_records),
-        'category': np.random.choice(categories, n_records),
-        'sub_category': np.random.choice(sub_categories, n_records),
-        'cost_center': np.random.choice(cost_centers, n_records),
-        'budget_amount': np.round(np.random.uniform(10000, 500000, n_records), 2),
-        'actual_amount': np.round(np.random.uniform(8000, 550000, n_records), 2),
-        'forecast_amount': np.round(np.random.uniform(9000, 520000, n_records), 2),
-        'quarter': [f'Q{((d.month - 1) // 3) + 1}' for d in generate_date_range(START_DATE, END_DATE, n_records)],
-        'fiscal_year': np.random.choice([2022, 2023, 2024], n_records),
+        'transaction_id': sequential_ids('FIN-', n_records, 6, start_id),
+        'date': dates,
+        'region': sample_category(rng, REGIONS, n_records, compact=compact),
+        'department': sample_category(rng, DEPARTMENTS, n_records, compact=compact),
+        'category': sample_category(rng, FINANCE_CATEGORIES, n_records, compact=compact),
+        'sub_category': sample_category(rng, FINANCE_SUB_CATEGORIES, n_records, compact=compact),
+        'cost_center': sample_category(rng, COST_CENTERS, n_records, compact=compact),
+        'budget_amount': np.round(rng.uniform(10000, 500000, n_records), 2),
+        'actual_amount': np.round(rng.uniform(8000, 550000, n_records), 2),
+        'forecast_amount': np.round(rng.uniform(9000, 520000, n_records), 2),
+        'quarter': quarter_labels(dates),
+        'fiscal_year': rng.choice([2022, 2023, 2024], n_records),
     }
 
-    df = pd.DataFrame(data)
+    df = sampled_frame(data, columns, rng, n_records, (start_date, end_date), compact)
+    if columns and 'date' in columns:
+        df['quarter'] = quarter_labels(df['date'].to_numpy())
     df['variance'] = df['actual_amount'] - df['budget_amount']
     df['variance_percent'] = np.round((df['variance'] / df['budget_amount']) * 100, 2)
     df['forecast_accuracy'] = np.round(100 - abs((df['actual_amount'] - df['forecast_amount']) / df['actual_amount'] * 100), 2)
 
+    if compact:
+        df = apply_schema(df, FINANCE_SCHEMA)
     return df
 
 # =============================================================================
 # 4. HEALTHCARE / OPERATIONS DATA
 # =============================================================================
-def generate_operations_data(n_records=3000):
+def generate_operations_data(n_records=3000, start_id=1, rng=None, compact=False,
+                             start_date=START_DATE, end_date=END_DATE, columns=None):
     """Generate healthcare/operations flow data"""
-    service_types = ['Outpatient', 'Inpatient', 'Emergency', 'Surgery', 'Diagnostic', 'Therapy', 'Consultation']
-    departments_ops = ['Emergency', 'Radiology', 'Surgery', 'ICU', 'Pharmacy', 'Lab', 'Administration', 'Outpatient']
-    priority_levels = ['Low', 'Medium', 'High', 'Critical']
-
+    if rng is None:
+        rng = np.random.default_rng(SEED)
     data = {
-        'case_id': [f'CASE-{i:06d}' for i in range(1, n_records + 1)],
-        'date': generate_date_range(START_DATE, END_DATE, n_records),
-        'region': np.random.choice(REGIONS, n_records),
-        'department': np.random.choice(departments_ops, n_records),
-        'service_type': np.random.choice(service_types, n_records),
-        'priority': np.random.choice(priority_levels, n_records, p=[0.3, 0.4, 0.2, 0.1]),
-        'wait_time_minutes': np.random.randint(5, 240, n_records),
-        'service_time_minutes': np.random.randint(15, 480, n_records),
-        'throughput': np.random.randint(1, 100, n_records),
-        'capacity_utilization': np.round(np.random.uniform(0.4, 1.0, n_records), 2),
-        'staff_count': np.random.randint(2, 20, n_records),
-        'patient_volume': np.random.randint(10, 500, n_records),
-        'satisfaction_score': np.round(np.random.uniform(1, 5, n_records), 1),
-        'cost_per_case': np.round(np.random.uniform(100, 10000, n_records), 2),
-        'readmission_rate': np.round(np.random.uniform(0, 0.2, n_records), 3),
-        'bottleneck_flag': np.random.choice([0, 1], n_records, p=[0.85, 0.15]),
+        'case_id': sequential_ids('CASE-', n_records, 6, start_id),
+        'date': generate_date_range(start_date, end_date, n_records, rng),
+        'region': sample_category(rng, REGIONS, n_records, compact=compact),
+        'department': sample_category(rng, OPERATIONS_DEPARTMENTS, n_records, compact=compact),
+        'service_type': sample_category(rng, SERVICE_TYPES, n_records, compact=compact),
+        'priority': sample_category(rng, PRIORITY_LEVELS, n_records, p=[0.3, 0.4, 0.2, 0.1], compact=compact),
+        'wait_time_minutes': rng.integers(5, 240, n_records),
+        'service_time_minutes': rng.integers(15, 480, n_records),
+        'throughput': rng.integers(1, 100, n_records),
+        'capacity_utilization': np.round(rng.uniform(0.4, 1.0, n_records), 2),
+        'staff_count': rng.integers(2, 20, n_records),
+        'patient_volume': rng.integers(10, 500, n_records),
+        'satisfaction_score': np.round(rng.uniform(1, 5, n_records), 1),
+        'cost_per_case': np.round(rng.uniform(100, 10000, n_records), 2),
+        'readmission_rate': np.round(rng.uniform(0, 0.2, n_records), 3),
+        'bottleneck_flag': rng.choice([0, 1], n_records, p=[0.85, 0.15]),
     }
 
-    df = pd.DataFrame(data)
+    df = sampled_frame(data, columns, rng, n_records, (start_date, end_date), compact)
     df['total_time_minutes'] = df['wait_time_minutes'] + df['service_time_minutes']
     df['efficiency_score'] = np.round((df['service_time_minutes'] / df['total_time_minutes']) * 100, 2)
 
+    if compact:
+        df = apply_schema(df, OPERATIONS_SCHEMA)
     return df
 
 # =============================================================================
 # 5. SUPPLY CHAIN DATA
 # =============================================================================
-def generate_supply_chain_data(n_records=2500):
+def generate_supply_chain_data(n_records=2500, start_id=1, rng=None, compact=False,
+                               start_date=START_DATE, end_date=END_DATE, columns=None):
     """Generate supply chain and inventory data"""
-    products = ['Raw Material A', 'Raw Material B', 'Component X', 'Component Y', 'Finished Good 1', 'Finished Good 2', 'Packaging', 'Equipment']
-    suppliers = [f'Supplier-{i:03d}' for i in range(1, 51)]
-    warehouses = ['WH-North', 'WH-South', 'WH-East', 'WH-West', 'WH-Central']
-    risk_levels = ['Low', 'Medium', 'High', 'Critical']
-
+    if rng is None:
+        rng = np.random.default_rng(SEED)
     data = {
-        'inventory_id': [f'INV-{i:06d}' for i in range(1, n_records + 1)],
-        'date': generate_date_range(START_DATE, END_DATE, n_records),
-        'region': np.random.choice(REGIONS, n_records),
-        'product': np.random.choice(products, n_records),
-        'supplier': np.random.choice(suppliers, n_records),
-        'warehouse': np.random.choice(warehouses, n_records),
-        'inventory_level': np.random.randint(0, 10000, n_records),
-        'reorder_point': np.random.randint(100, 2000, n_records),
-        'demand_forecast': np.random.randint(50, 5000, n_records),
-        'lead_time_days': np.random.randint(1, 60, n_records),
-        'supplier_delay_days': np.random.randint(0, 30, n_records),
-        'order_quantity': np.random.randint(100, 5000, n_records),
-        'unit_cost': np.round(np.random.uniform(1, 500, n_records), 2),
-        'holding_cost': np.round(np.random.uniform(0.5, 10, n_records), 2),
-        'stockout_count': np.random.randint(0, 20, n_records),
-        'supplier_rating': np.round(np.random.uniform(1, 5, n_records), 1),
-        'risk_level': np.random.choice(risk_levels, n_records, p=[0.5, 0.3, 0.15, 0.05]),
-        'on_time_delivery_rate': np.round(np.random.uniform(0.7, 1.0, n_records), 2),
+        'inventory_id': sequential_ids('INV-', n_records, 6, start_id),
+        'date': generate_date_range(start_date, end_date, n_records, rng),
+        'region': sample_category(rng, REGIONS, n_records, compact=compact),
+        'product': sample_category(rng, SUPPLY_PRODUCTS, n_records, compact=compact),
+        'supplier': sample_category(rng, SUPPLIERS, n_records, compact=compact),
+        'warehouse': sample_category(rng, WAREHOUSES, n_records, compact=compact),
+        'inventory_level': rng.integers(0, 10000, n_records),
+        'reorder_point': rng.integers(100, 2000, n_records),
+        'demand_forecast': rng.integers(50, 5000, n_records),
+        'lead_time_days': rng.integers(1, 60, n_records),
+        'supplier_delay_days': rng.integers(0, 30, n_records),
+        'order_quantity': rng.integers(100, 5000, n_records),
+        'unit_cost': np.round(rng.uniform(1, 500, n_records), 2),
+        'holding_cost': np.round(rng.uniform(0.5, 10, n_records), 2),
+        'stockout_count': rng.integers(0, 20, n_records),
+        'supplier_rating': np.round(rng.uniform(1, 5, n_records), 1),
+        'risk_level': sample_category(rng, RISK_LEVELS, n_records, p=[0.5, 0.3, 0.15, 0.05], compact=compact),
+        'on_time_delivery_rate': np.round(rng.uniform(0.7, 1.0, n_records), 2),
     }
 
-    df = pd.DataFrame(data)
+    df = sampled_frame(data, columns, rng, n_records, (start_date, end_date), compact)
     df['inventory_value'] = np.round(df['inventory_level'] * df['unit_cost'], 2)
     df['days_of_supply'] = np.round(df['inventory_level'] / (df['demand_forecast'] / 30), 1)
     df['shortage_risk'] = (df['inventory_level'] < df['reorder_point']).astype(int)
 
+    if compact:
+        df = apply_schema(df, SUPPLY_CHAIN_SCHEMA)
     return df
 
 # =============================================================================
 # 6. FRAUD DATA
 # =============================================================================
-def generate_fraud_data(n_records=4000):
+def generate_fraud_data(n_records=4000, start_id=1, rng=None, compact=False,
+                        start_date=START_DATE, end_date=END_DATE, columns=None):
     """Generate fraud and anomaly detection data"""
-    transaction_types = ['Purchase', 'Refund', 'Transfer', 'Withdrawal', 'Deposit', 'Payment']
-    merchant_categories = ['Retail', 'Online', 'Travel', 'Entertainment', 'Utilities', 'Healthcare', 'Gas Station', 'Restaurant']
-    device_types = ['Desktop', 'Mobile', 'Tablet', 'POS', 'ATM']
-
+    if rng is None:
+        rng = np.random.default_rng(SEED)
     data = {
-        'transaction_id': [f'FRD-{i:06d}' for i in range(1, n_records + 1)],
-        'date': generate_date_range(START_DATE, END_DATE, n_records),
-        'region': np.random.choice(REGIONS, n_records),
-        'country': np.random.choice(COUNTRIES, n_records),
-        'customer_id': [f'CUST-{random.randint(1, 2000):04d}' for _ in range(n_records)],
-        'transaction_type': np.random.choice(transaction_types, n_records),
-        'merchant_category': np.random.choice(merchant_categories, n_records),
-        'amount': np.round(np.random.exponential(500, n_records), 2),
-        'device_type': np.random.choice(device_types, n_records),
-        'ip_risk_score': np.round(np.random.uniform(0, 100, n_records), 1),
-        'velocity_24h': np.random.randint(1, 50, n_records),
-        'distance_from_home': np.random.randint(0, 5000, n_records),
-        'time_since_last_txn_minutes': np.random.randint(1, 10080, n_records),
-        'failed_attempts': np.random.randint(0, 10, n_records),
-        'is_weekend': np.random.choice([0, 1], n_records, p=[0.7, 0.3]),
-        'is_night': np.random.choice([0, 1], n_records, p=[0.75, 0.25]),
-        'is_international': np.random.choice([0, 1], n_records, p=[0.85, 0.15]),
+        'transaction_id': sequential_ids('FRD-', n_records, 6, start_id),
+        'date': generate_date_range(start_date, end_date, n_records, rng),
+        'region': sample_category(rng, REGIONS, n_records, compact=compact),
+        'country': sample_category(rng, COUNTRIES, n_records, compact=compact),
+        'customer_id': format_ids('CUST-', rng.integers(1, 2001, n_records), 4),
+        'transaction_type': sample_category(rng, TRANSACTION_TYPES, n_records, compact=compact),
+        'merchant_category': sample_category(rng, MERCHANT_CATEGORIES, n_records, compact=compact),
+        'amount': np.round(rng.exponential(500, n_records), 2),
+        'device_type': sample_category(rng, DEVICE_TYPES, n_records, compact=compact),
+        'ip_risk_score': np.round(rng.uniform(0, 100, n_records), 1),
+        'velocity_24h': rng.integers(1, 50, n_records),
+        'distance_from_home': rng.integers(0, 5000, n_records),
+        'time_since_last_txn_minutes': rng.integers(1, 10080, n_records),
+        'failed_attempts': rng.integers(0, 10, n_records),
+        'is_weekend': rng.choice([0, 1], n_records, p=[0.7, 0.3]),
+        'is_night': rng.choice([0, 1], n_records, p=[0.75, 0.25]),
+        'is_international': rng.choice([0, 1], n_records, p=[0.85, 0.15]),
     }
 
-    df = pd.DataFrame(data)
-
-    df['fraud_risk_score'] = np.round(
-        (df['ip_risk_score'] * 0.3 +
-         (df['velocity_24h'] / 50 * 100) * 0.2 +
-         (df['distance_from_home'] / 5000 * 100) * 0.15 +
-         (df['failed_attempts'] / 10 * 100) * 0.15 +
-         df['is_night'] * 20 +
-         df['is_international'] * 30) / 2, 1
-    ).clip(0, 100)
+    df = sampled_frame(data, columns, rng, n_records, (start_date, end_date), compact)
 
-    df['is_fraud'] = (df['fraud_risk_score'] > 70).astype(int) | np.random.choice([0, 1], n_records, p=[0.97, 0.03])
-    df['is_anomaly'] = (df['fraud_risk_score'] > 50).astype(int)
+    FRAUD_SCORER.apply(df)
+    # Label noise: some fraud is missed by the rules
+    df['is_fraud'] = df['is_fraud'] | rng.choice([0, 1], n_records, p=[0.97, 0.03])
 
+    if compact:
+        df = apply_schema(df, FRAUD_SCHEMA)
     return df
 
 # =============================================================================
 # 7. PUBLIC IMPACT DATA
 # =============================================================================
-def generate_public_impact_data(n_records=1500):
+def generate_public_impact_data(n_records=1500, start_id=1, rng=None, compact=False,
+                                start_date=START_DATE, end_date=END_DATE, columns=None):
     """Generate public impact data (housing, climate, health)"""
-    categories = ['Housing', 'Climate', 'Health', 'Education', 'Employment', 'Infrastructure']
-    indicators = ['Air Quality Index', 'Housing Affordability Index', 'Unemployment Rate', 'Life Expectancy',
-                  'CO2 Emissions', 'Renewable Energy %', 'Hospital Beds per 1000', 'School Enrollment Rate',
-                  'Income Inequality', 'Access to Clean Water']
-
+    if rng is None:
+        rng = np.random.default_rng(SEED)
     data = {
-        'record_id': [f'PUB-{i:05d}' for i in range(1, n_records + 1)],
-        'date': generate_date_range(START_DATE, END_DATE, n_records),
-        'region': np.random.choice(REGIONS, n_records),
-        'country': np.random.choice(COUNTRIES, n_records),
-        'category': np.random.choice(categories, n_records),
-        'indicator': np.random.choice(indicators, n_records),
-        'value': np.round(np.random.uniform(10, 100, n_records), 2),
-        'target_value': np.round(np.random.uniform(50, 100, n_records), 2),
-        'previous_year_value': np.round(np.random.uniform(10, 95, n_records), 2),
-        'population_affected': np.random.randint(10000, 10000000, n_records),
-        'budget_allocated': np.round(np.random.uniform(100000, 50000000, n_records), 2),
-        'budget_spent': np.round(np.random.uniform(80000, 48000000, n_records), 2),
-        'projects_completed': np.random.randint(0, 100, n_records),
-        'projects_in_progress': np.random.randint(0, 50, n_records),
-        'satisfaction_rating': np.round(np.random.uniform(1, 5, n_records), 1),
-        'trend_direction': np.random.choice(['Improving', 'Stable', 'Declining'], n_records, p=[0.4, 0.35, 0.25]),
-        'priority_level': np.random.choice(['Low', 'Medium', 'High', 'Critical'], n_records, p=[0.2, 0.4, 0.3, 0.1]),
+        'record_id': sequential_ids('PUB-', n_records, 5, start_id),
+        'date': generate_date_range(start_date, end_date, n_records, rng),
+        'region': sample_category(rng, REGIONS, n_records, compact=compact),
+        'country': sample_category(rng, COUNTRIES, n_records, compact=compact),
+        'category': sample_category(rng, IMPACT_CATEGORIES, n_records, compact=compact),
+        'indicator': sample_category(rng, IMPACT_INDICATORS, n_records, compact=compact),
+        'value': np.round(rng.uniform(10, 100, n_records), 2),
+        'target_value': np.round(rng.uniform(50, 100, n_records), 2),
+        'previous_year_value': np.round(rng.uniform(10, 95, n_records), 2),
+        'population_affected': rng.integers(10000, 10000000, n_records),
+        'budget_allocated': np.round(rng.uniform(100000, 50000000, n_records), 2),
+        'budget_spent': np.round(rng.uniform(80000, 48000000, n_records), 2),
+        'projects_completed': rng.integers(0, 100, n_records),
+        'projects_in_progress': rng.integers(0, 50, n_records),
+        'satisfaction_rating': np.round(rng.uniform(1, 5, n_records), 1),
+        'trend_direction': sample_category(rng, TREND_DIRECTIONS, n_records, p=[0.4, 0.35, 0.25], compact=compact),
+        'priority_level': sample_category(rng, PRIORITY_LEVELS, n_records, p=[0.2, 0.4, 0.3, 0.1], compact=compact),
     }
 
-    df = pd.DataFrame(data)
+    df = sampled_frame(data, columns, rng, n_records, (start_date, end_date), compact)
     df['year_over_year_change'] = np.round((df['value'] - df['previous_year_value']) / df['previous_year_value'] * 100, 2)
     df['target_achievement'] = np.round((df['value'] / df['target_value']) * 100, 2)
     df['budget_utilization'] = np.round((df['budget_spent'] / df['budget_allocated']) * 100, 2)
 
+    if compact:
+        df = apply_schema(df, PUBLIC_IMPACT_SCHEMA)
     return df
 
+# =============================================================================
+# STREAMING GENERATION
+# =============================================================================
+GENERATORS = {
+    'sales': generate_sales_data,
+    'hr': generate_hr_data,
+    'finance': generate_finance_data,
+    'healthcare': generate_operations_data,
+    'supply_chain': generate_supply_chain_data,
+    'fraud': generate_fraud_data,
+    'public_impact': generate_public_impact_data,
+}
+
+# (key, display name, generator, output path relative to data/)
+DATASETS = [(key, name, GENERATORS[key], filepath) for key, name, filepath in DATASET_FILES]
+
+def plan_job(key, full_path, manifest, records=None, start_date=None, end_date=None, incremental=False,
+             scale=1.0):
+    """
+    Work out what to generate for one domain
+
+    Full runs start at ID 1 and cover the generator's default date window
+    unless dates are given. Incremental runs continue after the last ID and
+    date already on disk and, unless records is given, keep the domain's
+    existing rows-per-day rate. Without records, the default row count (or
+    rate) is multiplied by scale. Returns (first_id, n_records, (start, end),
+    previous state), or None when an incremental window is empty.
+    """
+    params = inspect.signature(GENERATORS[key]).parameters
+    state = None
+    if incremental:
+        state = dataset_state(manifest, key, full_path, id_column(key), date_column(key))
+    if state is None:
+        window = (start_date or params['start_date'].default, end_date or params['end_date'].default)
+        return 1, records or max(1, round(params['n_records'].default * scale)), window, None
+
+    last_date = parse_date(state['last_date'])
+    start_date = start_date or last_date + timedelta(days=1)
+    end_date = end_date or start_date
+    if end_date < start_date:
+        return None
+    if records is None:
+        covered_days = (last_date - parse_date(state['first_date'])).days + 1
+        records = max(1, round(state['rows'] / covered_days * ((end_date - start_date).days + 1) * scale))
+    return state['last_id'] + 1, records, (start_date, end_date), state
+
+def chunk_rng(seed, key, start_id):
+    """
+    Independent random stream for one chunk of a domain
+
+    The stream only depends on (seed, domain, first row ID), so a chunk comes
+    out the same whether it runs in-process or in any pool worker.
+    """
+    return np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(zlib.crc32(key.encode()), start_id)))
+
+def chunk_bounds(n_records, chunk_size, first_id=1):
+    """Yield (start_id, rows) for each chunk of a dataset"""
+    for start in range(0, n_records, chunk_size):
+        yield first_id + start, min(chunk_size, n_records - start)
+
+def generate_chunk(key, start_id, rows, seed=SEED, compact=False, date_range=None, star=False, scenario=None):
+    """
+    Generate one chunk of a domain from its own random stream (as a fact table
+    chunk when star), drawing and deriving columns as a scenario config says
+    """
+    options = {} if date_range is None else {'start_date': date_range[0], 'end_date': date_range[1]}
+    if scenario is not None:
+        scenario = compile_scenario(scenario)
+        options['columns'] = scenario.samplers(key)
+    df = GENERATORS[key](rows, start_id=start_id, rng=chunk_rng(seed, key, start_id), compact=compact, **options)
+    if scenario is not None:
+        df = scenario.derive(key, df, compact)
+    return to_star(key, df) if star else df
+
+def iter_chunks(key, n_records, chunk_size=DEFAULT_CHUNK_SIZE, seed=SEED, compact=False, first_id=1, date_range=None,
+                star=False, scenario=None):
+    """
+    Yield a dataset as DataFrames of at most chunk_size rows
+
+    Every row's derived columns only depend on that row, so each chunk is
+    complete on its own. Row IDs continue from one chunk to the next.
+    """
+    for start_id, rows in chunk_bounds(n_records, chunk_size, first_id):
+        yield generate_chunk(key, start_id, rows, seed, compact, date_range, star, scenario)
+
+def open_writers(key, full_path, outputs, star=False):
+    """Open one writer per (format, options) output for a domain"""
+    schema = star_schema(key) if star else SCHEMAS[key]
+    return [open_writer(fmt, output_path(full_path, fmt), schema, **options) for fmt, options in outputs]
+
+def write_chunks(chunks, writers):
+    """Write DataFrame chunks to every writer, returning (rows, columns)"""
+    n_rows, n_columns = 0, 0
+    with ExitStack() as stack:
+        for writer in writers:
+            stack.enter_context(writer)
+        for df in chunks:
+            for writer in writers:
+                writer.write(df)
+            n_rows += len(df)
+            n_columns = len(df.columns)
+    return n_rows, n_columns
+
+# Rows generated to estimate per-chunk memory; sizes scale linearly with rows
+MEMORY_SAMPLE_ROWS = 10_000
+
+def chunk_memory(key, rows, seed=SEED, sample_rows=MEMORY_SAMPLE_ROWS):
+    """
+    Estimated deep in-memory bytes of a chunk of rows rows, (default, compact)
+
+    Measured on a small sample and scaled up, so reporting never builds a
+    full-size default chunk next to a compact run.
+    """
+    sample = min(rows, sample_rows)
+    return tuple(generate_chunk(key, 1, sample, seed, compact).memory_usage(deep=True).sum() * rows / sample
+                 for compact in (False, True))
+
+# =============================================================================
+# PARALLEL GENERATION
+# =============================================================================
+def _write_chunk_part(key, start_id, rows, seed, compact, date_range, star, scenario, parts):
+    """Pool task: generate one chunk and write it to a part file per output format"""
+    df = generate_chunk(key, start_id, rows, seed, compact, date_range, star, scenario)
+    schema = star_schema(key) if star else SCHEMAS[key]
+    for fmt, part_path, options in parts:
+        with open_writer(fmt, part_path, schema, **options) as writer:
+            writer.write(df)
+    return len(df), len(df.columns)
+
+def _part_specs(full_path, outputs, start_id):
+    """(format, part path, options) for each output of one chunk"""
+    specs = []
+    for fmt, options in outputs:
+        if fmt == 'csv':
+            # Only the first part of a new CSV carries the header row
+            options = dict(options, header=(start_id == 1), append=False)
+        specs.append((fmt, f'{output_path(full_path, fmt)}.part{start_id:012d}', options))
+    return specs
+
+def generate_parallel(jobs, outputs, chunk_size, seed, workers, compact=False, star=False, scenario=None):
+    """
+    Generate several domains across a process pool
+
+    jobs is a list of (key, full_path, first_id, n_records, date_range). Every chunk of every domain
+    is a separate task that writes one part file per output format; parts are
+    then appended in order, so the result matches a single-process run with
+    the same seed and chunk size. Returns {key: (rows, columns)}.
+
+    CSV parts are appended byte for byte, but Parquet and Feather parts are
+    decoded and compressed again by this (parent) process, one at a time;
+    for those formats only generation runs in parallel, not serialization
+    (benchmark_formats.py reports the cost as merge time).
+    """
+    results = {}
+    tasks = []
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            try:
+                for key, full_path, first_id, n_records, date_range in jobs:
+                    chunks = []
+                    for start_id, rows in chunk_bounds(n_records, chunk_size, first_id):
+                        parts = _part_specs(full_path, outputs, start_id)
+                        future = pool.submit(_write_chunk_part, key, start_id, rows, seed, compact, date_range,
+                                             star, scenario, parts)
+                        chunks.append((parts, future))
+                    tasks.append((key, full_path, chunks))
+
+                for key, full_path, chunks in tasks:
+                    n_rows, n_columns = 0, 0
+                    with ExitStack() as stack:
+                        writers = [stack.enter_context(w) for w in open_writers(key, full_path, outputs, star)]
+                        for parts, future in chunks:
+                            rows, n_columns = future.result()
+                            n_rows += rows
+                            for writer, (_, part_path, _) in zip(writers, parts):
+                                writer.append_part(part_path)
+                                os.remove(part_path)
+                    results[key] = (n_rows, n_columns)
+            except BaseException:
+                pool.shutdown(cancel_futures=True)
+                raise
+    finally:
+        for _, _, chunks in tasks:
+            for parts, _ in chunks:
+                for _, part_path, _ in parts:
+                    if os.path.exists(part_path):
+                        os.remove(part_path)
+
+    return results
+
 # =============================================================================
 # MAIN EXECUTION
 # =============================================================================
-def main():
-    """Generate all datasets and save to CSV"""
+def main(argv=None):
+    """Generate all datasets and stream them to CSV (or Parquet/Feather) chunk by chunk"""
+    parser = generate_parser()
+    args = parser.parse_args(argv)
+
+    if args.incremental and args.formats != ['csv']:
+        parser.error('--incremental appends to CSV output only')
+    if args.star_schema and (args.incremental or args.rollups):
+        parser.error('--star-schema writes a full snapshot; it cannot be combined with --incremental or --rollups')
+
+    scenario_config = scenario = None
+    if args.scenario:
+        scenario_config = load_scenario(args.scenario)
+        try:
+            scenario = compile_scenario(scenario_config)
+        except (KeyError, ValueError) as error:
+            parser.error(f"{args.scenario}: {error}")
+        if args.star_schema and (scenario.key_count('customer_id') or 0) > CUSTOMER_COUNT:
+            parser.error(f'--star-schema: the customer dimension holds {CUSTOMER_COUNT:,} customers')
+
+    outputs = []
+    for fmt in args.formats:
+        options = {'append': True} if args.incremental else {}
+        if fmt != 'csv' and args.compression:
+            options['compression'] = args.compression
+        if fmt == 'parquet':
+            options['row_group_size'] = args.row_group_size
+        outputs.append((fmt, options))
+
     base_path = get_base_path()
 
     print("=" * 60)
     print("Enterprise Intelligence Platform - Data Generation")
     print("=" * 60)
-
-    datasets = [
-        ('Sales', generate_sales_data, 'sales/sales_data.csv'),
-        ('HR', generate_hr_data, 'hr/hr_data.csv'),
-        ('Finance', generate_finance_data, 'finance/finance_data.csv'),
-        ('Operations', generate_operations_data, 'healthcare/operations_data.csv'),
-        ('Supply Chain', generate_supply_chain_data, 'supply_chain/supply_chain_data.csv'),
-        ('Fraud', generate_fraud_data, 'fraud/fraud_data.csv'),
-        ('Public Impact', generate_public_impact_data, 'public_impact/public_impact_data.csv'),
-    ]
-
-    for name, generator, filepath in datasets:
-        print(f"\nGenerating {name} data...")
-        df = generator()
+    if scenario is not None:
+        print(f"Scenario: {scenario.name} (scale {scenario.scale_factor:g}x)")
+
+    manifest = load_manifest(base_path)
+    plans = []
+    for key, name, _, filepath in DATASETS:
+        if args.domains and key not in args.domains:
+            continue
         full_path = os.path.join(base_path, filepath)
-        df.to_csv(full_path, index=False)
-        print(f"  Saved: {filepath}")
-        print(f"  Records: {len(df):,}")
-        print(f"  Columns: {len(df.columns)}")
+        records, start_date, end_date, scale = args.records, args.start_date, args.end_date, 1.0
+        if scenario is not None:
+            scenario_start, scenario_end = scenario.window(key)
+            records = records or scenario.records(key)
+            start_date, end_date = start_date or scenario_start, end_date or scenario_end
+            scale = scenario.scale(key)
+        plan = plan_job(key, full_path, manifest, records, start_date, end_date, args.incremental, scale)
+        if plan is None:
+            print(f"\n{name}: already covers the requested dates, nothing to append")
+            continue
+        if args.star_schema:
+            filepath, full_path = fact_path(filepath), fact_path(full_path)
+        plans.append((key, name, filepath, full_path, *plan))
+
+    if scenario is not None:
+        # A one-row dry run rejects derived columns under 'columns' and bad expressions up front
+        for key, _, _, _, _, _, date_range, _ in plans:
+            try:
+                generate_chunk(key, 1, 1, args.seed, args.compact, date_range, scenario=scenario_config)
+            except (NameError, SyntaxError, TypeError, ValueError) as error:
+                parser.error(f"{args.scenario}: {error}")
+
+    if args.star_schema:
+        # One date dimension covering every domain's window, whichever domains run
+        date_range = (min([HR_START_DATE] + [plan[6][0] for plan in plans]),
+                      max([END_DATE] + [plan[6][1] for plan in plans]))
+        print("\nDimensions:")
+        for path, n_rows in write_dimensions(base_path, outputs, date_range, args.seed):
+            print(f"  Saved: {os.path.relpath(path, base_path)} ({n_rows:,} rows)")
+
+    if args.workers > 1:
+        print(f"\nGenerating {len(plans)} domains with {args.workers} workers...")
+        jobs = [(key, full_path, first_id, n_records, date_range)
+                for key, _, _, full_path, first_id, n_records, date_range, _ in plans]
+        results = generate_parallel(jobs, outputs, args.chunk_size, args.seed, args.workers, args.compact,
+                                    args.star_schema, scenario_config)
+    else:
+        results = {}
+        for key, name, _, full_path, first_id, n_records, date_range, _ in plans:
+            print(f"\nGenerating {name} data...")
+            chunks = iter_chunks(key, n_records, args.chunk_size, args.seed, args.compact, first_id, date_range,
+                                 args.star_schema, scenario_config)
+            results[key] = write_chunks(chunks, open_writers(key, full_path, outputs, args.star_schema))
+
+    if args.compact:
+        print(f"\nIn-memory size per chunk, estimated from {MEMORY_SAMPLE_ROWS:,} rows (default -> compact):")
+        for key, name, _, _, _, n_records, _, _ in plans:
+            before, after = chunk_memory(key, min(args.chunk_size, n_records), args.seed)
+            print(f"  {name:<14} {before / 1e6:>9.2f} MB -> {after / 1e6:>8.2f} MB  ({before / after:.1f}x)")
+
+    for key, name, filepath, full_path, first_id, _, (start_date, end_date), state in plans:
+        n_rows, n_columns = results[key]
+        if state is not None:
+            n_rows_total = state['rows'] + n_rows
+            start_date = min(start_date, parse_date(state['first_date']))
+            end_date = max(end_date, parse_date(state['last_date']))
+        else:
+            n_rows_total = n_rows
+        # The manifest tracks the wide CSVs that --incremental appends to
+        if not args.star_schema and 'csv' in args.formats:
+            record_dataset(manifest, key, filepath, output_path(full_path, 'csv'), n_rows_total,
+                           first_id + n_rows - 1, start_date, end_date, args.seed)
+
+        print(f"\n{name}:")
+        for fmt in args.formats:
+            print(f"  {'Appended' if state is not None else 'Saved'}: {output_path(filepath, fmt)}")
+        print(f"  Records: {n_rows:,}" + (f" (IDs from {first_id:,}, {n_rows_total:,} total)" if state else ""))
+        print(f"  Columns: {n_columns}")
+
+    save_manifest(base_path, manifest)
+
+    if args.rollups:
+        # rollups.py builds on this module, so it is only loaded when asked for
+        from rollups import write_rollups
+        source_format = next(f for f in ('parquet', 'feather', 'csv') if f in args.formats)
+        print("\nRollups:")
+        for key, _, _, full_path, *_ in plans:
+            for path, n_groups in write_rollups(key, full_path, source_format, args.chunk_size):
+                print(f"  Saved: {os.path.relpath(path, base_path)} ({n_groups:,} rows)")
 
     print("\n" + "=" * 60)
     print("Data generation complete!")
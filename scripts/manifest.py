@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Dataset Manifest
+Tracks row counts, last IDs and covered date windows for incremental generation
+"""
+
+from datetime import datetime
+import json
+import os
+
+from datasets import write_json_atomic
+
+MANIFEST_FILE = 'manifest.json'
+DATE_FORMAT = '%Y-%m-%d'
+
+def manifest_path(base_path):
+    """Location of the manifest inside the data folder"""
+    return os.path.join(base_path, MANIFEST_FILE)
+
+def load_manifest(base_path):
+    """Load the manifest, or an empty one if none has been written yet"""
+    path = manifest_path(base_path)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def save_manifest(base_path, manifest):
+    """Write the manifest atomically so an interrupted run never leaves it half-written"""
+    write_json_atomic(manifest_path(base_path), manifest, sort_keys=True)
+
+def parse_date(value):
+    """Parse a YYYY-MM-DD string into a datetime"""
+    return datetime.strptime(value, DATE_FORMAT)
+
+def scan_dataset(full_path, id_column, date_column, chunk_size=1_000_000):
+    """
+    Recover a dataset's state by streaming its ID and date columns once
+
+    Used when a CSV predates the manifest. IDs are read as the number after
+    the last '-' (TXN-000123 -> 123).
+    """
+    import pandas as pd
+
+    rows, last_id, first_date, last_date = 0, 0, None, None
+    for chunk in pd.read_csv(full_path, usecols=[id_column, date_column], chunksize=chunk_size):
+        if chunk.empty:
+            continue
+        rows += len(chunk)
+        last_id = max(last_id, int(chunk[id_column].str.rsplit('-', n=1).str[-1].astype('int64').max()))
+        dates = pd.to_datetime(chunk[date_column])
+        first_date = dates.min() if first_date is None else min(first_date, dates.min())
+        last_date = dates.max() if last_date is None else max(last_date, dates.max())
+
+    if rows == 0:
+        return None
+    return {
+        'rows': rows,
+        'last_id': last_id,
+        'first_date': first_date.strftime(DATE_FORMAT),
+        'last_date': last_date.strftime(DATE_FORMAT),
+    }
+
+def file_signature(full_path):
+    """(size, mtime_ns) of a file, used to tell whether a manifest entry still describes it"""
+    stat = os.stat(full_path)
+    return stat.st_size, stat.st_mtime_ns
+
+def matches_file(entry, full_path):
+    """True if a manifest entry was recorded for the file at full_path as it is now"""
+    return (os.path.exists(full_path) and
+            (entry.get('size'), entry.get('mtime_ns')) == file_signature(full_path))
+
+def dataset_state(manifest, key, full_path, id_column, date_column):
+    """
+    Manifest entry for a domain, falling back to a scan of its CSV; None if nothing exists
+
+    The entry is trusted only while the CSV's size and mtime match the ones
+    recorded with it, so a file rewritten by another run or cut short by a
+    crash mid-append is rescanned instead of continuing from stale IDs.
+    """
+    if not os.path.exists(full_path):
+        return None
+    entry = manifest.get(key)
+    if entry is not None and matches_file(entry, full_path):
+        return entry
+    return scan_dataset(full_path, id_column, date_column)
+
+def record_dataset(manifest, key, filepath, full_path, rows, last_id, first_date, last_date, seed):
+    """Store the state of a domain after a run, along with its CSV's size and mtime"""
+    size, mtime_ns = file_signature(full_path)
+    manifest[key] = {
+        'path': filepath,
+        'size': size,
+        'mtime_ns': mtime_ns,
+        'rows': rows,
+        'last_id': last_id,
+        'first_date': first_date.strftime(DATE_FORMAT),
+        'last_date': last_date.strftime(DATE_FORMAT),
+        'seed': seed,
+        'updated_at': datetime.now().isoformat(timespec='seconds'),
+    }
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Mock Tableau Server
+In-memory stand-in for the Tableau REST API endpoints the publishing scripts use,
+so batch publishing and refreshes can be exercised without a real server
+"""
+
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import argparse
+import re
+import threading
+import time
+import uuid
+
+API_VERSION = '3.19'
+XMLNS = 'http://tableau.com/api'
+
+# =============================================================================
+# SERVER STATE
+# =============================================================================
+class MockState:
+    """Projects, content, upload sessions and jobs held in memory"""
+
+    def __init__(self, fail_every=0, latency=0.0, job_seconds=1.0):
+        self.lock = threading.Lock()
+        self.site_id = str(uuid.uuid4())
+        self.user_id = str(uuid.uuid4())
+        self.projects = {str(uuid.uuid4()): 'default'}
+        self.content = {'workbook': {}, 'datasource': {}}
+        self.uploads = {}
+        self.jobs = {}
+        self.fail_every = fail_every
+        self.latency = latency
+        self.job_seconds = job_seconds
+        self.requests = 0
+        self.signins = 0
+
+    def should_fail(self):
+        """Every fail_every-th publish/refresh request gets a 503"""
+        with self.lock:
+            self.requests += 1
+            return self.fail_every and self.requests % self.fail_every == 0
+
+    def publish(self, kind, name, project_id, size):
+        with self.lock:
+            for item_id, item in self.content[kind].items():
+                if item['name'] == name and item['project_id'] == project_id:
+                    item['size'] = size
+                    return item_id, item
+            item_id = str(uuid.uuid4())
+            self.content[kind][item_id] = {'name': name, 'project_id': project_id, 'size': size}
+            return item_id, self.content[kind][item_id]
+
+    def start_job(self, kind, item_id):
+        with self.lock:
+            job_id = str(uuid.uuid4())
+            self.jobs[job_id] = {'kind': kind, 'item_id': item_id, 'created': time.time()}
+            return job_id, self.jobs[job_id]
+
+def _timestamp(seconds):
+    return datetime.fromtimestamp(seconds, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+def _request_payload(body):
+    """Name and project id from the tsRequest part of a publish body"""
+    payload = re.search(rb'<tsRequest>.*?</tsRequest>', body, re.S)
+    payload = payload.group(0).decode() if payload else ''
+    name = re.search(r'name="([^"]*)"', payload)
+    project = re.search(r'<project id="([^"]*)"', payload)
+    return (name.group(1) if name else 'Untitled'), (project.group(1) if project else None)
+
+def _file_size(body):
+    """Size of the tableau_file / tableau_datasource part of a multipart body"""
+    part = re.search(rb'name="(?:tableau_workbook|tableau_datasource|tableau_file)"[^\r\n]*\r\n'
+                     rb'(?:[^\r\n]+\r\n)*\r\n(.*)\r\n--', body, re.S)
+    return len(part.group(1)) if part else 0
+
+# =============================================================================
+# REQUEST HANDLER
+# =============================================================================
+class MockTableauHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    state = None
+    quiet = False
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+    def handle(self):
+        try:
+            super().handle()
+        except ConnectionResetError:
+            pass  # the client dropped a keep-alive connection
+
+    def _send(self, status, inner=''):
+        body = f'<?xml version="1.0" encoding="UTF-8"?><tsResponse xmlns="{XMLNS}">{inner}</tsResponse>'.encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/xml')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status, code, summary):
+        self._send(status, f'<error code="{code}"><summary>{summary}</summary><detail>{summary}</detail></error>')
+
+    def _body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length) if length else b''
+
+    def _route(self, method):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        path = re.sub(r'^/api/[\d.]+', '', url.path)
+        body = self._body() if method in ('POST', 'PUT') else b''
+        state = self.state
+
+        if path == '/serverInfo':
+            return self._send(200, f'<serverInfo><productVersion build="mock">2023.3</productVersion>'
+                                   f'<restApiVersion>{API_VERSION}</restApiVersion></serverInfo>')
+        if path == '/auth/signin':
+            with state.lock:
+                state.signins += 1
+            return self._send(200, f'<credentials token="{uuid.uuid4().hex}"><site id="{state.site_id}" '
+                                   f'contentUrl=""/><user id="{state.user_id}"/></credentials>')
+        if path == '/auth/signout':
+            return self._send(204)
+
+        match = re.match(r'^/sites/[^/]+(/.*)$', path)
+        if not match:
+            return self._error(404, '404000', 'Resource not found')
+        path = match.group(1)
+        if state.latency and method in ('POST', 'PUT'):
+            time.sleep(state.latency)
+
+        if path == '/projects' and method == 'GET':
+            return self._list_projects(query)
+        if path == '/projects' and method == 'POST':
+            name, _ = _request_payload(body)
+            with state.lock:
+                project_id = str(uuid.uuid4())
+                state.projects[project_id] = name
+            return self._send(201, f'<project id="{project_id}" name="{name}"/>')
+
+        if path == '/fileUploads' and method == 'POST':
+            upload_id = uuid.uuid4().hex
+            state.uploads[upload_id] = 0
+            return self._send(201, f'<fileUpload uploadSessionId="{upload_id}" fileSize="0"/>')
+        match = re.match(r'^/fileUploads/(\w+)$', path)
+        if match and method == 'PUT':
+            state.uploads[match.group(1)] += _file_size(body)
+            size_mb = state.uploads[match.group(1)] // 2 ** 20
+            return self._send(200, f'<fileUpload uploadSessionId="{match.group(1)}" fileSize="{size_mb}"/>')
+
+        match = re.match(r'^/(workbooks|datasources)$', path)
+        if match and method == 'POST':
+            if state.should_fail():
+                return self._error(503, '503000', 'Service temporarily unavailable')
+            kind = match.group(1)[:-1]
+            name, project_id = _request_payload(body)
+            size = state.uploads.pop(query['uploadSessionId'], 0) if 'uploadSessionId' in query else _file_size(body)
+            item_id, item = state.publish(kind, name, project_id, size)
+            return self._send(201, self._content_xml(kind, item_id, item))
+        if match and method == 'GET':
+            return self._list_content(match.group(1)[:-1], query)
+
+        match = re.match(r'^/(workbooks|datasources)/([\w-]+)/refresh$', path)
+        if match and method == 'POST':
+            if state.should_fail():
+                return self._error(503, '503000', 'Service temporarily unavailable')
+            kind = match.group(1)[:-1]
+            if match.group(2) not in state.content[kind]:
+                return self._error(404, '404004', f'{kind} not found')
+            job_id, job = state.start_job(kind, match.group(2))
+            return self._send(202, self._job_xml(job_id, job))
+
+        match = re.match(r'^/jobs/([\w-]+)$', path)
+        if match and method == 'GET':
+            job = state.jobs.get(match.group(1))
+            if job is None:
+                return self._error(404, '404005', 'Job not found')
+            return self._send(200, self._job_xml(match.group(1), job))
+
+        return self._error(404, '404000', f'Unsupported: {method} {path}')
+
+    def _list_projects(self, query):
+        page_size = int(query.get('pageSize', 100))
+        page_number = int(query.get('pageNumber', 1))
+        projects = sorted(self.state.projects.items(), key=lambda p: p[1])
+        page = projects[(page_number - 1) * page_size:page_number * page_size]
+        items = ''.join(f'<project id="{pid}" name="{name}"/>' for pid, name in page)
+        self._send(200, f'<pagination pageNumber="{page_number}" pageSize="{page_size}" '
+                        f'totalAvailable="{len(projects)}"/><projects>{items}</projects>')
+
+    def _list_content(self, kind, query):
+        name_filter = re.match(r'name:eq:(.*)', query.get('filter', ''))
+        items = [(item_id, item) for item_id, item in self.state.content[kind].items()
+                 if not name_filter or item['name'] == name_filter.group(1)]
+        inner = ''.join(self._content_xml(kind, item_id, item) for item_id, item in items)
+        self._send(200, f'<pagination pageNumber="1" pageSize="{max(len(items), 1)}" '
+                        f'totalAvailable="{len(items)}"/><{kind}s>{inner}</{kind}s>')
+
+    def _content_xml(self, kind, item_id, item):
+        project_name = self.state.projects.get(item['project_id'], '')
+        return (f'<{kind} id="{item_id}" name="{item["name"]}" size="{item["size"]}">'
+                f'<project id="{item["project_id"]}" name="{project_name}"/>'
+                f'<owner id="{self.state.user_id}"/></{kind}>')
+
+    def _job_xml(self, job_id, job):
+        done = time.time() - job['created'] >= self.state.job_seconds
+        finished = f' finishCode="0" completedAt="{_timestamp(time.time())}"' if done else ''
+        return (f'<job id="{job_id}" mode="Asynchronous" type="RefreshExtract" '
+                f'progress="{100 if done else 50}" createdAt="{_timestamp(job["created"])}"{finished}/>')
+
+    def do_GET(self):
+        self._route('GET')
+
+    def do_POST(self):
+        self._route('POST')
+
+    def do_PUT(self):
+        self._route('PUT')
+
+def start_mock_server(port=0, fail_every=0, latency=0.0, job_seconds=1.0, quiet=True):
+    """Start the mock server on a background thread; returns (server, base_url)"""
+    handler = type('Handler', (MockTableauHandler,), {
+        'state': MockState(fail_every, latency, job_seconds),
+        'quiet': quiet,
+    })
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_address[1]}'
+
+# =============================================================================
+# MAIN EXECUTION
+# =============================================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run a local mock of the Tableau REST API')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on (default: 8765)')
+    parser.add_argument('--fail-every', type=int, default=0,
+                        help='Answer every Nth publish/refresh request with a 503 (default: never)')
+    parser.add_argument('--latency', type=float, default=0.0, help='Seconds added to every write request')
+    parser.add_argument('--job-seconds', type=float, default=1.0, help='Seconds before a refresh job completes')
+    args = parser.parse_args(argv)
+
+    server, url = start_mock_server(args.port, args.fail_every, args.latency, args.job_seconds, quiet=False)
+    print(f"Mock Tableau Server listening on {url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 """
 Publish workbooks and data sources to Tableau Server/Cloud
-Requires: tableauserverclient package
+Requires: tableauserverclient package (imported on first use, so usage and
+--help stay fast)
 """
 
-import tableauserverclient as TSC
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+import json
+import sys
 import os
 import argparse
 
@@ -20,6 +25,7 @@ def publish_to_tableau(server_url, token_name, token_value, site_id, project_nam
         project_name: Target project name
         workbook_path: Path to .twbx file
     """
+    import tableauserverclient as TSC
 
     # Authenticate using Personal Access Token
     tableau_auth = TSC.PersonalAccessTokenAuth(token_name, token_value, site_id)
@@ -28,14 +34,8 @@ def publish_to_tableau(server_url, token_name, token_value, site_id, project_nam
     with server.auth.sign_in(tableau_auth):
         print(f"Signed in to {server_url}")
 
-        # Find the project
-        all_projects, _ = server.projects.get()
-        project = next((p for p in all_projects if p.name == project_name), None)
-
-        if not project:
-            print(f"Project '{project_name}' not found. Creating...")
-            new_project = TSC.ProjectItem(name=project_name)
-            project = server.projects.create(new_project)
+        # Find the project (searching every page), creating it if missing
+        project = ProjectCache(server).get(project_name)
 
         print(f"Publishing to project: {project.name}")
 
@@ -47,27 +47,218 @@ def publish_to_tableau(server_url, token_name, token_value, site_id, project_nam
         print(f"Workbook ID: {workbook.id}")
         print(f"URL: {server_url}/#/workbooks/{workbook.id}")
 
-def main():
-    parser = argparse.ArgumentParser(description='Publish Tableau workbook to Server/Cloud')
+# =============================================================================
+# BATCH PUBLISHING
+# =============================================================================
+def is_transient(error):
+    """True for errors worth retrying: 5xx, 429 throttling, dropped connections and timeouts"""
+    import requests
+    import tableauserverclient as TSC
+    from tableauserverclient.server.endpoint.exceptions import InternalServerError
+
+    if isinstance(error, (InternalServerError, requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+        return True
+    if isinstance(error, TSC.ServerResponseError):
+        return str(error.code).startswith(('429', '5'))
+    return False
+
+def with_retries(action, retries=3, backoff=1.0):
+    """Run action(), retrying transient errors with exponential backoff; returns (result, attempts)"""
+    for attempt in range(retries + 1):
+        try:
+            return action(), attempt + 1
+        except Exception as error:
+            if attempt == retries or not is_transient(error):
+                raise
+            delay = backoff * 2 ** attempt
+            print(f"  Transient error ({error.__class__.__name__}), retrying in {delay:.1f}s...")
+            time.sleep(delay)
+
+class ProjectCache:
+    """Every project on the site, listed once across all pages; creation is serialized across threads"""
+
+    def __init__(self, server):
+        import tableauserverclient as TSC
+
+        self.server = server
+        self._lock = threading.Lock()
+        self._projects = {project.name: project for project in TSC.Pager(server.projects)}
+
+    def get(self, name):
+        import tableauserverclient as TSC
+
+        with self._lock:
+            project = self._projects.get(name)
+            if project is None:
+                print(f"Project '{name}' not found. Creating...")
+                project = self.server.projects.create(TSC.ProjectItem(name=name))
+                self._projects[name] = project
+            return project
+
+def load_publish_manifest(manifest_path, default_project):
+    """
+    Read a batch manifest (JSON)
+
+    {"project": "Enterprise Intelligence",
+     "items": [{"type": "workbook", "path": "../tableau/sales.twbx"},
+               {"type": "datasource", "path": "../data/sales/sales_data.parquet", "name": "Sales"}]}
+
+    Items may override project, name and mode (Overwrite/CreateNew/Append).
+    Relative paths are resolved against the manifest's folder.
+    """
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+
+    items = []
+    for entry in manifest['items']:
+        item = {'project': manifest.get('project', default_project), 'mode': 'Overwrite', 'name': None, **entry}
+        if item['type'] not in ('workbook', 'datasource'):
+            raise ValueError(f"Unknown item type '{item['type']}' in {manifest_path}")
+        item['path'] = os.path.join(base_dir, item['path'])
+        items.append(item)
+    return items
+
+def publish_item(server, projects, item):
+    """Publish one workbook or data source manifest item, returning the published item"""
+    import tableauserverclient as TSC
+
+    project = projects.get(item['project'])
+    mode = getattr(TSC.Server.PublishMode, item['mode'])
+    if item['type'] == 'workbook':
+        return server.workbooks.publish(TSC.WorkbookItem(project.id, name=item['name']), item['path'], mode=mode)
+    return server.datasources.publish(TSC.DatasourceItem(project.id, name=item['name']), item['path'], mode=mode)
+
+def publish_batch(server_url, token_name, token_value, site_id, items, workers=4, retries=3, backoff=1.0):
+    """
+    Publish many workbooks/data sources with a single sign-in
+
+    Projects are listed once and cached; uploads run in a bounded thread
+    pool sharing the signed-in session. Returns one result dict per item.
+    """
+    import tableauserverclient as TSC
+
+    tableau_auth = TSC.PersonalAccessTokenAuth(token_name, token_value, site_id)
+    server = TSC.Server(server_url, use_server_version=True)
+
+    def run(item):
+        start = time.perf_counter()
+        result = {'type': item['type'], 'path': item['path'], 'project': item['project']}
+        try:
+            published, attempts = with_retries(lambda: publish_item(server, projects, item), retries, backoff)
+            result.update(status='published', id=published.id, name=published.name, attempts=attempts)
+        except Exception as error:
+            result.update(status='failed', error=str(error).strip())
+        result['seconds'] = round(time.perf_counter() - start, 3)
+        print(f"  [{result['status']}] {os.path.basename(item['path'])} ({result['seconds']:.2f}s)")
+        return result
+
+    with server.auth.sign_in(tableau_auth):
+        print(f"Signed in to {server_url}")
+        projects = ProjectCache(server)
+        print(f"Publishing {len(items)} items with {workers} workers...")
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(run, items))
+
+    return results
+
+def print_batch_report(results, total_seconds):
+    """Per-item timings followed by a one-line summary"""
+    print("\n" + "=" * 60)
+    print(f"{'status':<10}{'type':<12}{'seconds':>9}{'tries':>7}  item")
+    for r in results:
+        print(f"{r['status']:<10}{r['type']:<12}{r['seconds']:>9.2f}{r.get('attempts', '-'):>7}  "
+              f"{os.path.basename(r['path'])}")
+        if r['status'] == 'failed':
+            print(f"{'':<10}{r['error'].splitlines()[0]}")
+    failed = sum(r['status'] == 'failed' for r in results)
+    print(f"\n{len(results) - failed}/{len(results)} published in {total_seconds:.2f}s")
+    print("=" * 60)
+
+# =============================================================================
+# VALIDATION GATE
+# =============================================================================
+def validation_problems(report_path, domains=None):
+    """
+    Domains a validate_data.py report blocks from publishing, as {key: reason}
+
+    A domain is blocked when its checks failed (warnings too if the report
+    was strict), when it is missing from the report, or when its file has
+    changed since it was validated. With domains=None every domain in the
+    report is checked.
+    """
+    with open(report_path) as f:
+        report = json.load(f)
+    strict = report.get('strict', False)
+    problems = {}
+    for key in report['domains'] if domains is None else domains:
+        entry = report['domains'].get(key)
+        if entry is None:
+            problems[key] = 'not in the validation report'
+            continue
+        failed = [c['name'] for c in entry['checks']
+                  if not c['passed'] and (c['severity'] == 'error' or strict)]
+        if failed:
+            problems[key] = f"failed {', '.join(failed)}"
+        elif not os.path.exists(entry['file']):
+            problems[key] = f"{entry['file']} no longer exists"
+        else:
+            stat = os.stat(entry['file'])
+            if (stat.st_size, stat.st_mtime_ns) != (entry['size'], entry['mtime_ns']):
+                problems[key] = f"{os.path.basename(entry['file'])} changed since validation"
+    return problems
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        print_usage()
+        return
+
+    parser = argparse.ArgumentParser(description='Publish Tableau workbooks and data sources to Server/Cloud')
     parser.add_argument('--server', required=True, help='Tableau Server URL')
     parser.add_argument('--token-name', required=True, help='Personal Access Token name')
     parser.add_argument('--token-value', required=True, help='Personal Access Token value')
     parser.add_argument('--site', default='', help='Site ID (default: empty for default site)')
     parser.add_argument('--project', default='Enterprise Intelligence', help='Target project name')
-    parser.add_argument('--workbook', required=True, help='Path to .twbx file')
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument('--workbook', help='Path to .twbx file')
+    target.add_argument('--manifest', help='JSON manifest of workbooks/data sources to publish in one batch')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent uploads in batch mode (default: 4)')
+    parser.add_argument('--retries', type=int, default=3, help='Retries per item on transient errors (default: 3)')
+    parser.add_argument('--backoff', type=float, default=1.0, help='Initial retry delay in seconds, doubled each retry')
+    parser.add_argument('--require-valid', metavar='REPORT',
+                        help='Refuse to publish unless this validate_data.py report passes for every dataset')
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
-    publish_to_tableau(
-        args.server,
-        args.token_name,
-        args.token_value,
-        args.site,
-        args.project,
-        args.workbook
-    )
+    if args.require_valid:
+        problems = validation_problems(args.require_valid)
+        if problems:
+            print(f"Refusing to publish, {args.require_valid} does not pass:")
+            for key, reason in problems.items():
+                print(f"  {key}: {reason}")
+            sys.exit(1)
 
-if __name__ == "__main__":
+    if args.workbook:
+        publish_to_tableau(
+            args.server,
+            args.token_name,
+            args.token_value,
+            args.site,
+            args.project,
+            args.workbook
+        )
+        return
+
+    items = load_publish_manifest(args.manifest, args.project)
+    start = time.perf_counter()
+    results = publish_batch(args.server, args.token_name, args.token_value, args.site, items,
+                            args.workers, args.retries, args.backoff)
+    print_batch_report(results, time.perf_counter() - start)
+    if any(r['status'] == 'failed' for r in results):
+        sys.exit(1)
+
+def print_usage():
     print("=" * 60)
     print("Tableau Publishing Script")
     print("=" * 60)
@@ -78,5 +269,11 @@ if __name__ == "__main__":
     print("    --token-value 'your-token-value' \\")
     print("    --project 'Enterprise Intelligence' \\")
     print("    --workbook ./tableau/enterprise_dashboard.twbx")
+    print("\nBatch mode (one sign-in, concurrent uploads with retries):")
+    print("  python publish_to_tableau.py --server ... --token-name ... --token-value ... \\")
+    print("    --manifest publish_manifest.example.json --workers 8")
     print("\nFor Tableau Public, use the desktop app to publish directly.")
     print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,8 @@ SITE_ID="${TABLEAU_SITE:-}"
 USERNAME="${TABLEAU_USER:-}"
 PASSWORD="${TABLEAU_PASSWORD:-}"
 WORKBOOK_NAME="Enterprise_Intelligence_Platform"
+# Set to 1 after `generate_data.py --incremental` to refresh only the appended rows
+INCREMENTAL="${TABLEAU_INCREMENTAL:-0}"
 
 echo "=============================================="
 echo "Tableau Extract Refresh Script"
@@ -34,7 +36,11 @@ fi
 
 # Refresh extracts
 echo "Refreshing extracts for: $WORKBOOK_NAME"
-tabcmd refreshextracts --workbook "$WORKBOOK_NAME"
+if [ "$INCREMENTAL" = "1" ]; then
+    tabcmd refreshextracts --workbook "$WORKBOOK_NAME" --incremental
+else
+    tabcmd refreshextracts --workbook "$WORKBOOK_NAME"
+fi
 
 # Logout
 echo "Logging out..."
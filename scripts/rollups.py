@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Rollup Tables
+Materializes dashboard-level group-by cubes from each generated dataset in one pass
+"""
+
+import os
+
+import pandas as pd
+
+from cli import rollups_parser
+from datasets import DATASET_FILES, get_base_path
+from schemas import SCHEMAS, date_column
+from sketches import grouped_quantiles, merge_counts, sketch_counts
+from writers import iter_file_chunks, output_path
+
+# =============================================================================
+# CUBE DEFINITIONS
+# =============================================================================
+# Each cube groups by 'dimensions' and computes, per measure column, any of
+# sum / count / mean / min / max and percentiles written as p50, p90, p95, ...
+# Percentiles come from a mergeable sketch and are within 1% of the exact
+# value. 'month' (YYYY-MM) and 'year' are derived from the domain's date
+# column. Every cube also gets a row_count column.
+ROLLUPS = {
+    'sales': [
+        {
+            'name': 'revenue_by_region_product_month',
+            'dimensions': ['region', 'product', 'month'],
+            'measures': {
+                'revenue': ['sum', 'mean', 'p50', 'p90'],
+                'profit': ['sum'],
+                'profit_margin': ['mean'],
+                'quantity': ['sum'],
+            },
+        },
+        {
+            'name': 'revenue_by_segment_channel',
+            'dimensions': ['customer_segment', 'sales_channel'],
+            'measures': {
+                'revenue': ['sum', 'mean'],
+                'satisfaction_score': ['mean'],
+                'nps_score': ['mean'],
+            },
+        },
+    ],
+    'hr': [
+        {
+            'name': 'headcount_by_department_region',
+            'dimensions': ['department', 'region', 'employment_status'],
+            'measures': {
+                'salary': ['mean', 'p50', 'p90'],
+                'tenure_years': ['mean'],
+                'turnover_risk': ['mean'],
+                'satisfaction_score': ['mean'],
+            },
+        },
+    ],
+    'finance': [
+        {
+            'name': 'budget_variance_by_cost_center_quarter',
+            'dimensions': ['cost_center', 'year', 'quarter'],
+            'measures': {
+                'budget_amount': ['sum'],
+                'actual_amount': ['sum'],
+                'forecast_amount': ['sum'],
+                'variance': ['sum', 'mean'],
+                'variance_percent': ['mean', 'p50'],
+            },
+        },
+    ],
+    'healthcare': [
+        {
+            'name': 'wait_times_by_department_priority',
+            'dimensions': ['department', 'priority'],
+            'measures': {
+                'wait_time_minutes': ['mean', 'p50', 'p90', 'p95'],
+                'total_time_minutes': ['mean'],
+                'satisfaction_score': ['mean'],
+                'cost_per_case': ['sum', 'mean'],
+            },
+        },
+    ],
+    'supply_chain': [
+        {
+            'name': 'inventory_by_warehouse_product_month',
+            'dimensions': ['warehouse', 'product', 'month'],
+            'measures': {
+                'inventory_value': ['sum'],
+                'days_of_supply': ['mean', 'p50'],
+                'shortage_risk': ['mean'],
+                'supplier_delay_days': ['mean', 'max'],
+            },
+        },
+    ],
+    'fraud': [
+        {
+            'name': 'fraud_rate_by_merchant_device',
+            'dimensions': ['merchant_category', 'device_type'],
+            'measures': {
+                'is_fraud': ['sum', 'mean'],
+                'is_anomaly': ['mean'],
+                'amount': ['sum', 'p50', 'p95'],
+                'fraud_risk_score': ['mean', 'p90'],
+            },
+        },
+    ],
+    'public_impact': [
+        {
+            'name': 'budget_by_category_region_year',
+            'dimensions': ['category', 'region', 'year'],
+            'measures': {
+                'budget_allocated': ['sum'],
+                'budget_spent': ['sum'],
+                'target_achievement': ['mean'],
+                'population_affected': ['sum'],
+            },
+        },
+    ],
+}
+
+TIME_DIMENSIONS = ('month', 'year')
+
+# How partial aggregates from separate chunks combine
+_PARTIAL_AGGS = ('sum', 'count', 'min', 'max')
+_COMBINE = {'sum': 'sum', 'count': 'sum', 'min': 'min', 'max': 'max'}
+
+def _percentile(agg):
+    """'p90' -> 0.9, anything else -> None"""
+    if agg.startswith('p') and agg[1:].isdigit():
+        return int(agg[1:]) / 100
+    return None
+
+def add_time_dimensions(df, date_col, dimensions):
+    """Add the month/year columns a cube groups by, derived from date_col"""
+    dates = df[date_col]
+    if 'month' in dimensions and 'month' not in df:
+        df['month'] = dates.dt.strftime('%Y-%m')
+    if 'year' in dimensions and 'year' not in df:
+        df['year'] = dates.dt.year.astype('int16')
+    return df
+
+# =============================================================================
+# ROLLUP ENGINE
+# =============================================================================
+class RollupCube:
+    """Accumulates one cube over a stream of chunks; every chunk is read once"""
+
+    def __init__(self, name, dimensions, measures):
+        self.name = name
+        self.dimensions = list(dimensions)
+        self.measures = measures
+        self._partials = []
+        self._sketches = {}
+        # Partial aggregates needed to finish every requested statistic
+        self._needed = {}
+        for column, aggs in measures.items():
+            needed = set()
+            for agg in aggs:
+                if agg == 'mean':
+                    needed.update(('sum', 'count'))
+                elif agg in _PARTIAL_AGGS:
+                    needed.add(agg)
+                elif _percentile(agg) is not None:
+                    self._sketches[column] = []
+                else:
+                    raise ValueError(f"Unknown aggregation '{agg}' in rollup '{name}'")
+            self._needed[column] = sorted(needed)
+
+    def update(self, df):
+        """Fold one chunk into the cube"""
+        named = {'row_count': (self.dimensions[0], 'size')}
+        for column, needed in self._needed.items():
+            for agg in needed:
+                named[f'{column}__{agg}'] = (column, agg)
+        self._partials.append(df.groupby(self.dimensions, observed=True, sort=False).agg(**named))
+        for column, counts in self._sketches.items():
+            counts.append(sketch_counts(df, self.dimensions, column))
+
+        # Keep memory flat: collapse accumulated partials every few chunks
+        if len(self._partials) >= 16:
+            self._partials = [self._combine()]
+            for column in self._sketches:
+                self._sketches[column] = [merge_counts(self._sketches[column])]
+
+    def _combine(self):
+        partial = pd.concat(self._partials)
+        combine = {column: ('sum' if column == 'row_count' else _COMBINE[column.rsplit('__', 1)[1]])
+                   for column in partial.columns}
+        return partial.groupby(level=list(range(partial.index.nlevels)), observed=True).agg(combine)
+
+    def result(self):
+        """Finished cube as a flat DataFrame: dimensions, row_count, <measure>_<agg> columns"""
+        if not self._partials:
+            return pd.DataFrame(columns=self.dimensions + ['row_count'])
+        partial = self._combine()
+        out = pd.DataFrame({'row_count': partial['row_count']}, index=partial.index)
+        for column, aggs in self.measures.items():
+            quantiles = [_percentile(a) for a in aggs if _percentile(a) is not None]
+            estimates = grouped_quantiles(merge_counts(self._sketches[column]), quantiles) if quantiles else None
+            for agg in aggs:
+                if agg == 'mean':
+                    out[f'{column}_mean'] = partial[f'{column}__sum'] / partial[f'{column}__count']
+                elif agg in _PARTIAL_AGGS:
+                    out[f'{column}_{agg}'] = partial[f'{column}__{agg}']
+                else:
+                    out[f'{column}_{agg}'] = estimates[_percentile(agg)].reindex(out.index)
+        return out.round(4).reset_index().sort_values(self.dimensions, kind='stable')
+
+def build_rollups(key, chunks, cubes=None):
+    """Run every cube of a domain over one pass of chunks, returning {name: DataFrame}"""
+    cubes = [RollupCube(**cube) for cube in (cubes if cubes is not None else ROLLUPS[key])]
+    time_dims = {d for cube in cubes for d in cube.dimensions if d in TIME_DIMENSIONS}
+    for df in chunks:
+        df = add_time_dimensions(df, date_column(key), time_dims)
+        for cube in cubes:
+            cube.update(df)
+    return {cube.name: cube.result() for cube in cubes}
+
+def rollup_columns(key, cubes=None):
+    """Source columns the cubes of a domain need, so only those are read"""
+    needed = {date_column(key)}
+    for cube in (cubes if cubes is not None else ROLLUPS[key]):
+        needed.update(d for d in cube['dimensions'] if d not in TIME_DIMENSIONS)
+        needed.update(cube['measures'])
+    return [c for c in SCHEMAS[key] if c in needed]
+
+def rollup_dir(full_path):
+    """Rollups live in a rollups/ folder next to the raw dataset"""
+    return os.path.join(os.path.dirname(full_path), 'rollups')
+
+def write_rollups(key, full_path, input_format='csv', chunk_size=1_000_000):
+    """Stream one domain's dataset file once and write all of its cubes as CSV"""
+    source = output_path(full_path, input_format)
+    chunks = iter_file_chunks(source, SCHEMAS[key], chunk_size, columns=rollup_columns(key))
+    results = build_rollups(key, chunks)
+
+    out_dir = rollup_dir(full_path)
+    os.makedirs(out_dir, exist_ok=True)
+    written = []
+    for name, cube in results.items():
+        path = os.path.join(out_dir, f'{name}.csv')
+        cube.to_csv(path, index=False)
+        written.append((path, len(cube)))
+    return written
+
+# =============================================================================
+# MAIN EXECUTION
+# =============================================================================
+def main(argv=None):
+    parser = rollups_parser()
+    args = parser.parse_args(argv)
+
+    base_path = get_base_path()
+
+    print("=" * 60)
+    print("Enterprise Intelligence Platform - Rollups")
+    print("=" * 60)
+
+    for key, name, filepath in DATASET_FILES:
+        if args.domains and key not in args.domains:
+            continue
+        print(f"\n{name}:")
+        full_path = os.path.join(base_path, filepath)
+        for path, n_groups in write_rollups(key, full_path, args.input_format, args.chunk_size):
+            print(f"  Saved: {os.path.relpath(path, base_path)} ({n_groups:,} rows)")
+
+    print("\n" + "=" * 60)
+    print("Rollups complete!")
+    print("=" * 60)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Generation Scenarios
+Declarative scenario files (JSON, or YAML with PyYAML) that scale row counts,
+move date windows, swap column distributions and redefine derived columns,
+backed by column samplers that are compiled once and reused for every chunk
+"""
+
+from datetime import datetime
+from functools import lru_cache
+import json
+
+import numpy as np
+import pandas as pd
+
+from schemas import SCHEMAS, id_column, pandas_dtype
+
+# =============================================================================
+# COMPILED SAMPLERS
+# =============================================================================
+# Up to this many outcomes a weighted draw binary-searches a cached CDF, which
+# is exactly how rng.choice(p=...) draws; above it an alias table answers each
+# draw in O(1) (about 5x faster at 1,000 outcomes).
+ALIAS_THRESHOLD = 16
+
+def alias_table(weights):
+    """Vose alias table: (probability, alias) arrays for O(1) weighted draws"""
+    weights = np.asarray(weights, dtype=np.float64)
+    k = len(weights)
+    probability = weights * k / weights.sum()
+    alias = np.arange(k)
+    small = list(np.flatnonzero(probability < 1))
+    large = list(np.flatnonzero(probability >= 1))
+    while small and large:
+        low, high = small.pop(), large.pop()
+        alias[low] = high
+        probability[high] -= 1 - probability[low]
+        (small if probability[high] < 1 else large).append(high)
+    # Leftovers are 1 up to rounding
+    probability[small + large] = 1.0
+    return probability, alias
+
+def draw_codes(rng, n_records, cdf=None, alias=None, k=None):
+    """Draw outcome indices from a precomputed CDF, alias table, or uniformly over k"""
+    if cdf is not None:
+        return cdf.searchsorted(rng.random(n_records), side='right')
+    if alias is not None:
+        probability, aliases = alias
+        u = rng.random(n_records) * len(probability)
+        codes = u.astype(np.intp)
+        return np.where(u - codes < probability[codes], codes, aliases[codes])
+    return rng.integers(0, k, n_records)
+
+class CategoricalSampler:
+    """Draws from a fixed set of values with optional weights"""
+
+    def __init__(self, values, p=None, categorical=True):
+        self.values = np.asarray(values)
+        self.categorical = categorical
+        self.cdf = self.alias = None
+        if p is not None and len(values) > ALIAS_THRESHOLD:
+            self.alias = alias_table(p)
+        elif p is not None:
+            self.cdf = np.cumsum(np.asarray(p, dtype=np.float64))
+            self.cdf /= self.cdf[-1]
+        if categorical:
+            # Codes into the de-duplicated vocabulary, for compact output
+            self.categories = list(dict.fromkeys(values))
+            self.lookup = np.array([self.categories.index(v) for v in values], dtype=np.int8)
+
+    def sample(self, rng, n_records, window=None, compact=False):
+        codes = draw_codes(rng, n_records, self.cdf, self.alias, len(self.values))
+        if not compact or not self.categorical:
+            return self.values[codes]
+        return pd.Categorical.from_codes(self.lookup[codes], categories=self.categories)
+
+@lru_cache(maxsize=None)
+def category_sampler(values, p=None):
+    """Shared compiled sampler for a vocabulary (tuples, so it can be cached)"""
+    return CategoricalSampler(values, p)
+
+class DateSampler:
+    """Draws days from a window, weighted by weekday and recurring date spikes"""
+
+    def __init__(self, weekday_weights=None, spikes=()):
+        self.weekday_weights = np.asarray(weekday_weights or [1] * 7, dtype=np.float64)
+        self.spikes = [(s['from'], s['to'], float(s['weight'])) for s in spikes]
+        self._tables = {}
+
+    def _table(self, start, end):
+        """Alias table over the days of a window, built once per window"""
+        if (start, end) not in self._tables:
+            days = pd.date_range(start, end, freq='D')
+            weights = self.weekday_weights[days.dayofweek]
+            month_day = days.strftime('%m-%d')
+            for first, last, weight in self.spikes:
+                weights = np.where((month_day >= first) & (month_day <= last), weights * weight, weights)
+            self._tables[(start, end)] = alias_table(weights)
+        return self._tables[(start, end)]
+
+    def sample(self, rng, n_records, window=None, compact=False):
+        start, end = window
+        offsets = draw_codes(rng, n_records, alias=self._table(start, end))
+        return np.datetime64(start, 'D') + offsets
+
+class NumericSampler:
+    """uniform / integers / normal / exponential draws, optionally clipped and rounded"""
+
+    def __init__(self, kind, params, clip=None, decimals=None, integer=False):
+        self.kind = kind
+        self.params = params
+        self.clip = clip
+        self.decimals = decimals
+        self.integer = integer
+
+    def sample(self, rng, n_records, window=None, compact=False):
+        if self.kind == 'integers':
+            values = rng.integers(self.params['low'], self.params['high'], n_records)
+        elif self.kind == 'uniform':
+            values = rng.uniform(self.params['low'], self.params['high'], n_records)
+        elif self.kind == 'normal':
+            values = rng.normal(self.params['mean'], self.params['std'], n_records)
+        else:
+            values = rng.exponential(self.params['scale'], n_records)
+        if self.clip is not None:
+            values = np.clip(values, *self.clip)
+        if self.integer:
+            return np.rint(values).astype(np.int64)
+        return np.round(values, self.decimals) if self.decimals is not None else values
+
+# =============================================================================
+# SCENARIO CONFIG
+# =============================================================================
+# {"name": "holiday_load_test",
+#  "scale": 10,                              # rows x10 in every domain
+#  "start_date": "2024-01-01", "end_date": "2024-12-31",
+#  "domains": {"sales": {
+#     "scale": 2,                            # or "records": 500000
+#     "columns": {                           # replaces a raw column's draws
+#       "customer_segment": {"weights": {"Enterprise": 3, "SMB": 1}},
+#       "customer_id": {"type": "keys", "prefix": "CUST-", "width": 4, "count": 1000,
+#                       "hot": 20, "hot_share": 0.5},
+#       "date": {"type": "dates", "spikes": [{"from": "11-24", "to": "11-30", "weight": 5}]},
+#       "quantity": {"type": "integers", "low": 1, "high": 100}},
+#     "derived": {                           # evaluated after the built-in derived columns
+#       "profit_margin": {"expr": "profit / revenue * 100", "round": 2}}}}}
+# Column types: categorical (default; values + p, or weights), keys, dates,
+# uniform, integers, normal, exponential. Numeric types accept "round" and
+# "clip": [low, high]. Columns and derived columns must exist in the domain's
+# schema, and categorical values must come from the schema vocabulary.
+def load_scenario(path):
+    """Read a scenario file; .yaml/.yml needs PyYAML"""
+    with open(path) as f:
+        if path.endswith(('.yaml', '.yml')):
+            try:
+                import yaml
+            except ImportError:
+                raise ImportError("YAML scenarios require PyYAML: pip install pyyaml") from None
+            return yaml.safe_load(f)
+        return json.load(f)
+
+def _parse_date(value):
+    return None if value is None else datetime.strptime(str(value), '%Y-%m-%d')
+
+def _integer_bounds(column_type):
+    if isinstance(column_type, str) and column_type not in ('string', 'date') and np.dtype(column_type).kind in 'iu':
+        return np.iinfo(column_type)
+    return None
+
+def compile_column(key, column, spec):
+    """Build the sampler for one column spec, checking it against the domain schema"""
+    schema = SCHEMAS[key]
+    if column not in schema:
+        raise ValueError(f"Scenario column '{column}' is not in the {key} schema")
+    if column == id_column(key):
+        raise ValueError(f"Scenario cannot replace {key}.{column}: IDs are always sequential")
+    column_type = schema[column]
+    kind = spec.get('type', 'categorical')
+
+    if kind == 'categorical':
+        if 'weights' in spec:
+            values, p = list(spec['weights']), list(spec['weights'].values())
+        else:
+            values = spec.get('values', column_type[1] if isinstance(column_type, tuple) else None)
+            p = spec.get('p')
+        if values is None:
+            raise ValueError(f"Scenario column {key}.{column} needs 'values' or 'weights'")
+        if isinstance(column_type, tuple):
+            unknown = sorted(set(values) - set(column_type[1]))
+            if unknown:
+                raise ValueError(f"Scenario values {unknown} for {key}.{column} are not in its vocabulary")
+        if p is not None and len(p) != len(values):
+            raise ValueError(f"Scenario column {key}.{column}: {len(values)} values but {len(p)} weights")
+        return CategoricalSampler(values, p, categorical=isinstance(column_type, tuple))
+
+    if kind == 'keys':
+        from generate_data import format_ids
+
+        numbers = np.arange(1, spec['count'] + 1)
+        weights = np.ones(spec['count'])
+        if 'zipf' in spec:
+            weights = numbers ** -float(spec['zipf'])
+        elif 'hot' in spec:
+            # The first `hot` keys share hot_share of all rows between them
+            hot, share = spec['hot'], spec['hot_share']
+            weights[:hot] = share / hot
+            weights[hot:] = (1 - share) / (spec['count'] - hot)
+        # Without a width every key is padded to the widest one (CUST-0001 .. CUST-1000)
+        width = spec.get('width', len(str(spec['count'])))
+        return CategoricalSampler(format_ids(spec['prefix'], numbers, width), weights, categorical=False)
+
+    if kind == 'dates':
+        if column_type != 'date':
+            raise ValueError(f"Scenario column {key}.{column} is not a date column")
+        return DateSampler(spec.get('weekday_weights'), spec.get('spikes', ()))
+
+    if kind not in ('uniform', 'integers', 'normal', 'exponential'):
+        raise ValueError(f"Unknown scenario column type '{kind}' for {key}.{column}")
+    bounds = _integer_bounds(column_type)
+    clip = spec.get('clip')
+    if bounds is not None:
+        low, high = clip or ((spec['low'], spec['high'] - 1) if kind == 'integers' else (None, None))
+        if low is None or low < bounds.min or high > bounds.max:
+            raise ValueError(f"Scenario column {key}.{column} is {column_type}: give 'clip' "
+                             f"within [{bounds.min}, {bounds.max}]")
+    params = {name: spec[name] for name in ('low', 'high', 'mean', 'std', 'scale') if name in spec}
+    return NumericSampler(kind, params, clip, spec.get('round'), integer=bounds is not None)
+
+class Scenario:
+    """A compiled scenario: per-domain samplers, derived expressions, volumes and windows"""
+
+    def __init__(self, config):
+        self.name = config.get('name', 'scenario')
+        self.scale_factor = float(config.get('scale', 1))
+        self.start_date = _parse_date(config.get('start_date'))
+        self.end_date = _parse_date(config.get('end_date'))
+        self.domains = config.get('domains', {})
+        unknown = sorted(set(self.domains) - set(SCHEMAS))
+        if unknown:
+            raise ValueError(f"Unknown scenario domains: {unknown}")
+        self.columns = {key: {column: compile_column(key, column, spec)
+                              for column, spec in domain.get('columns', {}).items()}
+                        for key, domain in self.domains.items()}
+        self.derived = {key: [self._compile_derived(key, column, spec)
+                              for column, spec in domain.get('derived', {}).items()]
+                        for key, domain in self.domains.items()}
+
+    @staticmethod
+    def _compile_derived(key, column, spec):
+        spec = {'expr': spec} if isinstance(spec, str) else spec
+        column_type = SCHEMAS[key].get(column)
+        if column_type is None or isinstance(column_type, tuple) or column_type in ('string', 'date'):
+            raise ValueError(f"Scenario derived column {key}.{column} must be a numeric column of the schema")
+        return column, spec['expr'], spec.get('round'), spec.get('clip'), column_type
+
+    def records(self, key):
+        """Explicit row count for a domain, or None"""
+        return self.domains.get(key, {}).get('records')
+
+    def scale(self, key):
+        """Row multiplier for a domain"""
+        return self.scale_factor * float(self.domains.get(key, {}).get('scale', 1))
+
+    def window(self, key):
+        """(start, end) dates for a domain; None where the generator default applies"""
+        domain = self.domains.get(key, {})
+        return (_parse_date(domain.get('start_date')) or self.start_date,
+                _parse_date(domain.get('end_date')) or self.end_date)
+
+    def samplers(self, key):
+        """{column: sampler} replacing a domain's raw column draws"""
+        return self.columns.get(key, {})
+
+    def key_count(self, column):
+        """Largest key space any domain draws `column` from, or None if no domain overrides it"""
+        counts = [domain['columns'][column]['count'] for domain in self.domains.values()
+                  if domain.get('columns', {}).get(column, {}).get('type') == 'keys']
+        return max(counts) if counts else None
+
+    def derive(self, key, df, compact=False):
+        """Evaluate the domain's derived expressions on a generated chunk, in order"""
+        for column, expression, decimals, clip, column_type in self.derived.get(key, []):
+            values = df.eval(expression).to_numpy(dtype=np.float64)
+            if clip is not None:
+                values = np.clip(values, *clip)
+            if _integer_bounds(column_type) is not None:
+                values = np.rint(values).astype(np.int64)
+            elif decimals is not None:
+                values = np.round(values, decimals)
+            df[column] = values.astype(pandas_dtype(column_type)) if compact else values
+        return df
+
+_COMPILED = {}
+
+def compile_scenario(config):
+    """
+    Compile a scenario config, once per process
+
+    Process pool tasks carry the plain config; each worker compiles it on its
+    first chunk and reuses the samplers (and their alias tables) afterwards.
+    """
+    cache_key = json.dumps(config, sort_keys=True, default=str)
+    if cache_key not in _COMPILED:
+        _COMPILED[cache_key] = Scenario(config)
+    return _COMPILED[cache_key]
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Dataset Schemas
+Categorical vocabularies and typed column schemas for every domain
+"""
+
+import pandas as pd
+
+# =============================================================================
+# CATEGORICAL VOCABULARIES
+# =============================================================================
+# Common dimensions
+REGIONS = ['North', 'South', 'East', 'West', 'Central']
+DEPARTMENTS = ['Sales', 'Marketing', 'Engineering', 'HR', 'Finance', 'Operations', 'Customer Support', 'R&D']
+COUNTRIES = ['USA', 'Canada', 'UK', 'Germany', 'France', 'Australia', 'Japan', 'Brazil', 'India', 'Mexico']
+QUARTERS = ['Q1', 'Q2', 'Q3', 'Q4']
+PRIORITY_LEVELS = ['Low', 'Medium', 'High', 'Critical']
+
+# Sales
+SALES_PRODUCTS = ['Product A', 'Product B', 'Product C', 'Product D', 'Product E', 'Enterprise Suite', 'Basic Plan', 'Premium Plan']
+CUSTOMER_SEGMENTS = ['Enterprise', 'SMB', 'Startup', 'Individual', 'Government']
+SALES_CHANNELS = ['Direct', 'Partner', 'Online', 'Retail']
+
+# HR
+JOB_TITLES = ['Analyst', 'Senior Analyst', 'Manager', 'Senior Manager', 'Director', 'VP', 'Engineer', 'Senior Engineer', 'Specialist', 'Coordinator']
+GENDERS = ['Male', 'Female', 'Non-Binary']
+ETHNICITIES = ['White', 'Black', 'Hispanic', 'Asian', 'Mixed', 'Other']
+EDUCATION_LEVELS = ['High School', 'Associate', 'Bachelor', 'Master', 'PhD']
+EMPLOYMENT_STATUSES = ['Active', 'Terminated', 'On Leave']
+
+# Finance
+FINANCE_CATEGORIES = ['Revenue', 'COGS', 'Operating Expenses', 'Marketing', 'R&D', 'Administrative', 'Depreciation', 'Interest']
+FINANCE_SUB_CATEGORIES = ['Salaries', 'Materials', 'Utilities', 'Rent', 'Software', 'Travel', 'Equipment', 'Services', 'Other']
+COST_CENTERS = ['CC-100', 'CC-200', 'CC-300', 'CC-400', 'CC-500']
+
+# Healthcare / operations
+SERVICE_TYPES = ['Outpatient', 'Inpatient', 'Emergency', 'Surgery', 'Diagnostic', 'Therapy', 'Consultation']
+OPERATIONS_DEPARTMENTS = ['Emergency', 'Radiology', 'Surgery', 'ICU', 'Pharmacy', 'Lab', 'Administration', 'Outpatient']
+
+# Supply chain
+SUPPLY_PRODUCTS = ['Raw Material A', 'Raw Material B', 'Component X', 'Component Y', 'Finished Good 1', 'Finished Good 2', 'Packaging', 'Equipment']
+SUPPLIERS = [f'Supplier-{i:03d}' for i in range(1, 51)]
+WAREHOUSES = ['WH-North', 'WH-South', 'WH-East', 'WH-West', 'WH-Central']
+RISK_LEVELS = ['Low', 'Medium', 'High', 'Critical']
+
+# Fraud
+TRANSACTION_TYPES = ['Purchase', 'Refund', 'Transfer', 'Withdrawal', 'Deposit', 'Payment']
+MERCHANT_CATEGORIES = ['Retail', 'Online', 'Travel', 'Entertainment', 'Utilities', 'Healthcare', 'Gas Station', 'Restaurant']
+DEVICE_TYPES = ['Desktop', 'Mobile', 'Tablet', 'POS', 'ATM']
+
+# Public impact
+IMPACT_CATEGORIES = ['Housing', 'Climate', 'Health', 'Education', 'Employment', 'Infrastructure']
+IMPACT_INDICATORS = ['Air Quality Index', 'Housing Affordability Index', 'Unemployment Rate', 'Life Expectancy',
+                     'CO2 Emissions', 'Renewable Energy %', 'Hospital Beds per 1000', 'School Enrollment Rate',
+                     'Income Inequality', 'Access to Clean Water']
+TREND_DIRECTIONS = ['Improving', 'Stable', 'Declining']
+
+# =============================================================================
+# DOMAIN SCHEMAS
+# =============================================================================
+# Column order matches the generator output. A column type is one of
+# 'string', 'date', a numpy dtype name, or ('category', vocabulary).
+# Numeric types are the narrowest that hold every value the generator can
+# produce; float32 is only used where values have at most 7 significant digits.
+SALES_SCHEMA = {
+    'transaction_id': 'string',
+    'date': 'date',
+    'region': ('category', REGIONS),
+    'country': ('category', COUNTRIES),
+    'customer_id': 'string',
+    'customer_segment': ('category', CUSTOMER_SEGMENTS),
+    'product': ('category', SALES_PRODUCTS),
+    'sales_channel': ('category', SALES_CHANNELS),
+    'quantity': 'int8',
+    'unit_price': 'float64',
+    'discount_percent': 'int8',
+    'customer_lifetime_value': 'float64',
+    'recency_days': 'int16',
+    'frequency': 'int8',
+    'monetary_value': 'float64',
+    'satisfaction_score': 'float32',
+    'nps_score': 'int8',
+    'revenue': 'float64',
+    'cost': 'float64',
+    'profit': 'float64',
+    'profit_margin': 'float32',
+}
+
+HR_SCHEMA = {
+    'employee_id': 'string',
+    'department': ('category', DEPARTMENTS),
+    'region': ('category', REGIONS),
+    'job_title': ('category', JOB_TITLES),
+    'hire_date': 'date',
+    'gender': ('category', GENDERS),
+    'ethnicity': ('category', ETHNICITIES),
+    'age': 'int8',
+    'education': ('category', EDUCATION_LEVELS),
+    'salary': 'float64',
+    'performance_rating': 'float32',
+    'satisfaction_score': 'float32',
+    'engagement_score': 'float32',
+    'training_hours': 'int16',
+    'promotion_last_3_years': 'int8',
+    'employment_status': ('category', EMPLOYMENT_STATUSES),
+    'time_to_hire_days': 'int8',
+    'turnover_risk': 'float32',
+    'tenure_years': 'float32',
+}
+
+FINANCE_SCHEMA = {
+    'transaction_id': 'string',
+    'date': 'date',
+    'region': ('category', REGIONS),
+    'department': ('category', DEPARTMENTS),
+    'category': ('category', FINANCE_CATEGORIES),
+    'sub_category': ('category', FINANCE_SUB_CATEGORIES),
+    'cost_center': ('category', COST_CENTERS),
+    'budget_amount': 'float64',
+    'actual_amount': 'float64',
+    'forecast_amount': 'float64',
+    'quarter': ('category', QUARTERS),
+    'fiscal_year': 'int16',
+    'variance': 'float64',
+    'variance_percent': 'float32',
+    'forecast_accuracy': 'float32',
+}
+
+OPERATIONS_SCHEMA = {
+    'case_id': 'string',
+    'date': 'date',
+    'region': ('category', REGIONS),
+    'department': ('category', OPERATIONS_DEPARTMENTS),
+    'service_type': ('category', SERVICE_TYPES),
+    'priority': ('category', PRIORITY_LEVELS),
+    'wait_time_minutes': 'int16',
+    'service_time_minutes': 'int16',
+    'throughput': 'int8',
+    'capacity_utilization': 'float32',
+    'staff_count': 'int8',
+    'patient_volume': 'int16',
+    'satisfaction_score': 'float32',
+    'cost_per_case': 'float64',
+    'readmission_rate': 'float32',
+    'bottleneck_flag': 'int8',
+    'total_time_minutes': 'int16',
+    'efficiency_score': 'float32',
+}
+
+SUPPLY_CHAIN_SCHEMA = {
+    'inventory_id': 'string',
+    'date': 'date',
+    'region': ('category', REGIONS),
+    'product': ('category', SUPPLY_PRODUCTS),
+    'supplier': ('category', SUPPLIERS),
+    'warehouse': ('category', WAREHOUSES),
+    'inventory_level': 'int16',
+    'reorder_point': 'int16',
+    'demand_forecast': 'int16',
+    'lead_time_days': 'int8',
+    'supplier_delay_days': 'int8',
+    'order_quantity': 'int16',
+    'unit_cost': 'float64',
+    'holding_cost': 'float32',
+    'stockout_count': 'int8',
+    'supplier_rating': 'float32',
+    'risk_level': ('category', RISK_LEVELS),
+    'on_time_delivery_rate': 'float32',
+    'inventory_value': 'float64',
+    'days_of_supply': 'float32',
+    'shortage_risk': 'int8',
+}
+
+FRAUD_SCHEMA = {
+    'transaction_id': 'string',
+    'date': 'date',
+    'region': ('category', REGIONS),
+    'country': ('category', COUNTRIES),
+    'customer_id': 'string',
+    'transaction_type': ('category', TRANSACTION_TYPES),
+    'merchant_category': ('category', MERCHANT_CATEGORIES),
+    'amount': 'float64',
+    'device_type': ('category', DEVICE_TYPES),
+    'ip_risk_score': 'float32',
+    'velocity_24h': 'int8',
+    'distance_from_home': 'int16',
+    'time_since_last_txn_minutes': 'int16',
+    'failed_attempts': 'int8',
+    'is_weekend': 'int8',
+    'is_night': 'int8',
+    'is_international': 'int8',
+    'fraud_risk_score': 'float32',
+    'is_fraud': 'int8',
+    'is_anomaly': 'int8',
+}
+
+PUBLIC_IMPACT_SCHEMA = {
+    'record_id': 'string',
+    'date': 'date',
+    'region': ('category', REGIONS),
+    'country': ('category', COUNTRIES),
+    'category': ('category', IMPACT_CATEGORIES),
+    'indicator': ('category', IMPACT_INDICATORS),
+    'value': 'float32',
+    'target_value': 'float32',
+    'previous_year_value': 'float32',
+    'population_affected': 'int32',
+    'budget_allocated': 'float64',
+    'budget_spent': 'float64',
+    'projects_completed': 'int8',
+    'projects_in_progress': 'int8',
+    'satisfaction_rating': 'float32',
+    'trend_direction': ('category', TREND_DIRECTIONS),
+    'priority_level': ('category', PRIORITY_LEVELS),
+    'year_over_year_change': 'float32',
+    'target_achievement': 'float32',
+    'budget_utilization': 'float32',
+}
+
+SCHEMAS = {
+    'sales': SALES_SCHEMA,
+    'hr': HR_SCHEMA,
+    'finance': FINANCE_SCHEMA,
+    'healthcare': OPERATIONS_SCHEMA,
+    'supply_chain': SUPPLY_CHAIN_SCHEMA,
+    'fraud': FRAUD_SCHEMA,
+    'public_impact': PUBLIC_IMPACT_SCHEMA,
+}
+
+# Column each domain is dated by, when it is not 'date'
+DATE_COLUMNS = {'hr': 'hire_date'}
+
+# =============================================================================
+# SCHEMA HELPERS
+# =============================================================================
+def id_column(key):
+    """Row ID column of a domain (always the first column)"""
+    return next(iter(SCHEMAS[key]))
+
+def date_column(key):
+    """Date column that places a domain's rows in time"""
+    return DATE_COLUMNS.get(key, 'date')
+
+def pandas_dtype(column_type):
+    """Map a schema column type to a pandas dtype"""
+    if isinstance(column_type, tuple):
+        return pd.CategoricalDtype(column_type[1])
+    if column_type == 'date':
+        return 'datetime64[s]'
+    if column_type == 'string':
+        return 'str'
+    return column_type
+
+def apply_schema(df, schema):
+    """Cast a generated DataFrame to the dtypes declared in its schema"""
+    return df.astype({column: pandas_dtype(column_type) for column, column_type in schema.items()})
+
+def arrow_schema(schema):
+    """Build a pyarrow schema from a domain schema (requires pyarrow)"""
+    import pyarrow as pa
+
+    fields = []
+    for column, column_type in schema.items():
+        if isinstance(column_type, tuple):
+            index_type = pa.int8() if len(column_type[1]) <= 127 else pa.int16()
+            arrow_type = pa.dictionary(index_type, pa.string())
+        elif column_type == 'date':
+            arrow_type = pa.date32()
+        elif column_type == 'string':
+            arrow_type = pa.string()
+        else:
+            arrow_type = pa.from_numpy_dtype(column_type)
+        fields.append(pa.field(column, arrow_type))
+    return pa.schema(fields)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Streaming Sketches
+Mergeable, vectorized summaries for single-pass statistics over chunked data
+"""
+
+import numpy as np
+import pandas as pd
+
+# =============================================================================
+# QUANTILE SKETCH (log-bucketed, DDSketch-style)
+# =============================================================================
+# Values are counted in logarithmic buckets so any quantile comes back with
+# at most RELATIVE_ACCURACY relative error, whatever the value range. Bucket
+# counts from different chunks merge by simple addition.
+RELATIVE_ACCURACY = 0.01
+# Keeps bucket numbers of magnitudes down to 1e-9 positive; 0 is the zero bucket
+_KEY_OFFSET = 4096
+_MIN_MAGNITUDE = 1e-9
+
+def _gamma(relative_accuracy):
+    return (1 + relative_accuracy) / (1 - relative_accuracy)
+
+def quantile_keys(values, relative_accuracy=RELATIVE_ACCURACY):
+    """Map values to signed bucket keys (0 = zero, negative keys = negative values)"""
+    values = np.asarray(values, dtype=np.float64)
+    magnitude = np.abs(values)
+    buckets = np.ceil(np.log(np.maximum(magnitude, _MIN_MAGNITUDE)) / np.log(_gamma(relative_accuracy)))
+    keys = (buckets + _KEY_OFFSET).astype(np.int64) * np.sign(values).astype(np.int64)
+    keys[magnitude < _MIN_MAGNITUDE] = 0
+    return keys
+
+def key_values(keys, relative_accuracy=RELATIVE_ACCURACY):
+    """Representative value of each bucket key (inverse of quantile_keys)"""
+    keys = np.asarray(keys, dtype=np.int64)
+    gamma = _gamma(relative_accuracy)
+    magnitude = 2 * gamma ** (np.abs(keys) - _KEY_OFFSET).astype(np.float64) / (gamma + 1)
+    return np.where(keys == 0, 0.0, np.sign(keys) * magnitude)
+
+def sketch_counts(frame, group_columns, value_column, relative_accuracy=RELATIVE_ACCURACY):
+    """
+    Bucket counts of one value column per group, as a Series indexed by (*groups, key)
+
+    Results from several chunks merge with merge_counts.
+    """
+    frame = frame.loc[frame[value_column].notna(), list(group_columns) + [value_column]]
+    keys = pd.Series(quantile_keys(frame[value_column].to_numpy(), relative_accuracy), index=frame.index, name='_key')
+    by = [frame[c] for c in group_columns] + [keys]
+    return frame.groupby(by, observed=True, sort=False).size()
+
+def merge_counts(counts):
+    """Merge bucket-count Series from several chunks"""
+    counts = [c for c in counts if len(c)]
+    if not counts:
+        return pd.Series(dtype=np.int64)
+    merged = pd.concat(counts)
+    return merged.groupby(level=list(range(merged.index.nlevels)), observed=True, sort=False).sum()
+
+def grouped_quantiles(counts, quantiles, relative_accuracy=RELATIVE_ACCURACY):
+    """
+    Estimate quantiles per group from merged bucket counts
+
+    Returns a DataFrame indexed by the group levels with one column per
+    quantile; with no group levels the index has a single row.
+    """
+    frame = counts.rename('n').reset_index()
+    group_columns = [c for c in frame.columns if c not in ('_key', 'n')]
+    frame['_value'] = key_values(frame['_key'].to_numpy(), relative_accuracy)
+    frame = frame.sort_values(group_columns + ['_value'], kind='stable')
+
+    if group_columns:
+        grouped = frame.groupby(group_columns, observed=True, sort=False)['n']
+        cumulative = grouped.cumsum()
+        total = grouped.transform('sum')
+    else:
+        cumulative = frame['n'].cumsum()
+        total = pd.Series(frame['n'].sum(), index=frame.index)
+
+    result = {}
+    for q in quantiles:
+        # First bucket whose cumulative count passes the target rank
+        hit = frame.loc[cumulative > q * (total - 1)]
+        if group_columns:
+            result[q] = hit.groupby(group_columns, observed=True, sort=False)['_value'].first()
+        else:
+            result[q] = pd.Series(hit['_value'].iloc[:1].to_numpy())
+    return pd.DataFrame(result)
+
+# =============================================================================
+# DISTINCT-COUNT SKETCH (HyperLogLog)
+# =============================================================================
+# Each value is hashed to 64 bits; the top HLL_PRECISION bits pick a register
+# and the register keeps the longest run of leading zeros seen in the rest.
+# 2 ** 12 one-byte registers give about 1.6% standard error in 4KB, and
+# registers from different chunks merge with an element-wise maximum.
+HLL_PRECISION = 12
+
+def hll_registers(values, precision=HLL_PRECISION):
+    """HyperLogLog registers (uint8) for the non-null values of an array or Series"""
+    values = pd.Series(values).dropna()
+    registers = np.zeros(1 << precision, dtype=np.uint8)
+    if values.empty:
+        return registers
+    # Hashes categoricals by value, so categorical and plain columns agree
+    hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    index = (hashes >> np.uint64(64 - precision)).astype(np.intp)
+    rest = hashes & np.uint64((1 << (64 - precision)) - 1)
+    # rest has fewer than 53 bits, so frexp's exponent is its exact bit length
+    _, bit_length = np.frexp(rest.astype(np.float64))
+    ranks = (64 - precision - bit_length + 1).astype(np.uint8)
+    np.maximum.at(registers, index, ranks)
+    return registers
+
+def merge_registers(registers):
+    """Merge HyperLogLog registers from several chunks"""
+    return np.maximum.reduce(list(registers))
+
+def hll_estimate(registers):
+    """Approximate number of distinct values behind a register array"""
+    m = len(registers)
+    alpha = 0.7213 / (1 + 1.079 / m)
+    estimate = alpha * m * m / np.sum(np.exp2(-registers.astype(np.float64)))
+    zeros = int(np.count_nonzero(registers == 0))
+    # Linear counting is more accurate while many registers are still empty
+    if estimate <= 2.5 * m and zeros:
+        estimate = m * np.log(m / zeros)
+    return int(round(estimate))
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Data Source Sync
+Publishes generated datasets as Tableau data sources and refreshes extracts,
+skipping every dataset whose content has not changed since the last sync
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import hashlib
+import json
+import os
+import sys
+import time
+
+from cli import refresh_parser
+from datasets import DATASET_FILES, get_base_path, write_json_atomic
+from publish_to_tableau import ProjectCache, validation_problems, with_retries
+from schemas import SCHEMAS
+from writers import iter_file_chunks, open_writer, output_path
+
+STATE_FILE = 'publish_state.json'
+
+# =============================================================================
+# CHANGE DETECTION
+# =============================================================================
+def load_state(base_path):
+    """Hashes and Tableau ids recorded by previous syncs"""
+    path = os.path.join(base_path, STATE_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+def save_state(base_path, state):
+    """Write the sync state atomically"""
+    write_json_atomic(os.path.join(base_path, STATE_FILE), state, sort_keys=True)
+
+def content_hash(path, previous=None):
+    """
+    SHA-256 of a file, streamed in 8MB blocks
+
+    When size and mtime match the previous entry the stored hash is reused,
+    so unchanged multi-GB files are not re-read every night.
+    """
+    stat = os.stat(path)
+    if previous and previous.get('size') == stat.st_size and previous.get('mtime_ns') == stat.st_mtime_ns:
+        return previous['sha256'], stat
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while block := f.read(8 * 2 ** 20):
+            digest.update(block)
+    return digest.hexdigest(), stat
+
+def publishable_file(key, full_path, chunk_size=1_000_000):
+    """
+    Parquet file to upload for a domain
+
+    Tableau does not accept CSV data sources, so a Parquet copy is streamed
+    from the CSV when it is missing or older than the CSV (e.g. after an
+    incremental append).
+    """
+    parquet_path = output_path(full_path, 'parquet')
+    if os.path.exists(full_path) and (not os.path.exists(parquet_path)
+                                      or os.path.getmtime(parquet_path) < os.path.getmtime(full_path)):
+        print(f"  Converting {os.path.basename(full_path)} to Parquet...")
+        with open_writer('parquet', parquet_path, SCHEMAS[key]) as writer:
+            for chunk in iter_file_chunks(full_path, SCHEMAS[key], chunk_size):
+                writer.write(chunk)
+    return parquet_path
+
+def plan_sync(base_path, state, domains=None, force=False, chunk_size=1_000_000):
+    """
+    Hash every dataset and split them into changed and unchanged lists
+
+    The hash is of the Parquet file that gets uploaded, brought up to date
+    with its CSV first, so a Parquet-only regeneration counts as a change.
+    """
+    changed, unchanged = [], []
+    for key, name, filepath in DATASET_FILES:
+        if domains and key not in domains:
+            continue
+        full_path = os.path.join(base_path, filepath)
+        source = publishable_file(key, full_path, chunk_size)
+        if not os.path.exists(source):
+            print(f"  {name}: no data file, skipping")
+            continue
+        sha256, stat = content_hash(source, state.get(key))
+        entry = {'key': key, 'name': name, 'full_path': full_path, 'source': source,
+                 'sha256': sha256, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        if force or state.get(key, {}).get('published_sha256') != sha256:
+            changed.append(entry)
+        else:
+            unchanged.append(entry)
+    return changed, unchanged
+
+# =============================================================================
+# REFRESH JOBS
+# =============================================================================
+def poll_jobs(server, jobs, workers=4, interval=5.0, timeout=3600.0, retries=3, backoff=1.0):
+    """
+    Poll refresh jobs until all finish, checking every pending job concurrently
+
+    jobs maps a label to a JobItem; returns {label: finish_code} where '0'
+    is success and None means the job was still running at timeout. Each
+    poll retries transient errors like the uploads do.
+    """
+    def poll(job_id):
+        job, _ = with_retries(lambda: server.jobs.get_by_id(job_id), retries, backoff)
+        return job
+
+    pending = {label: job.id for label, job in jobs.items()}
+    finished = {}
+    deadline = time.monotonic() + timeout
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while pending:
+            labels = list(pending)
+            for label, job in zip(labels, pool.map(poll, [pending[l] for l in labels])):
+                if job.completed_at is not None or job.finish_code not in (None, '-1', -1):
+                    finished[label] = str(job.finish_code)
+                    del pending[label]
+                    print(f"  Job finished: {label} ({'ok' if finished[label] == '0' else 'failed'})")
+            if pending and time.monotonic() > deadline:
+                finished.update({label: None for label in pending})
+                break
+            if pending:
+                time.sleep(interval)
+    return finished
+
+def find_by_name(endpoint, name, project_name):
+    """Workbook/data source with this exact name in the given project, or None"""
+    import tableauserverclient as TSC
+
+    options = TSC.RequestOptions()
+    options.filter.add(TSC.Filter(TSC.RequestOptions.Field.Name, TSC.RequestOptions.Operator.Equals, name))
+    return next((item for item in TSC.Pager(endpoint, options) if item.project_name == project_name), None)
+
+# =============================================================================
+# SYNC
+# =============================================================================
+def sync_datasources(server_url, token_name, token_value, site_id, project_name, changed,
+                     action='publish', refresh_workbooks=(), workers=4, retries=3, backoff=1.0,
+                     poll_interval=5.0, on_published=None):
+    """
+    Publish (or refresh) every changed dataset, then refresh dependent workbooks
+
+    Returns {key: {'status', 'id', 'seconds'}}; only successful entries
+    should be recorded as synced. on_published, if given, receives the
+    published entries before refresh jobs are polled, so they can be
+    recorded even if polling fails.
+    """
+    import tableauserverclient as TSC
+
+    tableau_auth = TSC.PersonalAccessTokenAuth(token_name, token_value, site_id)
+    server = TSC.Server(server_url, use_server_version=True)
+    results = {}
+
+    def publish(entry):
+        start = time.perf_counter()
+        try:
+            project = projects.get(project_name)
+            item = TSC.DatasourceItem(project.id, name=entry['name'])
+            published, _ = with_retries(
+                lambda: server.datasources.publish(item, entry['source'], mode=TSC.Server.PublishMode.Overwrite),
+                retries, backoff)
+            result = {'status': 'published', 'id': published.id}
+        except Exception as error:
+            result = {'status': 'failed', 'error': str(error).strip()}
+        result['seconds'] = round(time.perf_counter() - start, 3)
+        print(f"  [{result['status']}] {entry['name']} ({result['seconds']:.2f}s)")
+        return entry['key'], result
+
+    def start_refresh(endpoint, name):
+        item = find_by_name(endpoint, name, project_name)
+        if item is None:
+            raise LookupError(f"'{name}' not found in project '{project_name}'")
+        job, _ = with_retries(lambda: endpoint.refresh(item), retries, backoff)
+        return item, job
+
+    with server.auth.sign_in(tableau_auth):
+        print(f"Signed in to {server_url}")
+        jobs = {}
+
+        if action == 'publish':
+            projects = ProjectCache(server)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results.update(pool.map(publish, changed))
+        else:
+            for entry in changed:
+                try:
+                    item, jobs[entry['key']] = start_refresh(server.datasources, entry['name'])
+                    results[entry['key']] = {'status': 'refreshing', 'id': item.id}
+                except Exception as error:
+                    results[entry['key']] = {'status': 'failed', 'error': str(error).strip()}
+
+        # Workbooks with embedded extracts only need a refresh when something changed
+        if any(r['status'] != 'failed' for r in results.values()):
+            for name in refresh_workbooks:
+                try:
+                    item, jobs[f'workbook:{name}'] = start_refresh(server.workbooks, name)
+                    results[f'workbook:{name}'] = {'status': 'refreshing', 'id': item.id}
+                except Exception as error:
+                    results[f'workbook:{name}'] = {'status': 'failed', 'error': str(error).strip()}
+
+        if on_published is not None:
+            on_published({key: result for key, result in results.items() if result['status'] == 'published'})
+
+        if jobs:
+            print(f"Waiting for {len(jobs)} refresh jobs...")
+            for label, finish_code in poll_jobs(server, jobs, workers, poll_interval,
+                                                retries=retries, backoff=backoff).items():
+                results[label]['status'] = 'refreshed' if finish_code == '0' else 'failed'
+                if finish_code != '0':
+                    results[label]['error'] = 'timed out' if finish_code is None else f'finish code {finish_code}'
+
+    return results
+
+def record_synced(state, changed, results):
+    """Remember the hash of every dataset that synced successfully"""
+    for entry in changed:
+        result = results.get(entry['key'])
+        if result is None or result['status'] == 'failed':
+            continue
+        state[entry['key']] = {
+            'sha256': entry['sha256'],
+            'published_sha256': entry['sha256'],
+            'size': entry['size'],
+            'mtime_ns': entry['mtime_ns'],
+            'datasource_id': result['id'],
+            'synced_at': datetime.now().isoformat(timespec='seconds'),
+        }
+
+# =============================================================================
+# MAIN EXECUTION
+# =============================================================================
+def main(argv=None):
+    parser = refresh_parser()
+    args = parser.parse_args(argv)
+
+    if args.upload_chunk_mb:
+        os.environ['TSC_CHUNK_SIZE_MB'] = str(args.upload_chunk_mb)
+
+    base_path = get_base_path()
+    state = load_state(base_path)
+
+    print("=" * 60)
+    print("Enterprise Intelligence Platform - Data Source Sync")
+    print("=" * 60)
+
+    changed, unchanged = plan_sync(base_path, state, args.domains, args.force)
+    for entry in unchanged:
+        print(f"  {entry['name']}: unchanged, skipping")
+    for entry in changed:
+        print(f"  {entry['name']}: changed ({entry['size'] / 1e6:,.1f} MB)")
+
+    blocked = {}
+    if args.require_valid:
+        blocked = validation_problems(args.require_valid, [entry['key'] for entry in changed])
+        for entry in changed:
+            if entry['key'] in blocked:
+                print(f"  {entry['name']}: blocked by validation ({blocked[entry['key']]})")
+        changed = [entry for entry in changed if entry['key'] not in blocked]
+
+    if args.dry_run or not changed:
+        print("\nNothing to sync." if not changed else "\nDry run: nothing published.")
+        if blocked and not args.dry_run:
+            sys.exit(1)
+        return
+
+    def checkpoint(results):
+        record_synced(state, changed, results)
+        save_state(base_path, state)
+
+    start = time.perf_counter()
+    results = sync_datasources(args.server, args.token_name, args.token_value, args.site, args.project,
+                               changed, args.action, args.refresh_workbooks, args.workers, args.retries,
+                               args.backoff, args.poll_interval, on_published=checkpoint)
+    checkpoint(results)
+
+    print("\n" + "=" * 60)
+    for label, result in results.items():
+        print(f"  {label:<28}{result['status']:<12}{result.get('error', '')}")
+    failed = sum(r['status'] == 'failed' for r in results.values())
+    print(f"\nSynced {len(results) - failed}/{len(results)}, skipped {len(unchanged)} unchanged"
+          f"{f', blocked {len(blocked)}' if blocked else ''} in {time.perf_counter() - start:.2f}s")
+    print("=" * 60)
+    if failed or blocked:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
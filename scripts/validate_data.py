@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Data Validation
+Profiles every generated dataset in a single streaming pass (nulls, min/max,
+approximate quantiles and distinct counts per column) and checks declared
+invariants, writing a JSON report that can gate publishing
+"""
+
+from datetime import datetime
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from cli import validate_parser
+from datasets import DATASET_FILES, DEFAULT_CHUNK_SIZE, REPORT_FILE, get_base_path, write_json_atomic
+from manifest import load_manifest, matches_file
+from schemas import SCHEMAS, date_column, id_column
+from sketches import (HLL_PRECISION, grouped_quantiles, hll_estimate, hll_registers, merge_counts,
+                      merge_registers, sketch_counts)
+from writers import iter_file_chunks, output_path
+
+QUANTILES = [0.01, 0.25, 0.5, 0.75, 0.99]
+
+# =============================================================================
+# INVARIANTS
+# =============================================================================
+# (name, DataFrame.eval expression that must hold for every row, severity).
+# Errors fail validation and block a gated publish; warnings flag values that
+# are legal but implausible. Every domain is also checked for nulls (which
+# includes categories outside the schema vocabulary), non-finite numbers,
+# unique increasing IDs and agreement with data/manifest.json.
+INVARIANTS = {
+    'sales': [
+        ('revenue_non_negative', 'revenue >= 0', 'error'),
+        ('cost_within_revenue', 'cost <= revenue', 'error'),
+        ('satisfaction_in_range', '1 <= satisfaction_score <= 5', 'error'),
+        ('nps_in_range', '-100 <= nps_score <= 100', 'error'),
+        ('discount_in_range', '0 <= discount_percent <= 100', 'error'),
+    ],
+    'hr': [
+        # Negative tenures (hire dates after the end date) are clipped by the generator
+        ('tenure_non_negative', 'tenure_years >= 0', 'error'),
+        ('age_in_range', '18 <= age <= 70', 'error'),
+        ('salary_positive', 'salary > 0', 'error'),
+        ('performance_in_range', '1 <= performance_rating <= 5', 'error'),
+        ('turnover_risk_in_range', '0 <= turnover_risk <= 1', 'error'),
+    ],
+    'finance': [
+        ('budget_positive', 'budget_amount > 0', 'error'),
+        ('actual_positive', 'actual_amount > 0', 'error'),
+        # 100 - |error| %: below 0 the forecast missed by more than the actual itself
+        ('forecast_accuracy_at_most_100', 'forecast_accuracy <= 100', 'error'),
+        ('forecast_accuracy_non_negative', 'forecast_accuracy >= 0', 'warning'),
+    ],
+    'healthcare': [
+        ('total_time_is_sum', 'total_time_minutes == wait_time_minutes + service_time_minutes', 'error'),
+        ('efficiency_in_range', '0 <= efficiency_score <= 100', 'error'),
+        ('utilization_in_range', '0 <= capacity_utilization <= 1', 'error'),
+        ('readmission_in_range', '0 <= readmission_rate <= 1', 'error'),
+    ],
+    'supply_chain': [
+        # days_of_supply divides by demand_forecast / 30
+        ('demand_positive', 'demand_forecast > 0', 'error'),
+        ('inventory_non_negative', 'inventory_level >= 0', 'error'),
+        ('on_time_rate_in_range', '0 <= on_time_delivery_rate <= 1', 'error'),
+        ('days_of_supply_within_year', 'days_of_supply <= 365', 'warning'),
+    ],
+    'fraud': [
+        ('amount_non_negative', 'amount >= 0', 'error'),
+        ('risk_score_in_range', '0 <= fraud_risk_score <= 100', 'error'),
+        ('flags_binary', 'is_fraud in [0, 1] and is_anomaly in [0, 1]', 'error'),
+    ],
+    'public_impact': [
+        ('population_positive', 'population_affected > 0', 'error'),
+        ('budget_allocated_positive', 'budget_allocated > 0', 'error'),
+        ('budget_utilization_at_most_200', 'budget_utilization <= 200', 'warning'),
+    ],
+}
+
+# =============================================================================
+# STREAMING PROFILE
+# =============================================================================
+def _is_numeric(column_type):
+    return isinstance(column_type, str) and column_type not in ('string', 'date')
+
+class ColumnProfile:
+    """Mergeable single-pass summary of one column; memory does not grow with rows"""
+
+    def __init__(self, name, column_type):
+        self.name = name
+        self.numeric = _is_numeric(column_type)
+        self.categorical = isinstance(column_type, tuple)
+        self.ordered = self.numeric or column_type == 'date'
+        self.nulls = 0
+        self.non_finite = 0
+        self.minimum = None
+        self.maximum = None
+        self.total = 0.0
+        self.counts = pd.Series(dtype=np.int64)
+        self.registers = np.zeros(1 << HLL_PRECISION, dtype=np.uint8)
+        self.top = pd.Series(dtype=np.int64)
+
+    def update(self, values):
+        self.nulls += int(values.isna().sum())
+        values = values.dropna()
+        if values.empty:
+            return
+        # Hash numbers as float64 so CSV and typed Parquet/Feather columns agree
+        hashed = values.astype(np.float64) if self.numeric else values
+        self.registers = merge_registers([self.registers, hll_registers(hashed)])
+        if self.categorical:
+            self.top = self.top.add(values.value_counts(), fill_value=0)
+            return
+        if self.numeric:
+            finite = np.isfinite(values.to_numpy(dtype=np.float64))
+            self.non_finite += int((~finite).sum())
+            values = values[finite]
+            if values.empty:
+                return
+            self.total += float(values.sum())
+            self.counts = merge_counts([self.counts, sketch_counts(values.to_frame(), [], values.name)])
+        if self.ordered:
+            low, high = values.min(), values.max()
+            self.minimum = low if self.minimum is None else min(self.minimum, low)
+            self.maximum = high if self.maximum is None else max(self.maximum, high)
+
+    def summary(self, rows):
+        result = {'nulls': self.nulls, 'distinct': hll_estimate(self.registers)}
+        if self.ordered and self.minimum is not None:
+            result['min'] = _json_value(self.minimum)
+            result['max'] = _json_value(self.maximum)
+        if self.numeric:
+            result['non_finite'] = self.non_finite
+            valid = rows - self.nulls - self.non_finite
+            result['mean'] = round(self.total / valid, 4) if valid else None
+            if len(self.counts):
+                quantiles = grouped_quantiles(self.counts, QUANTILES).iloc[0]
+                result['quantiles'] = {f'p{round(q * 100):02d}': round(float(v), 4) for q, v in quantiles.items()}
+        if self.categorical:
+            result['top'] = {str(k): int(v) for k, v in self.top.sort_values(ascending=False).head(5).items()}
+        return result
+
+def _json_value(value):
+    if isinstance(value, pd.Timestamp):
+        return value.strftime('%Y-%m-%d')
+    return value.item() if hasattr(value, 'item') else value
+
+class CheckResult:
+    """Running violation count of one check, keeping the first offending ID"""
+
+    def __init__(self, name, check, severity):
+        self.name = name
+        self.check = check
+        self.severity = severity
+        self.violations = 0
+        self.example = None
+
+    def add(self, violated, ids):
+        count = int(violated.sum())
+        if count and self.example is None:
+            self.example = str(ids[violated].iloc[0])
+        self.violations += count
+
+    def summary(self):
+        result = {'name': self.name, 'check': self.check, 'severity': self.severity,
+                  'violations': self.violations, 'passed': self.violations == 0}
+        if self.example is not None:
+            result['example_id'] = self.example
+        return result
+
+# =============================================================================
+# VALIDATION
+# =============================================================================
+def validate_dataset(key, path, manifest_entry=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Profile and check one dataset file in a single streaming pass
+
+    Returns the report entry for the domain: file fingerprint, row count,
+    per-column profiles, check results and a passed/warning/failed status.
+    """
+    schema = SCHEMAS[key]
+    ids, dates = id_column(key), date_column(key)
+    profiles = {column: ColumnProfile(column, column_type) for column, column_type in schema.items()}
+    invariants = [CheckResult(name, expression, severity) for name, expression, severity in INVARIANTS.get(key, [])]
+    not_null = CheckResult('no_nulls', 'every column is set and in its vocabulary', 'error')
+    finite = CheckResult('finite_numbers', 'numeric columns are finite', 'error')
+    increasing = CheckResult('ids_increasing', f'{ids} is unique and increasing', 'error')
+    checks = invariants + [not_null, finite, increasing]
+    in_range = None
+    if manifest_entry:
+        first, last = manifest_entry['first_date'], manifest_entry['last_date']
+        in_range = CheckResult('dates_in_manifest_range', f'{first} <= {dates} <= {last}', 'error')
+        checks.append(in_range)
+        first, last = pd.Timestamp(first), pd.Timestamp(last) + pd.Timedelta(days=1)
+    numeric = [column for column, column_type in schema.items() if _is_numeric(column_type)]
+
+    stat = os.stat(path)
+    start = time.perf_counter()
+    rows, last_id = 0, None
+    for df in iter_file_chunks(path, schema, chunk_size):
+        if df.empty:
+            continue
+        rows += len(df)
+        for column, profile in profiles.items():
+            profile.update(df[column])
+
+        row_ids = df[ids]
+        for check in invariants:
+            check.add(~df.eval(check.check).to_numpy(dtype=bool), row_ids)
+        not_null.add(df.isna().any(axis=1).to_numpy(), row_ids)
+        finite.add(np.isinf(df[numeric].to_numpy(dtype=np.float64)).any(axis=1), row_ids)
+
+        # The number after the last '-' (a vectorized replace, much faster than rsplit);
+        # a malformed ID becomes NaN and counts as a violation
+        numbers = pd.to_numeric(row_ids.str.replace(r'^.*-', '', regex=True), errors='coerce').to_numpy(np.float64)
+        previous = np.r_[last_id if last_id is not None else numbers[0] - 1, numbers[:-1]]
+        increasing.add(~(numbers > previous), row_ids)
+        last_id = numbers[-1]
+
+        if in_range:
+            in_range.add(((df[dates] < first) | (df[dates] >= last)).to_numpy(), row_ids)
+
+    if manifest_entry:
+        rows_match = CheckResult('rows_match_manifest', f"rows == {manifest_entry['rows']}", 'error')
+        rows_match.violations = abs(rows - manifest_entry['rows'])
+        checks.append(rows_match)
+
+    results = [check.summary() for check in checks]
+    failed = {r['severity'] for r in results if not r['passed']}
+    return {
+        'file': os.path.abspath(path),
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'rows': rows,
+        'seconds': round(time.perf_counter() - start, 3),
+        'status': 'failed' if 'error' in failed else 'warning' if failed else 'passed',
+        'columns': {column: profile.summary(rows) for column, profile in profiles.items()},
+        'checks': results,
+    }
+
+def report_status(domains, strict=False):
+    """Overall status; with strict, warnings fail too"""
+    statuses = {entry['status'] for entry in domains.values()}
+    if 'failed' in statuses or (strict and 'warning' in statuses):
+        return 'failed'
+    return 'warning' if 'warning' in statuses else 'passed'
+
+def save_report(path, report):
+    """Write the report atomically"""
+    write_json_atomic(path, report)
+
+# =============================================================================
+# MAIN EXECUTION
+# =============================================================================
+def main(argv=None):
+    parser = validate_parser()
+    args = parser.parse_args(argv)
+
+    base_path = get_base_path()
+    manifest = load_manifest(base_path)
+    report_path = args.report or os.path.join(base_path, REPORT_FILE)
+
+    print("=" * 60)
+    print("Enterprise Intelligence Platform - Data Validation")
+    print("=" * 60)
+
+    domains = {}
+    for key, name, filepath in DATASET_FILES:
+        if args.domains and key not in args.domains:
+            continue
+        path = output_path(os.path.join(base_path, filepath), args.format)
+        if not os.path.exists(path):
+            print(f"  {name}: no {args.format} file, skipping")
+            continue
+        entry = manifest.get(key)
+        # The manifest describes the domain's CSV only, and only while it is unchanged since it was recorded
+        if entry and (args.format != 'csv' or entry['path'] != filepath or not matches_file(entry, path)):
+            entry = None
+        domains[key] = validate_dataset(key, path, entry, args.chunk_size)
+        result = domains[key]
+        print(f"  {name}: {result['rows']:,} rows in {result['seconds']:.2f}s -> {result['status']}")
+        for check in result['checks']:
+            if not check['passed']:
+                example = f" (e.g. {check['example_id']})" if 'example_id' in check else ''
+                print(f"    [{check['severity']}] {check['name']}: {check['violations']:,} rows{example}")
+
+    report = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'format': args.format,
+        'strict': args.strict,
+        'status': report_status(domains, args.strict),
+        'domains': domains,
+    }
+    save_report(report_path, report)
+
+    print("\n" + "=" * 60)
+    print(f"Validation {report['status']}; report saved: {report_path}")
+    print("=" * 60)
+    if report['status'] == 'failed':
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Enterprise Intelligence Platform - Dataset Writers
+Pluggable chunked writers (and matching readers) for CSV, Parquet and Arrow IPC (Feather)
+"""
+
+import os
+import shutil
+
+import pandas as pd
+
+from schemas import apply_schema, arrow_schema, pandas_dtype
+
+def _require_pyarrow():
+    """Import pyarrow, failing with an actionable message when it is missing"""
+    try:
+        import pyarrow
+    except ImportError:
+        raise ImportError("Parquet and Feather output require pyarrow: pip install pyarrow") from None
+    return pyarrow
+
+class CsvWriter:
+    """Write DataFrame chunks to one CSV file with a single header row"""
+    extension = '.csv'
+
+    def __init__(self, path, schema=None, header=True, append=False):
+        self.path = path
+        self.schema = schema
+        self.header = header
+        # Appending continues an existing file, which already has its header
+        self._started = append
+
+    def write(self, df):
+        df.to_csv(self.path, index=False, mode='a' if self._started else 'w',
+                  header=self.header and not self._started)
+        self._started = True
+
+    def append_part(self, part_path):
+        """Append a part file; parts after the first are written with header=False"""
+        with open(self.path, 'ab' if self._started else 'wb') as out, open(part_path, 'rb') as part:
+            shutil.copyfileobj(part, out)
+        self._started = True
+
+    def close(self):
+        if not self._started:
+            open(self.path, 'w').close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class ArrowWriter:
+    """Base class for typed pyarrow writers; chunks are cast to the domain schema"""
+    extension = None
+
+    def __init__(self, path, schema):
+        self.pa = _require_pyarrow()
+        self.path = path
+        self.schema = schema
+        self.arrow_schema = arrow_schema(schema)
+        self._writer = None
+
+    def _open(self):
+        raise NotImplementedError
+
+    def write_table(self, table):
+        raise NotImplementedError
+
+    def write(self, df):
+        table = self.pa.Table.from_pandas(apply_schema(df, self.schema), schema=self.arrow_schema, preserve_index=False)
+        self.write_table(table.replace_schema_metadata(None))
+
+    def append_part(self, part_path):
+        """
+        Append the contents of a part file written by the same writer type
+
+        pyarrow cannot copy encoded pages or compressed batches between
+        files, so parts are decoded and compressed again in this process.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        if self._writer is None:
+            self._writer = self._open()
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+class ParquetWriter(ArrowWriter):
+    """Write chunks as row groups of a single compressed Parquet file"""
+    extension = '.parquet'
+
+    def __init__(self, path, schema, compression='zstd', row_group_size=1_000_000):
+        super().__init__(path, schema)
+        self.compression = compression
+        self.row_group_size = row_group_size
+
+    def _open(self):
+        import pyarrow.parquet as pq
+        return pq.ParquetWriter(self.path, self.arrow_schema, compression=self.compression)
+
+    def write_table(self, table):
+        if self._writer is None:
+            self._writer = self._open()
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+
+    def append_part(self, part_path):
+        import pyarrow.parquet as pq
+        part = pq.ParquetFile(part_path)
+        for i in range(part.num_row_groups):
+            self.write_table(part.read_row_group(i))
+
+class FeatherWriter(ArrowWriter):
+    """Write chunks as record batches of an Arrow IPC (Feather v2) file"""
+    extension = '.feather'
+
+    def __init__(self, path, schema, compression='lz4'):
+        super().__init__(path, schema)
+        self.compression = compression
+
+    def _open(self):
+        options = self.pa.ipc.IpcWriteOptions(compression=self.compression)
+        return self.pa.ipc.new_file(self.path, self.arrow_schema, options=options)
+
+    def write_table(self, table):
+        if self._writer is None:
+            self._writer = self._open()
+        self._writer.write_table(table)
+
+    def append_part(self, part_path):
+        with self.pa.memory_map(part_path) as source:
+            self.write_table(self.pa.ipc.open_file(source).read_all())
+
+WRITERS = {
+    'csv': CsvWriter,
+    'parquet': ParquetWriter,
+    'feather': FeatherWriter,
+}
+
+def output_path(path, fmt):
+    """Swap a dataset path's extension for the one used by fmt"""
+    return os.path.splitext(path)[0] + WRITERS[fmt].extension
+
+def open_writer(fmt, path, schema, **options):
+    """Create a writer for fmt; options are passed to its constructor (e.g. compression, header)"""
+    return WRITERS[fmt](path, schema, **options)
+
+def iter_file_chunks(path, schema, chunk_size=1_000_000, columns=None):
+    """
+    Stream a dataset file back as DataFrames of roughly chunk_size rows
+
+    The format is taken from the extension. CSV columns are parsed with the
+    schema's categorical and date types so every format yields the same dtypes.
+    """
+    columns = list(columns) if columns is not None else None
+    wanted = [c for c in schema if columns is None or c in columns]
+
+    if path.endswith('.csv'):
+        dtypes = {c: pandas_dtype(schema[c]) for c in wanted if isinstance(schema[c], tuple)}
+        dates = [c for c in wanted if schema[c] == 'date']
+        yield from pd.read_csv(path, usecols=wanted, dtype=dtypes, parse_dates=dates, chunksize=chunk_size)
+        return
+
+    pa = _require_pyarrow()
+    if path.endswith('.parquet'):
+        import pyarrow.parquet as pq
+        batches = pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=wanted)
+    elif path.endswith('.feather'):
+        reader = pa.ipc.open_file(pa.memory_map(path))
+        batches = (reader.get_batch(i).select(wanted) for i in range(reader.num_record_batches))
+    else:
+        raise ValueError(f"Unsupported dataset file: {path}")
+    for batch in batches:
+        df = batch.to_pandas()
+        for c in wanted:
+            if schema[c] == 'date':
+                df[c] = pd.to_datetime(df[c])
+        yield df
@@ -0,0 +1,24 @@
+"""
+Make the flat modules in scripts/ importable from the tests, and point them
+at a scratch data folder
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """An empty data folder with every domain's subfolder, used by generate_data/validate_data"""
+    import generate_data
+    import validate_data
+    from datasets import DATASET_FILES
+
+    for _, _, filepath in DATASET_FILES:
+        (tmp_path / filepath).parent.mkdir(parents=True, exist_ok=True)
+    for module in (generate_data, validate_data):
+        monkeypatch.setattr(module, 'get_base_path', lambda: str(tmp_path))
+    return tmp_path
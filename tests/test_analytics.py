@@ -0,0 +1,36 @@
+"""
+Tests for batched anomaly detection in analytics
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analytics import FREQUENCIES, analyze, t_tail
+
+def noise_frame(frequency, n_periods, n_series=1000, seed=1):
+    """Gaussian noise series shaped like build_series output"""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range('2020-01-01', periods=n_periods, freq='D' if frequency == 'daily' else 'MS')
+    columns = pd.MultiIndex.from_arrays([np.arange(n_series)], names=['group'])
+    return pd.DataFrame(rng.normal(100, 10, (n_periods, n_series)), index=index, columns=columns)
+
+def test_t_tail_matches_known_values():
+    np.testing.assert_allclose(t_tail([1.0, 2.0, 2.5706, 2.7707], [1, 2, 5, 27]),
+                               [0.5, 0.1835, 0.05, 0.01], atol=1e-4)
+    assert t_tail(3.0, 1001) == pytest.approx(math.erfc(3 / math.sqrt(2)), rel=0.05)
+
+@pytest.mark.parametrize('frequency, n_periods', [('monthly', 36), ('daily', 730)])
+def test_false_positive_rate_on_noise_is_near_three_sigma(frequency, n_periods):
+    result = analyze(noise_frame(frequency, n_periods), FREQUENCIES[frequency])
+    history = result.loc[result['is_forecast'] == 0]
+    # Two tests at 0.27% each, so at most ~0.54% even if their flags never overlapped
+    assert history['is_anomaly'].mean() < 0.006
+
+def test_spike_is_flagged():
+    frame = noise_frame('monthly', 36, n_series=1)
+    frame.iloc[30, 0] += 100
+    result = analyze(frame, FREQUENCIES['monthly'])
+    assert result.loc[result['date'] == frame.index[30], 'is_anomaly'].item() == 1
@@ -0,0 +1,24 @@
+"""
+Tests for star-schema fact tables
+"""
+
+import pandas as pd
+import pytest
+
+from dimensions import FACT_KEYS, build_dimensions, to_star
+from generate_data import END_DATE, HR_START_DATE, generate_chunk
+
+@pytest.mark.parametrize('key', sorted(FACT_KEYS))
+def test_fact_keys_join_back_to_the_raw_columns(key):
+    raw = generate_chunk(key, 1, 500)
+    fact = to_star(key, raw)
+    dimensions = build_dimensions((HR_START_DATE, END_DATE), seed=42)
+
+    for key_column, dimension, sources in FACT_KEYS[key]:
+        assert not set(sources) & set(fact.columns)
+        members = dimensions[dimension].set_index(f'{dimension}_key').loc[fact[key_column].to_numpy()]
+        for source in sources:
+            if dimension == 'date':
+                assert (members['date'].to_numpy() == pd.to_datetime(raw[source]).to_numpy()).all()
+            else:
+                assert list(members[source].astype(str)) == list(raw[source].astype(str)), (key, source)
@@ -0,0 +1,40 @@
+"""
+Tests for rolling velocity features in fraud_scoring
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from fraud_scoring import VelocityIndex
+
+def transactions():
+    """A few customers with gaps both inside and well beyond the 24h window"""
+    return pd.DataFrame({
+        'customer_id': ['C', 'D', 'C', 'C', 'D', 'E', 'C', 'D'],
+        'timestamp': pd.to_datetime(['2024-01-01 00:00', '2024-01-05 00:00', '2024-01-06 00:00',
+                                     '2024-01-06 06:30', '2024-01-06 07:00', '2024-01-06 08:00',
+                                     '2024-01-07 01:00', '2024-01-09 12:00']),
+    })
+
+def run_batches(df, splits):
+    """Velocity and minutes for df fed through one VelocityIndex in batches cut at splits"""
+    index = VelocityIndex()
+    bounds = [0, *splits, len(df)]
+    results = [index.update(df.iloc[start:end]) for start, end in zip(bounds, bounds[1:])]
+    return np.concatenate([r[0] for r in results]), np.concatenate([r[1] for r in results])
+
+def test_gap_beyond_window_survives_batch_split():
+    df = transactions().iloc[:3]
+    for splits in ([], [2]):
+        _, minutes = run_batches(df, splits)
+        assert np.isnan(minutes[0]) and np.isnan(minutes[1])
+        assert minutes[2] == 7200.0
+
+@pytest.mark.parametrize('splits', [[1], [2], [3, 6], [1, 2, 3, 4, 5, 6, 7]])
+def test_split_batches_match_one_batch(splits):
+    df = transactions()
+    velocity, minutes = run_batches(df, [])
+    split_velocity, split_minutes = run_batches(df, splits)
+    np.testing.assert_array_equal(split_velocity, velocity)
+    np.testing.assert_array_equal(split_minutes, minutes)
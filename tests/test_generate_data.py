@@ -0,0 +1,73 @@
+"""
+Tests for chunked data generation
+"""
+
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from generate_data import format_ids, iter_chunks, main, plan_job, sequential_ids
+from manifest import load_manifest, matches_file
+
+def test_ids_pad_each_number_on_its_own():
+    assert list(sequential_ids('TXN-', 3, 6, 999998)) == ['TXN-999998', 'TXN-999999', 'TXN-1000000']
+    assert list(sequential_ids('TXN-', 1, 6, 999998)) == ['TXN-999998']
+    numbers = [0, 7, 999_999, 1_000_000, 123_456_789]
+    assert list(format_ids('ID-', numbers, 6)) == [f'ID-{n:06d}' for n in numbers]
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 25])
+def test_ids_across_a_power_of_ten_do_not_depend_on_chunk_size(chunk_size):
+    # IDs 999,990 .. 1,000,014 cross from six to seven digits
+    whole = pd.concat(iter_chunks('sales', 25, 25, first_id=999_990), ignore_index=True)
+    chunked = pd.concat(iter_chunks('sales', 25, chunk_size, first_id=999_990), ignore_index=True)
+    expected = [f'TXN-{n:06d}' for n in range(999_990, 1_000_015)]
+    assert list(whole['transaction_id']) == expected
+    assert list(chunked['transaction_id']) == expected
+
+def read_sales(data_dir):
+    return pd.read_csv(data_dir / 'sales' / 'sales_data.csv', parse_dates=['date'])
+
+def test_incremental_run_continues_ids_and_dates(data_dir):
+    main(['--domains', 'sales', '--records', '200', '--chunk-size', '64'])
+    before = read_sales(data_dir)
+    last_date = before['date'].max()
+
+    main(['--domains', 'sales', '--incremental', '--records', '50', '--chunk-size', '16'])
+    after = read_sales(data_dir)
+
+    pd.testing.assert_frame_equal(after.iloc[:200], before)
+    added = after.iloc[200:]
+    assert list(added['transaction_id']) == [f'TXN-{n:06d}' for n in range(201, 251)]
+    assert (added['date'] == last_date + timedelta(days=1)).all()
+    entry = load_manifest(str(data_dir))['sales']
+    assert (entry['rows'], entry['last_id']) == (250, 250)
+    assert entry['last_date'] == (last_date + timedelta(days=1)).strftime('%Y-%m-%d')
+    assert matches_file(entry, str(data_dir / 'sales' / 'sales_data.csv'))
+
+def test_incremental_keeps_the_rows_per_day_rate(data_dir):
+    main(['--domains', 'sales', '--records', '3000', '--start-date', '2024-01-01', '--end-date', '2024-01-30'])
+    path = str(data_dir / 'sales' / 'sales_data.csv')
+
+    first_id, n_records, window, state = plan_job('sales', path, load_manifest(str(data_dir)),
+                                                  end_date=datetime(2024, 2, 9), incremental=True)
+
+    assert (first_id, n_records, state['rows']) == (3001, 1000, 3000)
+    assert window == (datetime(2024, 1, 31), datetime(2024, 2, 9))
+    assert plan_job('sales', path, load_manifest(str(data_dir)), end_date=datetime(2024, 1, 15),
+                    incremental=True) is None
+
+def test_incremental_rescans_a_csv_changed_since_the_manifest(data_dir):
+    main(['--domains', 'sales', '--records', '200'])
+    path = data_dir / 'sales' / 'sales_data.csv'
+    # Cut the file back to 120 rows, as a crash mid-append or another tool might
+    lines = path.read_text().splitlines(keepends=True)
+    path.write_text(''.join(lines[:121]))
+
+    main(['--domains', 'sales', '--incremental', '--records', '10'])
+
+    df = read_sales(data_dir)
+    assert len(df) == 130
+    assert list(df['transaction_id'].iloc[120:]) == [f'TXN-{n:06d}' for n in range(121, 131)]
+    assert (df['date'].iloc[120:] == df['date'].iloc[:120].max() + timedelta(days=1)).all()
+    assert load_manifest(str(data_dir))['sales']['rows'] == 130
@@ -0,0 +1,73 @@
+"""
+Tests for batch publishing against the mock Tableau server
+"""
+
+import json
+
+import pytest
+
+from mock_tableau_server import start_mock_server
+from publish_to_tableau import main, publish_batch, publish_to_tableau
+
+@pytest.fixture
+def mock_server():
+    """Mock server failing every 3rd publish with a 503; yields (url, state)"""
+    server, url = start_mock_server(fail_every=3)
+    yield url, server.RequestHandlerClass.state
+    server.shutdown()
+
+def write_items(folder, n):
+    """n small data source files as manifest items"""
+    items = []
+    for i in range(n):
+        path = folder / f'source_{i}.hyper'
+        path.write_bytes(b'x' * 1024)
+        items.append({'type': 'datasource', 'path': str(path), 'name': f'Source {i}',
+                      'project': 'Enterprise Intelligence', 'mode': 'Overwrite'})
+    return items
+
+def test_batch_signs_in_once_and_retries_transient_failures(mock_server, tmp_path):
+    url, state = mock_server
+    items = write_items(tmp_path, 6)
+
+    results = publish_batch(url, 'token', 'secret', '', items, workers=3, retries=3, backoff=0.01)
+
+    assert state.signins == 1
+    assert [r['status'] for r in results] == ['published'] * len(items)
+    assert any(r['attempts'] > 1 for r in results)
+    assert sorted(item['name'] for item in state.content['datasource'].values()) == \
+        sorted(item['name'] for item in items)
+
+def test_main_exits_non_zero_when_an_item_fails(mock_server, tmp_path):
+    url, state = mock_server
+    items = write_items(tmp_path, 2)
+    items.append({'type': 'datasource', 'path': 'missing.hyper', 'name': 'Missing'})
+    manifest = tmp_path / 'manifest.json'
+    manifest.write_text(json.dumps({'project': 'Enterprise Intelligence', 'items': items}))
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(['--server', url, '--token-name', 'token', '--token-value', 'secret',
+              '--manifest', str(manifest), '--retries', '3', '--backoff', '0.01'])
+
+    assert exit_info.value.code != 0
+    assert state.signins == 1
+    assert len(state.content['datasource']) == 2
+
+def test_single_workbook_finds_a_project_past_the_first_page(tmp_path):
+    server, url = start_mock_server()
+    state = server.RequestHandlerClass.state
+    # 'default' plus 150 projects: 'Zeta' sorts onto the second page of 100
+    for i in range(149):
+        state.projects[f'p{i}'] = f'Project {i:03d}'
+    state.projects['zeta'] = 'Zeta'
+    workbook = tmp_path / 'sales.twbx'
+    workbook.write_bytes(b'x' * 1024)
+
+    try:
+        publish_to_tableau(url, 'token', 'secret', '', 'Zeta', str(workbook))
+    finally:
+        server.shutdown()
+
+    assert list(state.projects.values()).count('Zeta') == 1
+    [published] = state.content['workbook'].values()
+    assert published['project_id'] == 'zeta'
@@ -0,0 +1,58 @@
+"""
+Tests for dataset validation and the publishing gate built on its report
+"""
+
+import json
+
+import pytest
+
+from generate_data import main as generate
+from manifest import load_manifest
+from publish_to_tableau import validation_problems
+from validate_data import main, validate_dataset
+
+def checks_by_name(result):
+    return {check['name']: check for check in result['checks']}
+
+@pytest.fixture
+def sales(data_dir):
+    """Path of a freshly generated 500-row sales CSV"""
+    generate(['--domains', 'sales', '--records', '500'])
+    return data_dir / 'sales' / 'sales_data.csv'
+
+def test_generated_data_passes_with_its_manifest(data_dir, sales):
+    result = validate_dataset('sales', str(sales), load_manifest(str(data_dir))['sales'], chunk_size=128)
+
+    assert result['status'] == 'passed'
+    assert result['rows'] == 500
+    assert {'dates_in_manifest_range', 'rows_match_manifest'} <= set(checks_by_name(result))
+
+def test_out_of_order_ids_and_row_count_fail(data_dir, sales):
+    lines = sales.read_text().splitlines(keepends=True)
+    # Swap rows 300 and 301 across a chunk boundary, then drop the last row
+    lines[300], lines[301] = lines[301], lines[300]
+    sales.write_text(''.join(lines[:-1]))
+
+    result = validate_dataset('sales', str(sales), load_manifest(str(data_dir))['sales'], chunk_size=300)
+
+    checks = checks_by_name(result)
+    assert result['status'] == 'failed'
+    assert checks['ids_increasing']['violations'] == 1
+    assert checks['ids_increasing']['example_id'] == 'TXN-000300'
+    assert checks['rows_match_manifest']['violations'] == 1
+
+def test_report_gates_publishing(data_dir, sales):
+    report = data_dir / 'report.json'
+    main(['--domains', 'sales', '--report', str(report)])
+
+    assert validation_problems(str(report)) == {}
+    assert validation_problems(str(report), ['sales', 'hr']) == {'hr': 'not in the validation report'}
+
+    with open(sales, 'a') as f:
+        f.write(sales.read_text().splitlines(keepends=True)[-1])
+    assert validation_problems(str(report)) == {'sales': 'sales_data.csv changed since validation'}
+
+    with pytest.raises(SystemExit):
+        main(['--domains', 'sales', '--report', str(report)])
+    assert json.loads(report.read_text())['status'] == 'failed'
+    assert validation_problems(str(report))['sales'].startswith('failed ')